@@ -1,5 +1,21 @@
+import time
+
+_START = time.perf_counter()
+
+
 def main():
 
+    import sys
+    if getattr(sys, 'frozen', False):
+        # Nécessaire au pool de processus du validateur dans l'exécutable Windows
+        import multiprocessing
+        multiprocessing.freeze_support()
+    from cli import is_cli_invocation
+    # Mode ligne de commande (check|list|update|install|validate|fleet) : tkinter n'est jamais importé
+    if is_cli_invocation(sys.argv):
+        from cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+
     import os
     import tkinter as tk
     from i18n import setup as i18n_setup
@@ -12,8 +28,16 @@ def main():
     # Imports APRÈS la configuration de la traduction
     from gui.main_window import MainWindow
     from core.config import Config
+    imports_ms = (time.perf_counter() - _START) * 1000
 
     config = Config.load()
+    if config.language:
+        # Langue choisie dans l'interface : prioritaire sur celle d'Inkscape
+        from i18n import set_language
+        set_language(config.language)
+    from core import profiling
+    if config.profiling:
+        profiling.enable()
     root = tk.Tk()
     min_w, min_h = 600, 580
     ws = root.winfo_screenwidth()
@@ -22,8 +46,27 @@ def main():
     y = (hs // 2) - (min_h // 2)
     root.geometry(f"{min_w}x{min_h}+{x}+{y}")
     root.resizable(False, False)
-    _app = MainWindow(root, config)
+    # MAJ_STARTUP_PROBE=1 : affiche les temps de démarrage en JSON dès le premier affichage
+    # puis quitte, sans scan ni accès réseau (voir tools/measure_startup.py)
+    probe = bool(os.environ.get('MAJ_STARTUP_PROBE'))
+    with profiling.action('startup'):
+        _app = MainWindow(root, config, scan_on_start=not probe)
+    if probe:
+        def report_first_paint() -> None:
+            root.wait_visibility(root)
+            root.update_idletasks()
+            import json
+            print(json.dumps({
+                'imports_ms': round(imports_ms, 1),
+                'first_paint_ms': round((time.perf_counter() - _START) * 1000, 1),
+            }), flush=True)
+            root.destroy()
+        root.after(0, report_first_paint)
     root.mainloop()
+    # Laisser se terminer la tâche de fond en cours (installation, copie) avant de quitter
+    _app.tasks.shutdown(wait=True)
+    # Écrire tout de suite une modification de configuration encore en attente
+    config.flush()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,289 @@
+"""Mode ligne de commande de Maj, sans Tk.
+
+    python Maj.py check   [--json] [--cached]
+    python Maj.py list    [--json] [--cached] [--catalog]
+    python Maj.py update  [NOM ...] [--all] [--dry-run] [--json]
+    python Maj.py install NOM ... [--dry-run] [--json]
+    python Maj.py validate [--json] [--no-cache]
+    python Maj.py fleet   --profile NOM=DOSSIER ... [--profiles-file F] [--update | --install NOM ...] [--dry-run] [--json]
+
+Les modules du cœur ne sont importés qu'à l'intérieur des commandes : tkinter n'est
+jamais chargé, et ssl/urllib seulement si la commande accède au réseau.
+"""
+import json
+import sys
+import time
+from typing import Any
+
+_START = time.perf_counter()
+
+COMMANDS = ('check', 'list', 'update', 'install', 'validate', 'fleet')
+
+# Codes de retour
+EXIT_OK = 0            # rien à faire / opération réussie
+EXIT_ERROR = 1         # au moins une opération a échoué
+EXIT_USAGE = 2         # arguments invalides
+EXIT_UPDATES = 10      # check : des mises à jour sont disponibles
+
+
+def is_cli_invocation(argv: list[str]) -> bool:
+    """Vrai si le premier argument est une commande (Inkscape passe d'autres arguments au script)."""
+    return len(argv) > 1 and argv[1] in COMMANDS
+
+
+class _Report:
+    """Accumule le journal des opérations et produit la sortie texte ou JSON."""
+
+    def __init__(self, as_json: bool) -> None:
+        self.as_json = as_json
+        self.events: list[dict[str, Any]] = []
+
+    def on_event(self, event: Any) -> None:
+        from core.events import PROGRESS
+        if event.kind == PROGRESS:
+            # Seul le bilan de chaque phase est gardé (durée, débit) ; rien n'est affiché en texte
+            if self.as_json and event.data.get('finished'):
+                self.events.append(event.to_dict())
+            return
+        if self.as_json:
+            self.events.append(event.to_dict())
+        else:
+            stream = sys.stderr if event.erreur else sys.stdout
+            print(event.message.rstrip('\n'), file=stream)
+
+    def finish(self, command: str, exit_code: int, **payload: Any) -> int:
+        if self.as_json:
+            result = {
+                'command': command,
+                'exit_code': exit_code,
+                'elapsed_ms': round((time.perf_counter() - _START) * 1000, 1),
+                **payload,
+                'log': self.events,
+            }
+            json.dump(result, sys.stdout, indent=2, ensure_ascii=False)
+            sys.stdout.write('\n')
+        return exit_code
+
+
+def _build_parser() -> Any:
+    import argparse
+    from i18n import _
+    parser = argparse.ArgumentParser(prog='Maj.py', description=_("Gestionnaire d'extensions Inkscape (mode ligne de commande)"))
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_check = sub.add_parser('check', help=_("vérifie les mises à jour (code 10 si disponibles)"))
+    p_list = sub.add_parser('list', help=_("liste les extensions installées"))
+    p_list.add_argument('--catalog', action='store_true', help=_("liste le catalogue des extensions installables"))
+    p_update = sub.add_parser('update', help=_("met à jour des extensions installées"))
+    p_update.add_argument('names', nargs='*', help=_("noms des extensions"))
+    p_update.add_argument('--all', action='store_true', help=_("met à jour toutes les extensions obsolètes"))
+    p_install = sub.add_parser('install', help=_("installe des extensions du catalogue"))
+    p_install.add_argument('names', nargs='+', help=_("noms des extensions"))
+    p_validate = sub.add_parser('validate', help=_("valide les extensions installées (Info.json, .inx, Python)"))
+    p_validate.add_argument('--no-cache', action='store_true', help=_("revalide toutes les extensions, même inchangées"))
+    p_fleet = sub.add_parser('fleet', help=_("vérifie ou met à jour plusieurs profils avec un cache de téléchargement commun"))
+    p_fleet.add_argument('--profile', action='append', default=[], metavar='NOM=DOSSIER', help=_("dossier d'extensions d'un profil (répétable)"))
+    p_fleet.add_argument('--profiles-file', help=_("fichier listant les profils (une ligne NOM=DOSSIER, ou liste JSON)"))
+    p_fleet.add_argument('--update', action='store_true', help=_("met à jour les extensions obsolètes de chaque profil"))
+    p_fleet.add_argument('--install', nargs='+', metavar='NOM', help=_("installe ces extensions du catalogue dans chaque profil"))
+    p_fleet.add_argument('--workers', type=int, default=8, help=_("nombre de profils/dépôts traités en parallèle"))
+
+    for p in (p_check, p_list, p_update, p_install, p_validate, p_fleet):
+        p.add_argument('--json', action='store_true', help=_("sortie JSON sur stdout"))
+    for p in (p_check, p_list):
+        p.add_argument('--cached', action='store_true', help=_("utilise le dernier scan/catalogue enregistré au lieu de rescanner"))
+    for p in (p_update, p_install, p_fleet):
+        p.add_argument('--dry-run', action='store_true', help=_("calcule le plan sans rien écrire"))
+    return parser
+
+
+_config: Any = None
+
+
+def _setup() -> Any:
+    """Traduction et configuration, une seule fois par processus ; retourne la configuration."""
+    global _config
+    if _config is not None:
+        return _config
+    import os
+    from i18n import setup as i18n_setup
+    i18n_setup(os.path.join(os.path.dirname(__file__), 'locale'))
+    from core.config import Config
+    config = Config.load()
+    if config.language:
+        # Même langue que l'interface graphique si elle y a été choisie
+        from i18n import set_language
+        set_language(config.language)
+    if config.profiling:
+        from core import profiling
+        profiling.enable()
+    _config = config
+    return config
+
+
+def _cmd_list(args: Any, report: _Report) -> int:
+    config = _setup()
+    if args.catalog:
+        from core.repo_manager import RepoManager
+        repo_manager = RepoManager(config, on_event=report.on_event)
+        catalog = repo_manager.load_catalog() if args.cached else repo_manager.list_extensions()
+        if not report.as_json:
+            for repo_url, exts in catalog.items():
+                print(repo_url)
+                for ext in exts:
+                    print(f"  {ext.get('name', '?')} ({ext.get('version', '?')})")
+        return report.finish('list', EXIT_OK, catalog=catalog)
+
+    from core.installer import Installer
+    installer = Installer(config, on_event=report.on_event)
+    installed = installer.load_installed() if args.cached else installer.scan_installed()
+    if not report.as_json:
+        for ext in installed:
+            print(f"{ext.get('name', '?')} ({ext.get('version', '?')})")
+    return report.finish('list', EXIT_OK, installed=installed)
+
+
+def _cmd_check(args: Any, report: _Report) -> int:
+    config = _setup()
+    from core.installer import Installer
+    from core.updater import Updater
+    installer = Installer(config, on_event=report.on_event)
+    installed = installer.load_installed() if args.cached else installer.scan_installed()
+    outdated = Updater(config, on_event=report.on_event, installer=installer).check_updates(installed)
+    if not report.as_json:
+        for ext in outdated:
+            print(f"{ext.get('name', '?')}: {ext.get('local_version')} -> {ext.get('online_version')}")
+    code = EXIT_UPDATES if outdated else EXIT_OK
+    return report.finish('check', code, installed_count=len(installed), updates=outdated)
+
+
+def _cmd_update(args: Any, report: _Report) -> int:
+    config = _setup()
+    from i18n import _
+    from core.installer import Installer
+    from core.updater import Updater
+    installer = Installer(config, on_event=report.on_event)
+    updater = Updater(config, on_event=report.on_event, installer=installer)
+    installed = installer.scan_installed()
+    if args.all:
+        from core.update_checks import extension_key
+        outdated_keys = {extension_key(ext) for ext in updater.check_updates(installed)}
+        targets = [ext for ext in installed if extension_key(ext) in outdated_keys]
+    elif args.names:
+        targets = [ext for ext in installed if ext.get('name') in args.names]
+        unknown = set(args.names) - {ext.get('name') for ext in targets}
+        if unknown:
+            print(_("Extensions inconnues : {names}").format(names=', '.join(sorted(unknown))), file=sys.stderr)
+            return report.finish('update', EXIT_USAGE, unknown=sorted(unknown))
+    else:
+        message = _("Indiquez des noms d'extensions ou --all.")
+        print(message, file=sys.stderr)
+        return report.finish('update', EXIT_USAGE, error=message)
+
+    results: list[dict[str, Any]] = []
+    for ext in targets:
+        ok = updater.update(ext, dry_run=args.dry_run)
+        plan = installer.last_plan.to_dict() if args.dry_run and ok and installer.last_plan else None
+        results.append({'name': ext.get('name'), 'ok': ok, 'plan': plan})
+    if results and not args.dry_run:
+        installer.scan_installed()
+    code = EXIT_OK if all(r['ok'] for r in results) else EXIT_ERROR
+    return report.finish('update', code, dry_run=args.dry_run, results=results)
+
+
+def _cmd_install(args: Any, report: _Report) -> int:
+    config = _setup()
+    from i18n import _
+    from core.installer import Installer
+    from core.repo_manager import RepoManager
+    installer = Installer(config, on_event=report.on_event)
+    catalog = RepoManager(config, on_event=report.on_event).list_extensions()
+    by_name = {ext.get('name'): ext for exts in catalog.values() for ext in exts}
+    unknown = [name for name in args.names if name not in by_name]
+    if unknown:
+        print(_("Extensions absentes du catalogue : {names}").format(names=', '.join(unknown)), file=sys.stderr)
+        return report.finish('install', EXIT_USAGE, unknown=unknown)
+
+    results: list[dict[str, Any]] = []
+    for name in args.names:
+        ok = installer.install(by_name[name], dry_run=args.dry_run)
+        plan = installer.last_plan.to_dict() if args.dry_run and ok and installer.last_plan else None
+        results.append({'name': name, 'ok': ok, 'plan': plan})
+    if not args.dry_run:
+        installer.scan_installed()
+    code = EXIT_OK if all(r['ok'] for r in results) else EXIT_ERROR
+    return report.finish('install', code, dry_run=args.dry_run, results=results)
+
+
+def _cmd_validate(args: Any, report: _Report) -> int:
+    config = _setup()
+    from core.installer import Installer
+    from core.validator import Validator
+    installer = Installer(config, on_event=report.on_event)
+    installed = installer.scan_installed()
+    result = Validator(on_event=report.on_event).report(installed, use_cache=not args.no_cache)
+    code = EXIT_ERROR if result.invalid() else EXIT_OK
+    return report.finish('validate', code, **result.to_dict())
+
+
+def _cmd_fleet(args: Any, report: _Report) -> int:
+    config = _setup()
+    from i18n import _
+    from core.fleet import Fleet, load_profiles_file, parse_profile_specs
+    specs = list(args.profile)
+    if args.profiles_file:
+        specs += load_profiles_file(args.profiles_file)
+    if not specs:
+        message = _("Indiquez au moins un profil (--profile ou --profiles-file).")
+        print(message, file=sys.stderr)
+        return report.finish('fleet', EXIT_USAGE, error=message)
+    try:
+        profiles = parse_profile_specs(specs)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return report.finish('fleet', EXIT_USAGE, error=str(e))
+    fleet = Fleet(config, profiles, on_event=report.on_event, max_workers=args.workers)
+    fleet.scan()
+    if args.install:
+        from core.repo_manager import RepoManager
+        catalog = RepoManager(config, on_event=report.on_event).list_extensions()
+        by_name = {ext.get('name'): ext for exts in catalog.values() for ext in exts}
+        unknown = [name for name in args.install if name not in by_name]
+        if unknown:
+            print(_("Extensions absentes du catalogue : {names}").format(names=', '.join(unknown)), file=sys.stderr)
+            return report.finish('fleet', EXIT_USAGE, unknown=unknown)
+        fleet.catalog = catalog
+        fleet.install_all([by_name[name] for name in args.install], dry_run=args.dry_run)
+    else:
+        fleet.check()
+        if args.update:
+            fleet.update_all(dry_run=args.dry_run)
+    if not report.as_json:
+        print(fleet.report_text())
+    result = fleet.report()
+    profiles = result['profiles']
+    if any(p['failed'] or p['errors'] for p in profiles):
+        code = EXIT_ERROR
+    elif not args.update and not args.install and any(p['outdated'] for p in profiles):
+        code = EXIT_UPDATES
+    else:
+        code = EXIT_OK
+    return report.finish('fleet', code, dry_run=args.dry_run, **result)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Point d'entrée de la ligne de commande ; retourne le code de sortie."""
+    # Configuration lue avant l'analyse des arguments : l'aide suit la langue choisie, et la
+    # clé cachée « profiling » s'applique à toute la commande
+    _setup()
+    from i18n import _
+    args = _build_parser().parse_args(argv)
+    report = _Report(args.json)
+    handlers = {'check': _cmd_check, 'list': _cmd_list, 'update': _cmd_update, 'install': _cmd_install, 'validate': _cmd_validate, 'fleet': _cmd_fleet}
+    try:
+        from core import profiling
+        with profiling.action(f"cli {args.command}"):
+            return handlers[args.command](args, report)
+    except Exception as e:
+        print(_("Erreur : {e}").format(e=e), file=sys.stderr)
+        return report.finish(args.command, EXIT_ERROR, error=str(e))
@@ -0,0 +1,58 @@
+"""Catalogue des extensions installables en mémoire, indexé par dépôt et par sujet."""
+from typing import Any
+
+# Valeur des listes déroulantes signifiant « pas de filtre »
+ALL = "Tous"
+
+ExtensionsByRepo = dict[str, list[dict[str, Any]]]
+
+
+def _subjects_of(ext: dict[str, Any]) -> list[str]:
+    subj: Any = ext.get('subject')
+    if isinstance(subj, list):
+        return [str(s) for s in subj]  # type: ignore[union-attr]
+    return [str(subj)] if subj else []
+
+
+class Catalog:
+    """Extensions par dépôt, avec un index par sujet et des filtres mémorisés.
+
+    L'index et les résultats de `filter()` sont recalculés seulement quand le
+    catalogue change (`update()`), jamais lors d'un simple changement de filtre.
+    """
+
+    def __init__(self, extensions_by_repo: ExtensionsByRepo | None = None) -> None:
+        self.by_repo: ExtensionsByRepo = {}
+        self._by_subject: dict[str, ExtensionsByRepo] = {}
+        self._memo: dict[tuple[str | None, str | None], ExtensionsByRepo] = {}
+        self.update(extensions_by_repo or {})
+
+    def update(self, extensions_by_repo: ExtensionsByRepo) -> None:
+        """Remplace le contenu du catalogue et reconstruit l'index."""
+        self.by_repo = extensions_by_repo
+        self._by_subject = {}
+        for repo, exts in extensions_by_repo.items():
+            for ext in exts:
+                for subject in _subjects_of(ext):
+                    self._by_subject.setdefault(subject, {}).setdefault(repo, []).append(ext)
+        self._memo = {}
+
+    def repos(self) -> list[str]:
+        return list(self.by_repo)
+
+    def subjects(self) -> list[str]:
+        return sorted(self._by_subject)
+
+    def filter(self, repo: str | None = None, subject: str | None = None) -> ExtensionsByRepo:
+        """Extensions du dépôt et du sujet choisis (« Tous » ou None : pas de filtre)."""
+        repo = None if not repo or repo == ALL else repo
+        subject = None if not subject or subject == ALL else subject
+        key = (repo, subject)
+        if key not in self._memo:
+            source = self.by_repo if subject is None else self._by_subject.get(subject, {})
+            if repo is None:
+                result = source
+            else:
+                result = {repo: source[repo]} if source.get(repo) else {}
+            self._memo[key] = result
+        return self._memo[key]
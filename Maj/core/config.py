@@ -1,16 +1,25 @@
 """
 Gestion de la configuration globale du gestionnaire d’extensions.
+
+`Config` est la seule source de la configuration en mémoire : config.json est lu une
+fois au lancement, et les modifications sont écrites de façon différée (`schedule_save`)
+et atomique (fichier temporaire puis os.replace).
 """
+import atexit
 import json
 import os
+import threading
 from typing import Any
 from i18n import _
+from core import paths
 
 CONFIG_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'config.json')
+# Délai de regroupement des écritures (plusieurs modifications rapprochées = une écriture)
+SAVE_DELAY = 0.5
 
 
 class Config:
-    def __init__(self, repos: list[str] | None = None, update_frequency: int = 7, colors: dict[str, str] | None = None, subjects: list[str] | None = None, show_only_updates: bool = True, format_text: dict[str, Any] | None = None) -> None:
+    def __init__(self, repos: list[str] | None = None, update_frequency: int = 7, colors: dict[str, str] | None = None, subjects: list[str] | None = None, show_only_updates: bool = True, format_text: dict[str, Any] | None = None, language: str | None = None, profiling: bool = False) -> None:
         # Charger repos.json
         repos_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'repos.json')
         with open(repos_path, 'r', encoding='utf-8') as f:
@@ -23,6 +32,15 @@ class Config:
         self.subjects: list[str] = subjects or []
         self.show_only_updates: bool = show_only_updates
         self.format_text: dict[str, Any] = format_text or {}
+        # Langue choisie dans l'interface (None : celle d'Inkscape ou du système)
+        self.language: str | None = language
+        # Clé cachée (absente de l'interface) : profilage des actions, voir core.profiling
+        self.profiling: bool = profiling
+
+        self._save_lock = threading.Lock()
+        self._save_timer: threading.Timer | None = None
+        self._dirty = False
+        self._atexit_registered = False
 
 
     @classmethod
@@ -36,23 +54,38 @@ class Config:
             update_frequency = params.get('update_frequency', 7)
             subjects = params.get('subjects', [])
             show_only_updates = params.get('show_only_updates', True)
+            language = params.get('language')
+            profiling = bool(params.get('profiling', False))
             colors = template.get('colors', {})
             format_text = template.get('format_text', {})
-            return cls(repos=repos, update_frequency=update_frequency, colors=colors, subjects=subjects, show_only_updates=show_only_updates, format_text=format_text)
-        except Exception:
+            return cls(repos=repos, update_frequency=update_frequency, colors=colors, subjects=subjects, show_only_updates=show_only_updates, format_text=format_text, language=language, profiling=profiling)
+        except FileNotFoundError:
+            return cls()
+        except OSError:
+            # Fichier inaccessible (droits, dossier…) : valeurs par défaut, le fichier est laissé tel quel
+            return cls()
+        except (ValueError, KeyError, IndexError, AttributeError):
+            # Fichier illisible : mis de côté plutôt qu'écrasé par les valeurs par défaut
+            try:
+                os.replace(CONFIG_FILE, CONFIG_FILE + '.bad')
+            except OSError:
+                pass
             return cls()
 
-    def save(self) -> None:
-        # Sauvegarde au format imbriqué (Params/Template)
-        data = {
-            'Params': [
-                {
-                    'repos': self.repos,
-                    'update_frequency': self.update_frequency,
-                    'subjects': self.subjects,
-                    'show_only_updates': self.show_only_updates
-                }
-            ],
+    def to_dict(self) -> dict[str, Any]:
+        # Format imbriqué (Params/Template)
+        params: dict[str, Any] = {
+            'repos': self.repos,
+            'update_frequency': self.update_frequency,
+            'subjects': self.subjects,
+            'show_only_updates': self.show_only_updates,
+            'language': self.language
+        }
+        if self.profiling:
+            # Clé cachée : écrite seulement si elle a été ajoutée à la main
+            params['profiling'] = True
+        return {
+            'Params': [params],
             'Template': [
                 {
                     'colors': self.colors,
@@ -60,5 +93,34 @@ class Config:
                 }
             ]
         }
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+
+    def save(self) -> None:
+        """Écrit config.json tout de suite (écriture atomique)."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._dirty = False
+            paths.write_json_atomic(CONFIG_FILE, self.to_dict())
+
+    def schedule_save(self, delay: float = SAVE_DELAY) -> None:
+        """Demande une écriture de config.json dans `delay` secondes ; chaque nouvelle demande
+        repousse l'échéance. Les modifications en attente sont écrites au plus tard à la sortie."""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+            if not self._atexit_registered:
+                atexit.register(self.flush)
+                self._atexit_registered = True
+
+    def flush(self) -> None:
+        """Écrit les modifications en attente, s'il y en a."""
+        if self._dirty:
+            try:
+                self.save()
+            except OSError as e:
+                print(_("[Maj] Erreur écriture config.json : {e}").format(e=e))
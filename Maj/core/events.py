@@ -0,0 +1,40 @@
+"""Événements émis par le cœur (journal, fin d'opération) vers l'interface ou la ligne de commande."""
+from typing import Any, Callable
+
+LOG = 'log'
+SUCCESS = 'success'
+# Avancement d'une opération longue ; data : voir core.progress.Progress.to_dict
+PROGRESS = 'progress'
+
+
+class Event:
+    """Événement du cœur ; `data` porte les informations propres à chaque type."""
+    __slots__ = ('kind', 'message', 'erreur', 'gras_part', 'data')
+
+    def __init__(self, kind: str, message: str = '', erreur: bool = False, gras_part: str | None = None, **data: Any) -> None:
+        self.kind = kind
+        self.message = message
+        self.erreur = erreur
+        self.gras_part = gras_part
+        self.data = data
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'kind': self.kind, 'message': self.message, 'erreur': self.erreur, **self.data}
+
+
+EventCallback = Callable[[Event], None]
+
+
+class EventEmitter:
+    """Base des classes du cœur : relaie les événements vers un callback optionnel,
+    sans dépendre de Tk (les événements sont ignorés si aucun callback n'est fourni)."""
+
+    def __init__(self, on_event: EventCallback | None = None) -> None:
+        self.on_event = on_event
+
+    def emit(self, kind: str, message: str = '', erreur: bool = False, gras_part: str | None = None, **data: Any) -> None:
+        if self.on_event:
+            self.on_event(Event(kind, message, erreur, gras_part, **data))
+
+    def log(self, message: str, erreur: bool = False, gras_part: str | None = None) -> None:
+        self.emit(LOG, message, erreur, gras_part)
@@ -0,0 +1,239 @@
+"""Mode « parc » : plusieurs profils (dossiers d'extensions) gérés depuis un même compte.
+
+Les profils sont scannés en parallèle, chaque dépôt n'est vérifié et téléchargé qu'une
+fois dans un cache partagé, puis chaque profil est installé ou mis à jour depuis ce cache.
+"""
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from i18n import _
+from core.config import Config
+from core.events import EventCallback, EventEmitter
+from core.installer import Installer
+from core.updater import Updater, parse_version
+from core.repo_manager import RepoManager
+from core import integrity, paths, planner
+from core.update_checks import Key, extension_key
+
+FLEET_DIR = paths.data_path('fleet')
+CACHE_DIR = paths.data_path(os.path.join('cache', 'archives'))
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', name).strip('_') or 'profil'
+
+
+class Profile:
+    """Un dossier d'extensions Inkscape (celui d'un utilisateur) et son état local."""
+
+    def __init__(self, name: str, extensions_dir: str, state_root: str = FLEET_DIR) -> None:
+        self.name = name
+        self.extensions_dir = extensions_dir
+        self.state_dir = os.path.join(state_root, _safe_name(name))
+        self.installed: list[dict[str, Any]] = []
+        self.outdated: list[dict[str, Any]] = []
+        self.done: list[str] = []
+        self.failed: list[str] = []
+        self.errors: list[str] = []
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            'profile': self.name,
+            'extensions_dir': self.extensions_dir,
+            'installed': len(self.installed),
+            'outdated': [ext.get('name') for ext in self.outdated],
+            'done': self.done,
+            'failed': self.failed,
+            'errors': self.errors,
+        }
+
+
+def parse_profile_specs(specs: list[str], state_root: str = FLEET_DIR) -> list[Profile]:
+    """Transforme des arguments `NOM=DOSSIER` (ou `DOSSIER`) en profils.
+
+    Lève ValueError si deux profils partagent le même dossier d'état (même nom, une fois
+    réduit aux caractères permis) : le second écraserait l'état local du premier.
+    """
+    profiles: list[Profile] = []
+    seen: dict[str, str] = {}  # dossier d'état -> spécification
+    for spec in specs:
+        name, sep, path = spec.partition('=')
+        if not sep:
+            path = spec
+            name = os.path.basename(os.path.normpath(spec)) or spec
+        profile = Profile(name, os.path.expanduser(path), state_root)
+        if profile.state_dir in seen:
+            raise ValueError(_("Profils « {first} » et « {second} » : même dossier d'état ({path})").format(
+                first=seen[profile.state_dir], second=spec, path=os.path.normpath(profile.state_dir)))
+        seen[profile.state_dir] = spec
+        profiles.append(profile)
+    return profiles
+
+
+class ArchiveCache(EventEmitter):
+    """Archives de dépôts téléchargées une seule fois par exécution, partagées entre profils."""
+
+    def __init__(self, installer: Installer, cache_dir: str = CACHE_DIR, on_event: EventCallback | None = None) -> None:
+        super().__init__(on_event)
+        self.installer = installer
+        self.cache_dir = cache_dir
+        self._entries: dict[str, tuple[str, str] | None] = {}  # repo -> (chemin zip, branche)
+        self._lock = threading.Lock()
+        self._repo_locks: dict[str, threading.Lock] = {}
+
+    def _path_for(self, repo_url: str) -> str:
+        return os.path.join(self.cache_dir, _safe_name(repo_url.rstrip('/').split('://', 1)[-1]) + '.zip')
+
+    def get(self, ext: dict[str, Any], expected_sha256: str | None) -> tuple[str, str] | None:
+        """Retourne (chemin de l'archive, branche), en la téléchargeant au premier appel."""
+        repo_url = str(ext['repos'])
+        with self._lock:
+            repo_lock = self._repo_locks.setdefault(repo_url, threading.Lock())
+        with repo_lock:
+            if repo_url in self._entries:
+                return self._entries[repo_url]
+            os.makedirs(self.cache_dir, exist_ok=True)
+            zip_path = self._path_for(repo_url)
+            entry: tuple[str, str] | None = None
+            try:
+                with open(zip_path, 'wb') as f:
+                    result = self.installer.download_archive(ext, f)
+                if result is not None:
+                    branch, zip_url, digest = result
+                    integrity.check_checksum(digest, expected_sha256, zip_url)
+                    entry = (zip_path, branch)
+            except Exception as e:
+                self.log(_("Erreur téléchargement {repo} : {e}").format(repo=repo_url, e=e), erreur=True)
+            self._entries[repo_url] = entry
+            return entry
+
+    def downloaded(self) -> list[str]:
+        return [repo for repo, entry in self._entries.items() if entry]
+
+
+class Fleet(EventEmitter):
+    """Scan, vérification et mise à jour concurrente de plusieurs profils."""
+
+    def __init__(self, config: Config, profiles: list[Profile], on_event: EventCallback | None = None, cache_dir: str = CACHE_DIR, max_workers: int = 8) -> None:
+        super().__init__(on_event)
+        self.config = config
+        self.profiles = profiles
+        self.max_workers = max(1, max_workers)
+        self.installers = {p.name: Installer(config, on_event, p.extensions_dir, p.state_dir) for p in profiles}
+        self.updater = Updater(config, on_event)
+        self.cache = ArchiveCache(Installer(config, on_event), cache_dir, on_event)
+        self.catalog: dict[str, list[dict[str, Any]]] = {}
+
+    def _map(self, func: Any, items: list[Any]) -> list[Any]:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(func, items))
+
+    def scan(self) -> None:
+        """Scanne tous les profils en parallèle."""
+        def scan_one(profile: Profile) -> None:
+            os.makedirs(profile.state_dir, exist_ok=True)
+            if not os.path.isdir(profile.extensions_dir):
+                profile.errors.append(_("Dossier introuvable : {path}").format(path=profile.extensions_dir))
+                return
+            profile.installed = self.installers[profile.name].scan_installed()
+        self._map(scan_one, self.profiles)
+
+    def check(self) -> None:
+        """Vérifie les mises à jour : une seule requête par extension (dépôt et chemin de
+        téléchargement), quel que soit le nombre de profils.
+
+        Les Info.json en ligne passent par la mémoire de l'Updater (UpdateCheckStore).
+        """
+        by_key: dict[Key, dict[str, Any]] = {}
+        for profile in self.profiles:
+            for ext in profile.installed:
+                if ext.get('repos'):
+                    by_key.setdefault(extension_key(ext), ext)
+        keys = list(by_key)
+        online = dict(zip(keys, self._map(lambda key: self.updater.checks.get(by_key[key]), keys)))
+        for profile in self.profiles:
+            profile.outdated = []
+            for ext in profile.installed:
+                info = online.get(extension_key(ext))
+                if info and info.get('version') and ext.get('version'):
+                    if parse_version(ext['version']) < parse_version(info['version']):
+                        profile.outdated.append(ext)
+
+    def required_archives(self) -> dict[str, dict[str, Any]]:
+        """Union des dépôts à télécharger pour mettre à jour tous les profils."""
+        required: dict[str, dict[str, Any]] = {}
+        for profile in self.profiles:
+            for ext in profile.outdated:
+                required.setdefault(str(ext['repos']), ext)
+        return required
+
+    def _prefetch(self, exts: dict[str, dict[str, Any]]) -> None:
+        if not self.catalog:
+            self.catalog = RepoManager(self.config).load_catalog()
+        self._map(lambda ext: self.cache.get(ext, integrity.find_expected_checksum(ext, self.catalog)), list(exts.values()))
+
+    def _apply(self, profile: Profile, ext: dict[str, Any], dest_base: str, dry_run: bool) -> None:
+        name = str(ext.get('name', '?'))
+        entry = self.cache.get(ext, integrity.find_expected_checksum(ext, self.catalog))
+        if entry is None:
+            profile.failed.append(name)
+            return
+        try:
+            self.installers[profile.name].install_from_archive(ext, entry[0], entry[1], dest_base, dry_run)
+            profile.done.append(name)
+        except Exception as e:
+            profile.failed.append(name)
+            profile.errors.append(f"{name}: {e}")
+
+    def update_all(self, dry_run: bool = False) -> None:
+        """Met à jour tous les profils depuis le cache partagé."""
+        self._prefetch(self.required_archives())
+
+        def update_profile(profile: Profile) -> None:
+            for ext in profile.outdated:
+                self._apply(profile, ext, planner.install_base_dir(ext), dry_run)
+            if profile.done and not dry_run:
+                profile.installed = self.installers[profile.name].scan_installed()
+        self._map(update_profile, self.profiles)
+
+    def install_all(self, catalog_exts: list[dict[str, Any]], dry_run: bool = False) -> None:
+        """Installe des extensions du catalogue dans tous les profils."""
+        self._prefetch({str(ext['repos']): ext for ext in catalog_exts})
+
+        def install_profile(profile: Profile) -> None:
+            installer = self.installers[profile.name]
+            for ext in catalog_exts:
+                self._apply(profile, ext, installer.default_dest(ext), dry_run)
+            if profile.done and not dry_run:
+                profile.installed = installer.scan_installed()
+        self._map(install_profile, self.profiles)
+
+    def report(self) -> dict[str, Any]:
+        """Résumé par profil et archives téléchargées."""
+        return {
+            'profiles': [p.summary() for p in self.profiles],
+            'archives_downloaded': self.cache.downloaded(),
+        }
+
+    def report_text(self) -> str:
+        lines: list[str] = []
+        for p in self.profiles:
+            s = p.summary()
+            lines.append(_("{profile} : {installed} installée(s), {outdated} à mettre à jour, {done} traitée(s), {failed} échec(s)").format(
+                profile=s['profile'], installed=s['installed'], outdated=len(s['outdated']), done=len(s['done']), failed=len(s['failed'])))
+            for err in s['errors']:
+                lines.append(f"   {err}")
+        lines.append(_("Archives téléchargées : {count}").format(count=len(self.cache.downloaded())))
+        return '\n'.join(lines)
+
+
+def load_profiles_file(path: str) -> list[str]:
+    """Lit un fichier de profils : une ligne `NOM=DOSSIER` par profil, ou une liste JSON."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    if content.lstrip().startswith('['):
+        return [str(x) for x in json.loads(content)]
+    return [line.strip() for line in content.splitlines() if line.strip() and not line.strip().startswith('#')]
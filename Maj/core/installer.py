@@ -1,15 +1,380 @@
 """Installation, désinstallation des extensions."""
+import json
+import os
+from typing import Any
+import i18n
 from i18n import _
 from core.config import Config
+from core.events import EventCallback, EventEmitter, SUCCESS
+from core.provider_utils import ProviderUtils
+from core.network import download_to_file, fetch_json
+from core import integrity, metrics, paths, planner, tracing
+from core.progress import COPY, DOWNLOAD, PLAN, Progress
+from core.translations import INFO_KEYS, get_store, pick, translated_path
 
-class Installer:
-    def __init__(self, config: Config):
+
+class Installer(EventEmitter):
+    """Scan, installation et suppression des extensions, sans interface graphique.
+
+    `extensions_dir` est le dossier d'extensions Inkscape visé, `state_dir` le dossier
+    où sont écrits installed_extensions.json et installed_hashes.json (data/ par défaut).
+    """
+
+    def __init__(self, config: Config, on_event: EventCallback | None = None, extensions_dir: str | None = None, state_dir: str | None = None) -> None:
+        super().__init__(on_event)
         self.config = config
+        self.provider_utils = ProviderUtils(config)
+        self.extensions_dir = extensions_dir or paths.inkscape_extensions_dir()
+        self.state_dir = state_dir or paths.DATA_DIR
+        self.installed_path = paths.data_path('installed_extensions.json', self.state_dir)
+        self.hashes_path = paths.data_path('installed_hashes.json', self.state_dir)
+        # Variantes traduites des Info.json installés, pour changer de langue sans rescanner
+        self.translations = get_store()
+        # Plan de la dernière installation ou mise à jour (utile en simulation)
+        self.last_plan: planner.InstallPlan | None = None
+
+    # --- extensions installées ----------------------------------------------
+
+    def scan_installed(self) -> list[dict[str, Any]]:
+        """
+        Parcourt le dossier d'extensions utilisateur, lit les Info.json, complète installed_extensions.json,
+        et retourne la liste des extensions installées.
+        """
+        with tracing.span('scan', 'scan'), metrics.phase('scan'):
+            return self._scan_installed()
+
+    def _scan_installed(self) -> list[dict[str, Any]]:
+        installed_by_repo: dict[str, dict[str, Any]] = {}
+        current_lang: str = i18n.lang_code
+
+        # Passe 1 : Collecter toutes les entrées avec leur locale, groupées par URL de dépôt
+        # Cela permet de ne garder qu'une seule version par extension (selon la langue courante)
+        entries_by_repos: dict[str, list[tuple[str, str, dict[str, Any]]]] = {}  # clé repos -> [(locale, root, info)]
+
+        with tracing.span('scan.walk', 'scan', dir=self.extensions_dir) as sp:
+            for root, _dirs, files in os.walk(self.extensions_dir):
+                if 'Info.json' in files:
+                    info_path = os.path.join(root, 'Info.json')
+                    try:
+                        with open(info_path, 'r', encoding='utf-8') as f:
+                            info = json.load(f)
+                        # Vérifier le type
+                        if info.get('type') == 'InkScape extension':
+                            # Détecter la locale depuis le chemin du répertoire
+                            # Ex: .../locale/none/LC_MESSAGES -> "none" (= français par défaut)
+                            #     .../locale/en/LC_MESSAGES   -> "en"
+                            normalized_root = root.replace('\\', '/')
+                            entry_locale = 'none'
+                            parts = normalized_root.split('/')
+                            for i, part in enumerate(parts):
+                                if part == 'locale' and i + 1 < len(parts):
+                                    entry_locale = parts[i + 1]
+                                    break
+
+                            repo_url = info.get('repos', '') or root
+                            if repo_url not in entries_by_repos:
+                                entries_by_repos[repo_url] = []
+                            entries_by_repos[repo_url].append((entry_locale, root, info))
+                    except Exception as e:
+                        self.log(f"Erreur lecture {info_path}: {e}", erreur=True)
+            sp.set(extensions=len(entries_by_repos))
+
+        # Passe 2 : Pour chaque extension, sélectionner la version correspondant à la langue courante
+        with tracing.span('scan.select', 'scan'):
+            for _repo_key, entries in entries_by_repos.items():
+                chosen_locale = None
+                chosen_root = None
+                chosen_info = None
+
+                # Chercher la version correspondant à la langue courante
+                for entry_locale, root, info in entries:
+                    # "none" est la locale par défaut = français
+                    effective_lang = 'fr' if entry_locale == 'none' else entry_locale
+                    if effective_lang == current_lang:
+                        chosen_locale = entry_locale
+                        chosen_root = root
+                        chosen_info = info
+                        break
+
+                # Fallback : prendre la version "none" (défaut, français)
+                if chosen_info is None:
+                    for entry_locale, root, info in entries:
+                        if entry_locale == 'none':
+                            chosen_locale = entry_locale
+                            chosen_root = root
+                            chosen_info = info
+                            break
+
+                # Dernier fallback : première entrée disponible
+                if chosen_info is None:
+                    chosen_locale, chosen_root, chosen_info = entries[0]
+
+                assert chosen_root is not None
+                assert chosen_locale is not None
+                info_to_write = dict(chosen_info)
+                info_path = self.info_json_path(info_to_write)
+                cache_repo = str(info_to_write.get('repos') or _repo_key)
+                # Toutes les variantes présentes sur le disque sont mises en cache
+                for entry_locale, _root, info in entries:
+                    effective_lang = 'fr' if entry_locale == 'none' else entry_locale
+                    self.translations.put(cache_repo, info_path, effective_lang, {**pick(info, INFO_KEYS), 'version': info.get('version')})
+                actual_repo_url = info_to_write.get('repos', None)
+
+                # Si la locale sélectionnée ne correspond pas à la langue courante,
+                # utiliser la traduction en cache pour cette version, sinon la chercher (en ligne puis locale)
+                selected_effective_lang = 'fr' if chosen_locale == 'none' else chosen_locale
+                if current_lang != selected_effective_lang and actual_repo_url:
+                    cached = self.translations.get(cache_repo, info_path, current_lang)
+                    if isinstance(cached, dict) and cached.get('version') == info_to_write.get('version'):
+                        metrics.cache_hit(self.provider_utils.file_host(str(actual_repo_url)))
+                    else:
+                        cached = self._fetch_translated_info(actual_repo_url, info_path, chosen_root, current_lang)
+                        if cached is not None:
+                            cached['version'] = info_to_write.get('version')
+                            self.translations.put(cache_repo, info_path, current_lang, cached)
+                    if cached:
+                        info_to_write.update(pick(cached, INFO_KEYS))
+
+                info_to_write['Installed_dir'] = chosen_root
+                local_name = info_to_write.get('name')
+                if local_name:
+                    installed_by_repo[local_name] = info_to_write
+        # Tri alphabétique
+        sorted_installed = dict(sorted(installed_by_repo.items(), key=lambda x: x[0].lower()))
+        # Écriture du fichier installed_extensions.json
+        with tracing.span('scan.write', 'scan'):
+            try:
+                paths.write_json_atomic(self.installed_path, sorted_installed)
+            except Exception as e:
+                self.log(f"Erreur écriture installed_extensions.json: {e}", erreur=True)
+            self.translations.save()
+        # Retourne la liste à plat pour compatibilité usages existants
+        return list(sorted_installed.values())
+
+    @staticmethod
+    def info_json_path(ext: dict[str, Any]) -> str:
+        """Chemin du Info.json de l'extension dans son dépôt (clé du cache des traductions)."""
+        download_val = ext.get('download', [0])
+        return f"{download_val[0]}Info.json"
+
+    def _fetch_translated_info(self, repo_url: str, info_path: str, chosen_root: str, lang: str) -> dict[str, Any] | None:
+        """Nom et description traduits d'un Info.json : en ligne, sinon dans le dossier installé."""
+        try:
+            provider = self.provider_utils.get_provider_for_url(repo_url)
+            if provider:
+                owner, repo = self.provider_utils.split_repo_url(repo_url, provider)
+                for branch_try in provider["alternative_main_branch"]:
+                    url_online = self.provider_utils.build_file_url(provider, owner, repo, branch_try, translated_path(info_path, lang))
+                    try:
+                        return pick(fetch_json(url_online), INFO_KEYS)
+                    except Exception:
+                        continue
+                local_path = os.path.join(chosen_root, 'locale', lang, 'LC_MESSAGES', 'Info.json')
+                if os.path.isfile(local_path):
+                    with open(local_path, 'r', encoding='utf-8') as ft:
+                        return pick(json.load(ft), INFO_KEYS)
+        except Exception:
+            pass
+        return None
+
+    def localize_installed(self, extensions: list[dict[str, Any]], lang: str | None = None) -> list[dict[str, Any]]:
+        """Extensions installées traduites dans `lang` (langue courante par défaut) depuis le cache."""
+        lang = lang or i18n.lang_code
+        return [
+            self.translations.localize_info(str(ext['repos']), self.info_json_path(ext), ext, lang) if ext.get('repos') else ext
+            for ext in extensions
+        ]
+
+    def load_installed(self) -> list[dict[str, Any]]:
+        """Lit installed_extensions.json (résultat du dernier scan)."""
+        try:
+            with open(self.installed_path, 'r', encoding='utf-8') as f:
+                data: Any = json.load(f)
+        except Exception:
+            return []
+        extensions: list[dict[str, Any]] = []
+        if isinstance(data, dict):
+            for ext_val in data.values():  # type: ignore[union-attr]
+                if isinstance(ext_val, list):
+                    extensions.extend(ext_val)  # type: ignore[arg-type]
+                elif isinstance(ext_val, dict):
+                    extensions.append(ext_val)  # type: ignore[arg-type]
+        elif isinstance(data, list):
+            extensions = list(data)  # type: ignore[arg-type]
+        return extensions
+
+    # --- installation -----------------------------------------------------
+
+    def default_dest(self, ext: dict[str, Any]) -> str:
+        """Dossier d'installation d'une nouvelle extension (clé default_install_dir)."""
+        return os.path.join(self.extensions_dir, str(ext.get('default_install_dir', '')))
+
+    def install(self, ext: dict[str, Any], dry_run: bool = False) -> bool:
+        """Installe une extension du catalogue. Retourne True en cas de succès.
+
+        Avec `dry_run`, l'archive est téléchargée et le plan calculé, sans rien écrire.
+        """
+        if not ext or 'name' not in ext:
+            self.log(_("Aucune extension sélectionnée ou information de téléchargement manquante."))
+            return False
+        ext_name: str = str(ext['name'])
+        self.log(_("Installation de l'extension : {ext_name}").format(ext_name=ext_name), gras_part=ext_name)
+        if 'download' not in ext or not ext['download'] or 'repos' not in ext:
+            self.log(_("Aucune extension sélectionnée ou information de téléchargement manquante."))
+            return False
+        try:
+            with metrics.phase('install') as phase:
+                installed = self.install_from_repo(ext, self.default_dest(ext), integrity.find_expected_checksum(ext), dry_run)
+                phase.failed = not installed
+            if installed:
+                if dry_run:
+                    return True
+                self.emit(SUCCESS, _(u"Installation terminée ! Relancez InkScape pour voir l'extension.\n"), start_here=ext.get('start_here'))
+                return True
+        except Exception as e:
+            self.log(_("Erreur lors de l'installation : {e}").format(e=e), erreur=True, gras_part=str(e))
+        return False
+
+    def download_archive(self, ext: dict[str, Any], fileobj: Any) -> tuple[str, str, str] | None:
+        """Télécharge l'archive du dépôt de l'extension dans `fileobj` en testant les branches connues.
+
+        Retourne (branche, url, empreinte) ou None si aucune branche n'a répondu.
+        """
+        repo_url = ext['repos']
+        provider = self.provider_utils.get_provider_for_url(repo_url)
+        if not provider:
+            self.log(_("Aucun provider compatible trouvé pour ce dépôt."), erreur=True)
+            return None
+        owner, repo = self.provider_utils.split_repo_url(repo_url, provider)
+        for branch_try in provider["alternative_main_branch"]:
+            try:
+                zip_url = self.provider_utils.build_zip_url(provider, owner, repo, branch_try)
+                self.log(_("Tentative téléchargement : {zip_url}").format(zip_url=zip_url), gras_part=zip_url)
+                progress = Progress(self.emit, DOWNLOAD, name=str(ext.get('name', '')))
+                with tracing.span('branch', 'provider', branch=branch_try):
+                    digest, _size = download_to_file(zip_url, fileobj, progress=progress)
+                progress.finish()
+                return branch_try, zip_url, digest
+            except Exception:
+                continue
+        self.log(_("Impossible de télécharger l'archive du dépôt sur aucune branche connue."), erreur=True)
+        return None
+
+    def install_from_archive(self, ext: dict[str, Any], zip_path: str, branch: str, dest_base: str, dry_run: bool = False) -> planner.InstallPlan:
+        """Calcule le plan d'installation depuis une archive locale puis l'exécute dans dest_base
+        (sauf avec `dry_run`)."""
+        import zipfile
+        hashes = integrity.InstalledHashes(self.hashes_path)
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            # Dossier racine de l'archive (<repo>-<branch>)
+            root = planner.find_archive_root(zip_ref, f"{os.path.basename(ext['repos'])}-{branch}")
+            name = str(ext.get('name', ''))
+            progress = Progress(self.emit, PLAN, name=name)
+            with tracing.span('zip.plan', 'zip', name=name):
+                plan = planner.build_plan(zip_ref, root, planner.download_items(ext), dest_base, hashes, progress)
+            progress.finish()
+            self.log(_("Dossier d'installation : \n   {install_dir}").format(install_dir=dest_base), gras_part=dest_base)
+            self.log(plan.describe())
+            for target in plan.targets:
+                if target.missing:
+                    self.log(_("Non trouvé dans l'archive : {src_path}").format(src_path=target.item), erreur=True)
+            self.last_plan = plan
+            if dry_run:
+                return plan
+            copy_bytes, copy_files = plan.copy_totals()
+            progress = Progress(self.emit, COPY, copy_bytes, copy_files, name=name)
+            with tracing.span('zip.extract', 'zip', name=name, files=copy_files, bytes=copy_bytes):
+                planner.apply_plan(zip_ref, plan, hashes, progress)
+            progress.finish()
+        hashes.save()
+        for target in plan.targets:
+            if not target.missing:
+                self.log(_("Copié : \n   {dest_path}").format(dest_path=target.dest), gras_part=target.dest)
+        return plan
+
+    def install_from_repo(self, ext: dict[str, Any], dest_base: str, expected_sha256: str | None, dry_run: bool = False) -> bool:
+        """Télécharge l'archive du dépôt, calcule le plan puis l'exécute dans dest_base.
+
+        Retourne False si le téléchargement a échoué. Lève IntegrityError si une empreinte diffère.
+        """
+        import tempfile
+        tmp_zip = tempfile.NamedTemporaryFile(delete=False, suffix='.zip')
+        try:
+            with tracing.span('archive', 'provider', repos=ext.get('repos')):
+                result = self.download_archive(ext, tmp_zip)
+            tmp_zip.close()
+            if result is None:
+                return False
+            branch, zip_url, digest = result
+            # Vérifier l'empreinte de l'archive avant toute écriture dans le dossier d'installation
+            integrity.check_checksum(digest, expected_sha256, zip_url)
+            self.install_from_archive(ext, tmp_zip.name, branch, dest_base, dry_run)
+        finally:
+            try:
+                tmp_zip.close()
+                os.unlink(tmp_zip.name)
+            except Exception:
+                pass
+        return True
+
+    # --- suppression --------------------------------------------------------
+
+    def uninstall(self, ext: dict[str, Any]) -> bool:
+        """Supprime les fichiers `download` d'une extension installée et met à jour installed_extensions.json."""
+        import shutil
+        install_dir: str | None = ext.get('Installed_dir')
+        base_dir = planner.install_base_dir(ext) if install_dir else None
+        ok = True
+        hashes = integrity.InstalledHashes(self.hashes_path)
+        if base_dir:
+            for item in planner.download_items(ext):
+                path = os.path.join(base_dir, os.path.basename(item.rstrip('/')))
+                try:
+                    if os.path.isdir(path):
+                        shutil.rmtree(path)
+                    elif os.path.isfile(path):
+                        os.remove(path)
+                    if item.endswith('/'):
+                        hashes.forget(path)
+                    else:
+                        # Fichier isolé : enregistré sous le dossier d'installation (voir planner.apply_plan)
+                        hashes.forget_file(base_dir, os.path.basename(item))
+                except Exception as e:
+                    ok = False
+                    self.log(_("Erreur suppression {path}: {e}").format(path=path, e=e), erreur=True)
+            try:
+                hashes.save()
+            except Exception:
+                pass
+        # Mise à jour du fichier installed_extensions.json
+        try:
+            with open(self.installed_path, 'r', encoding='utf-8') as f:
+                data: Any = json.load(f)
+            name = ext.get('name')
+            if isinstance(data, dict):
+                data.pop(name, None)  # type: ignore[arg-type]
+            elif isinstance(data, list):
+                data = [e for e in data if not isinstance(e, dict) or e.get('name') != name]  # type: ignore[union-attr]
+            paths.write_json_atomic(self.installed_path, data)
+        except Exception as e:
+            self.log(_("Erreur mise à jour installed_extensions.json: {e}").format(e=e), erreur=True)
+        if ok:
+            self.log(_("Extension supprimée : {name}").format(name=ext.get('name')))
+        return ok
 
-    def install(self, extension):
-        # TODO: Installer une extension
-        pass
+    # --- intégrité ----------------------------------------------------------
 
-    def uninstall(self, extension):
-        # TODO: Désinstaller une extension
-        pass
+    def verify(self, full: bool = False) -> dict[str, list[str]]:
+        """Contrôle les fichiers installés contre les empreintes enregistrées."""
+        hashes = integrity.InstalledHashes(self.hashes_path)
+        if not hashes.data:
+            self.log(_("Aucune empreinte enregistrée : installez ou mettez à jour une extension d'abord."))
+            return {}
+        problems = hashes.verify(full)
+        if not problems:
+            self.log(_("Installation vérifiée : {count} dossier(s) intact(s).").format(count=len(hashes.data)))
+        for root, issues in problems.items():
+            self.log(_("Dossier altéré : {root}").format(root=root), erreur=True, gras_part=root)
+            for issue in issues:
+                self.log(f"   {issue}", erreur=True)
+        return problems
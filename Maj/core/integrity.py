@@ -0,0 +1,151 @@
+"""Vérification d'intégrité : empreintes SHA-256 des archives et des fichiers installés."""
+import json
+import os
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable
+from i18n import _
+from core import paths
+
+if TYPE_CHECKING:
+    import hashlib
+
+HASHES_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'installed_hashes.json')
+CHUNK_SIZE = 64 * 1024
+
+
+class IntegrityError(Exception):
+    """L'empreinte calculée ne correspond pas à l'empreinte attendue."""
+
+
+def normalize_checksum(value: Any) -> str | None:
+    """Retourne l'empreinte en minuscules sans préfixe « sha256: », ou None."""
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip().lower()
+    if value.startswith('sha256:'):
+        value = value[len('sha256:'):]
+    return value or None
+
+
+def check_checksum(actual: str, expected: Any, label: str) -> None:
+    """Lève IntegrityError si `expected` est fourni et diffère de `actual`."""
+    wanted = normalize_checksum(expected)
+    if wanted and wanted != actual.lower():
+        raise IntegrityError(_("Empreinte SHA-256 invalide pour {label} : attendu {expected}, obtenu {actual}").format(
+            label=label, expected=wanted, actual=actual))
+
+
+def new_sha256() -> 'hashlib._Hash':
+    """Nouveau calcul SHA-256 ; hashlib (et OpenSSL) n'est chargé qu'à la première empreinte."""
+    import hashlib
+    return hashlib.sha256()
+
+
+def stream_copy(src: BinaryIO, dst: BinaryIO, on_chunk: Callable[[int], None] | None = None) -> tuple[str, int]:
+    """Copie un flux par blocs en calculant son SHA-256 au passage.
+
+    `on_chunk(taille)` est appelé après chaque bloc écrit. Retourne (empreinte
+    hexadécimale, nombre d'octets copiés).
+    """
+    digest = new_sha256()
+    size = 0
+    while True:
+        chunk = src.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        digest.update(chunk)
+        dst.write(chunk)
+        size += len(chunk)
+        if on_chunk:
+            on_chunk(len(chunk))
+    return digest.hexdigest(), size
+
+
+def sha256_file(path: str) -> str:
+    """Calcule le SHA-256 d'un fichier."""
+    digest = new_sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_expected_checksum(ext: dict[str, Any], catalog: Any = None) -> str | None:
+    """Cherche l'empreinte attendue de l'archive : clé `sha256` de l'extension, sinon celle
+    de l'entrée du catalogue (installable_extensions.json) ayant le même dépôt."""
+    checksum = normalize_checksum(ext.get('sha256'))
+    if checksum:
+        return checksum
+    repo_url = ext.get('repos')
+    if repo_url and isinstance(catalog, dict):
+        for repo_exts in catalog.values():  # type: ignore[union-attr]
+            for entry in repo_exts if isinstance(repo_exts, list) else []:  # type: ignore[union-attr]
+                if isinstance(entry, dict) and entry.get('repos') == repo_url:  # type: ignore[union-attr]
+                    return normalize_checksum(entry.get('sha256'))  # type: ignore[union-attr]
+    return None
+
+
+class InstalledHashes:
+    """Registre des empreintes des fichiers installés, clé = dossier installé."""
+
+    def __init__(self, path: str = HASHES_FILE) -> None:
+        self.path = path
+        self.data: dict[str, dict[str, dict[str, Any]]] = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                loaded = json.load(f)
+            if isinstance(loaded, dict):
+                self.data = loaded  # type: ignore[assignment]
+        except Exception:
+            self.data = {}
+
+    def save(self) -> None:
+        paths.write_json_atomic(self.path, self.data)
+
+    def record(self, root: str, files: dict[str, dict[str, Any]], replace: bool = True) -> None:
+        """Enregistre les empreintes des fichiers copiés sous `root`."""
+        root = os.path.normpath(root)
+        if replace or root not in self.data:
+            self.data[root] = {}
+        self.data[root].update(files)
+
+    def forget(self, path: str) -> None:
+        """Oublie les empreintes de `path` et de ses sous-dossiers."""
+        path = os.path.normpath(path)
+        for root in list(self.data):
+            if root == path or root.startswith(path + os.sep):
+                del self.data[root]
+
+    def forget_file(self, root: str, rel: str) -> None:
+        """Oublie l'empreinte du fichier `rel` enregistré sous `root` (élément `download` isolé) ;
+        le dossier est retiré quand il ne contient plus rien."""
+        root = os.path.normpath(root)
+        files = self.data.get(root)
+        if files is None:
+            return
+        files.pop(rel.replace('\\', '/'), None)
+        if not files:
+            del self.data[root]
+
+    def verify(self, full: bool = False) -> dict[str, list[str]]:
+        """Contrôle les fichiers installés.
+
+        Par défaut, seuls les fichiers dont la taille ou la date a changé sont relus ;
+        `full=True` recalcule toutes les empreintes. Retourne {dossier: [problèmes]}.
+        """
+        problems: dict[str, list[str]] = {}
+        for root, files in self.data.items():
+            for rel, meta in files.items():
+                path = os.path.join(root, rel)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    problems.setdefault(root, []).append(_("manquant : {file}").format(file=rel))
+                    continue
+                if st.st_size != meta.get('size'):
+                    problems.setdefault(root, []).append(_("taille différente : {file}").format(file=rel))
+                    continue
+                if not full and st.st_mtime_ns == meta.get('mtime_ns'):
+                    continue
+                if sha256_file(path) != meta.get('sha256'):
+                    problems.setdefault(root, []).append(_("contenu modifié : {file}").format(file=rel))
+        return problems
@@ -0,0 +1,134 @@
+"""Journal persistant des opérations : une ligne JSON par entrée, fichier à rotation par taille.
+
+Chaque entrée porte l'horodatage, le niveau, l'identifiant de l'opération en cours
+et le temps écoulé depuis son début ; la fin d'une opération enregistre sa durée totale.
+Les dernières entrées restent aussi en mémoire (`recent`) pour l'interface.
+"""
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, TypeVar
+
+from core.events import Event, LOG, PROGRESS, SUCCESS
+from core import profiling, tracing
+
+LOG_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'maj.log.jsonl')
+MAX_BYTES = 1024 * 1024
+BACKUP_COUNT = 3
+RECENT_SIZE = 1000
+
+INFO = 'info'
+ERROR = 'error'
+
+T = TypeVar('T')
+
+# Opération en cours dans le thread (ou la tâche) courant : (identifiant, nom, début)
+_current: contextvars.ContextVar[tuple[str, str, float] | None] = contextvars.ContextVar('maj_operation', default=None)
+_ids = itertools.count(1)
+
+
+def _timestamp(now: float) -> str:
+    """Horodatage ISO 8601 local à la milliseconde (sans le module datetime)."""
+    local = time.localtime(now)
+    return time.strftime('%Y-%m-%dT%H:%M:%S', local) + f".{int(now * 1000) % 1000:03d}" + time.strftime('%z', local)
+
+
+class Journal:
+    """Écrit les entrées dans `path` (rotation à `max_bytes`, `backup_count` anciens fichiers).
+
+    Pas de module logging : le journal est créé au lancement de l'interface et doit rester léger.
+    """
+
+    def __init__(self, path: str = LOG_FILE, max_bytes: int = MAX_BYTES, backup_count: int = BACKUP_COUNT) -> None:
+        self.path = path
+        self.recent: deque[dict[str, Any]] = deque(maxlen=RECENT_SIZE)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._lock = threading.Lock()
+        self._session = f"{os.getpid():x}-{int(time.time()):x}"
+
+    def write(self, message: str, level: str = INFO, **data: Any) -> dict[str, Any]:
+        """Enregistre une entrée ; l'opération en cours (voir `operation`) est ajoutée d'office."""
+        now = time.time()
+        entry: dict[str, Any] = {
+            'ts': _timestamp(now),
+            'level': level,
+            'session': self._session,
+        }
+        current = _current.get()
+        if current is not None:
+            op_id, op_name, started = current
+            entry['op'] = op_id
+            entry['op_name'] = op_name
+            entry['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        entry['message'] = message.rstrip('\n')
+        entry.update(data)
+        self.recent.append(entry)
+        line = json.dumps(entry, ensure_ascii=False, default=str) + '\n'
+        with self._lock:
+            try:
+                self._rotate_if_needed(len(line.encode('utf-8')))
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line)
+            except OSError:
+                # Dossier non accessible en écriture : l'entrée reste seulement en mémoire
+                pass
+        return entry
+
+    def _rotate_if_needed(self, incoming: int) -> None:
+        """maj.log.jsonl -> .1 -> .2 ... quand le fichier dépasserait `max_bytes`."""
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if size + incoming <= self.max_bytes:
+            return
+        for i in range(self.backup_count - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def record_event(self, event: Event) -> None:
+        """Enregistre un événement du cœur (seul le bilan de chaque phase d'avancement est gardé)."""
+        if event.kind == PROGRESS:
+            if event.data.get('finished'):
+                self.write(event.message, INFO, kind=PROGRESS, **event.data)
+        elif event.kind in (LOG, SUCCESS):
+            self.write(event.message, ERROR if event.erreur else INFO, kind=event.kind)
+
+    @contextmanager
+    def operation(self, name: str) -> Iterator[str]:
+        """Délimite une opération : les entrées écrites pendant son exécution portent son identifiant."""
+        op_id = f"{self._session}-{next(_ids)}"
+        started = time.perf_counter()
+        token = _current.set((op_id, name, started))
+        self.write(name, INFO, kind='op_start')
+        failed: BaseException | None = None
+        try:
+            with tracing.span(name, 'operation', op=op_id), profiling.action(name):
+                yield op_id
+        except BaseException as e:
+            failed = e
+            raise
+        finally:
+            entry: dict[str, Any] = {'kind': 'op_end', 'ok': failed is None, 'duration_ms': round((time.perf_counter() - started) * 1000, 1)}
+            if failed is not None:
+                entry['error'] = repr(failed)
+            self.write(name, ERROR if failed is not None else INFO, **entry)
+            _current.reset(token)
+
+    def wrap(self, func: Callable[..., T], name: str) -> Callable[..., T]:
+        """`func` exécutée dans une opération `name` (pour les tâches de fond)."""
+        def run(*args: Any, **kwargs: Any) -> T:
+            with self.operation(name):
+                return func(*args, **kwargs)
+        return run
@@ -0,0 +1,322 @@
+"""Compteurs de la session : requêtes par hôte, caches et durée des phases.
+
+Les accès réseau (core.network), les caches (recherches de mises à jour, traductions,
+catalogue) et les phases longues (scan, catalogue, recherche de mises à jour,
+installation, mise à jour) alimentent un registre unique, toujours actif : chaque
+mesure coûte un verrou et quelques additions.
+
+Le registre s'affiche dans l'onglet « Diagnostic » et s'exporte en JSON ou au format
+texte de Prometheus (collecteur « textfile » de node_exporter) :
+
+    MAJ_METRICS=/var/lib/node_exporter/maj.prom python Maj.py check
+    MAJ_METRICS=/tmp/maj-metrics.json python Maj.py update --all
+
+Le fichier est écrit à la sortie du programme ; l'extension .prom choisit le format
+Prometheus, toute autre le JSON.
+"""
+import atexit
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import AbstractContextManager, contextmanager
+from typing import Any, Iterator
+
+ENV_VAR = 'MAJ_METRICS'
+# Durées gardées par hôte et par phase pour le calcul des percentiles
+SAMPLE_SIZE = 1000
+QUANTILES = (0.5, 0.9, 0.99)
+PROMETHEUS_SUFFIX = '.prom'
+
+
+def host_of(url: str) -> str:
+    """Nom d'hôte de `url` (« local » pour un chemin ou une URL sans hôte)."""
+    from urllib.parse import urlsplit
+    return urlsplit(url).hostname or 'local'
+
+
+def is_timeout(exc: BaseException) -> bool:
+    """Vrai si l'exception est un délai dépassé, y compris enveloppé par urllib (URLError.reason)."""
+    return isinstance(exc, TimeoutError) or isinstance(getattr(exc, 'reason', None), TimeoutError)
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """Percentiles QUANTILES (rang le plus proche) de `samples`, en millisecondes arrondies."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    return {f"p{int(q * 100)}": round(_quantile(ordered, q) * 1000, 1) for q in QUANTILES}
+
+
+def _quantile(ordered: list[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class HostStats:
+    """Compteurs d'un hôte ; les durées sont en secondes."""
+    __slots__ = ('requests', 'bytes', 'failures', 'timeouts', 'cache_hits', 'revalidations', 'latency_sum', 'latencies')
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.bytes = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.cache_hits = 0
+        self.revalidations = 0
+        self.latency_sum = 0.0
+        self.latencies: deque[float] = deque(maxlen=SAMPLE_SIZE)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'bytes': self.bytes,
+            'failures': self.failures,
+            'timeouts': self.timeouts,
+            'cache_hits': self.cache_hits,
+            'revalidations': self.revalidations,
+            'latency_ms': percentiles(list(self.latencies)),
+            'latency_total_ms': round(self.latency_sum * 1000, 1),
+        }
+
+
+class PhaseStats:
+    """Exécutions d'une phase (scan, install…) et leurs durées, en secondes."""
+    __slots__ = ('count', 'failures', 'total', 'durations')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.failures = 0
+        self.total = 0.0
+        self.durations: deque[float] = deque(maxlen=SAMPLE_SIZE)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'count': self.count,
+            'failures': self.failures,
+            'total_ms': round(self.total * 1000, 1),
+            'duration_ms': percentiles(list(self.durations)),
+        }
+
+
+class _Request:
+    """Requête en cours (voir `Registry.request`) ; `bytes` est renseigné par l'appelant."""
+    __slots__ = ('bytes',)
+
+    def __init__(self) -> None:
+        self.bytes = 0
+
+
+class _Phase:
+    """Phase en cours (voir `Registry.phase`) ; `failed` marque un échec sans exception."""
+    __slots__ = ('failed',)
+
+    def __init__(self) -> None:
+        self.failed = False
+
+
+class Registry:
+    """Registre des compteurs de la session, partagé entre threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.hosts: dict[str, HostStats] = {}
+        self.phases: dict[str, PhaseStats] = {}
+
+    def _host(self, host: str) -> HostStats:
+        stats = self.hosts.get(host)
+        if stats is None:
+            stats = self.hosts[host] = HostStats()
+        return stats
+
+    def _phase(self, name: str) -> PhaseStats:
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = PhaseStats()
+        return stats
+
+    # --- enregistrement -------------------------------------------------------
+
+    def record_request(self, url: str, seconds: float, size: int = 0, error: BaseException | None = None) -> None:
+        host = host_of(url)
+        with self._lock:
+            stats = self._host(host)
+            stats.requests += 1
+            stats.bytes += size
+            stats.latency_sum += seconds
+            stats.latencies.append(seconds)
+            if error is not None:
+                stats.failures += 1
+                if is_timeout(error):
+                    stats.timeouts += 1
+
+    @contextmanager
+    def request(self, url: str) -> Iterator[_Request]:
+        """`with request(url) as r: ... r.bytes = n` – durée, taille et échec éventuel de la requête."""
+        current = _Request()
+        started = time.perf_counter()
+        try:
+            yield current
+        except BaseException as e:
+            self.record_request(url, time.perf_counter() - started, current.bytes, e)
+            raise
+        self.record_request(url, time.perf_counter() - started, current.bytes)
+
+    def cache_hit(self, host: str, count: int = 1) -> None:
+        """Requêtes vers `host` évitées grâce à un cache."""
+        with self._lock:
+            self._host(host).cache_hits += count
+
+    def revalidation(self, host: str, count: int = 1) -> None:
+        """Contenus mis en cache relus sur `host` pour vérifier qu'ils n'ont pas changé."""
+        with self._lock:
+            self._host(host).revalidations += count
+
+    def record_phase(self, name: str, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            stats = self._phase(name)
+            stats.count += 1
+            stats.total += seconds
+            stats.durations.append(seconds)
+            if failed:
+                stats.failures += 1
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[_Phase]:
+        """Mesure la durée d'une phase ; une exception ou `failed = True` la compte comme échouée."""
+        current = _Phase()
+        started = time.perf_counter()
+        try:
+            yield current
+        except BaseException:
+            self.record_phase(name, time.perf_counter() - started, failed=True)
+            raise
+        self.record_phase(name, time.perf_counter() - started, current.failed)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started = time.time()
+            self.hosts.clear()
+            self.phases.clear()
+
+    # --- lecture et export ----------------------------------------------------
+
+    def snapshot(self) -> dict[str, Any]:
+        """Copie des compteurs : {'started', 'uptime_s', 'hosts': {hôte: …}, 'phases': {nom: …}}."""
+        with self._lock:
+            return {
+                'started': self.started,
+                'uptime_s': round(time.time() - self.started, 1),
+                'hosts': {host: stats.to_dict() for host, stats in sorted(self.hosts.items())},
+                'phases': {name: stats.to_dict() for name, stats in sorted(self.phases.items())},
+            }
+
+    def to_prometheus(self) -> str:
+        """Compteurs au format d'exposition texte de Prometheus (durées en secondes)."""
+        with self._lock:
+            hosts = {host: (stats.requests, stats.bytes, stats.failures, stats.timeouts, stats.cache_hits,
+                            stats.revalidations, stats.latency_sum, list(stats.latencies))
+                     for host, stats in sorted(self.hosts.items())}
+            phases = {name: (stats.count, stats.failures, stats.total, list(stats.durations))
+                      for name, stats in sorted(self.phases.items())}
+            started = self.started
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        counters = (
+            ('maj_http_requests_total', 0, "Requêtes HTTP envoyées"),
+            ('maj_http_bytes_total', 1, "Octets reçus"),
+            ('maj_http_failures_total', 2, "Requêtes en échec (erreur HTTP, réseau ou délai dépassé)"),
+            ('maj_http_timeouts_total', 3, "Requêtes interrompues par un délai dépassé"),
+            ('maj_cache_hits_total', 4, "Requêtes évitées grâce à un cache"),
+            ('maj_cache_revalidations_total', 5, "Contenus en cache relus pour vérification"),
+        )
+        for name, index, help_text in counters:
+            family(name, 'counter', help_text)
+            for host, values in hosts.items():
+                lines.append(f'{name}{{host="{_label(host)}"}} {values[index]}')
+        family('maj_http_request_duration_seconds', 'summary', "Durée des requêtes HTTP")
+        for host, values in hosts.items():
+            _summary(lines, 'maj_http_request_duration_seconds', f'host="{_label(host)}"', values[7], values[6], values[0])
+        family('maj_phase_duration_seconds', 'summary', "Durée des phases (scan, catalogue, installation…)")
+        for name, (count, _failures, total, durations) in phases.items():
+            _summary(lines, 'maj_phase_duration_seconds', f'phase="{_label(name)}"', durations, total, count)
+        family('maj_phase_failures_total', 'counter', "Phases terminées par une erreur")
+        for name, (_count, failures, _total, _durations) in phases.items():
+            lines.append(f'maj_phase_failures_total{{phase="{_label(name)}"}} {failures}')
+        family('maj_session_start_time_seconds', 'gauge', "Début de la session (horodatage Unix)")
+        lines.append(f"maj_session_start_time_seconds {started:.3f}")
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path: str, prometheus: bool | None = None) -> str:
+        """Écrit les compteurs dans `path` ; retourne le chemin.
+
+        Format Prometheus si `prometheus` est vrai, JSON s'il est faux ; par défaut, selon
+        l'extension du fichier (.prom ou autre).
+        """
+        from core import paths
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        if prometheus is None:
+            prometheus = path.endswith(PROMETHEUS_SUFFIX)
+        if prometheus:
+            paths.write_text_atomic(path, self.to_prometheus())
+        else:
+            paths.write_json_atomic(path, self.snapshot())
+        return path
+
+
+def _label(value: str) -> str:
+    """Valeur d'étiquette Prometheus échappée."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _summary(lines: list[str], name: str, labels: str, samples: list[float], total: float, count: int) -> None:
+    ordered = sorted(samples)
+    for q in QUANTILES:
+        if ordered:
+            lines.append(f'{name}{{{labels},quantile="{q}"}} {_quantile(ordered, q):.6f}')
+    lines.append(f"{name}_sum{{{labels}}} {total:.6f}")
+    lines.append(f"{name}_count{{{labels}}} {count}")
+
+
+_registry = Registry()
+
+
+def get_registry() -> Registry:
+    """Registre du processus, alimenté par le cœur et lu par l'onglet Diagnostic."""
+    return _registry
+
+
+def request(url: str) -> AbstractContextManager[_Request]:
+    return _registry.request(url)
+
+
+def phase(name: str) -> AbstractContextManager[_Phase]:
+    return _registry.phase(name)
+
+
+def cache_hit(host: str, count: int = 1) -> None:
+    _registry.cache_hit(host, count)
+
+
+def revalidation(host: str, count: int = 1) -> None:
+    _registry.revalidation(host, count)
+
+
+def _export_at_exit(path: str) -> None:
+    try:
+        _registry.export(path)
+    except OSError as e:
+        print(f"[Maj] Métriques non écrites : {e}", file=sys.stderr)
+
+
+# MAJ_METRICS=<chemin du fichier> : export à la sortie du programme
+_env = os.environ.get(ENV_VAR, '')
+if _env and _env != '0':
+    atexit.register(_export_at_exit, _env)
@@ -0,0 +1,84 @@
+"""Accès réseau partagé : contexte SSL, lectures JSON et téléchargements en flux."""
+import json
+from typing import TYPE_CHECKING, Any, BinaryIO
+from core.integrity import stream_copy
+from core import metrics, tracing
+
+if TYPE_CHECKING:
+    import ssl
+    from core.progress import Progress
+
+
+def create_ssl_context() -> 'ssl.SSLContext':
+    """Crée un contexte SSL sans vérification de certificats."""
+    # ssl et urllib sont importés à la première requête : les commandes sans réseau démarrent plus vite
+    import ssl
+    with tracing.span('ssl_context', 'http'):
+        ctx = ssl.create_default_context()
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+def _trace_dns(url: str) -> None:
+    """Traces activées : résolution du nom d'hôte mesurée à part (urllib ne la distingue pas)."""
+    import socket
+    from urllib.parse import urlsplit
+    parts = urlsplit(url)
+    if not parts.hostname:
+        return
+    with tracing.span('dns', 'http', host=parts.hostname):
+        try:
+            socket.getaddrinfo(parts.hostname, parts.port or (443 if parts.scheme == 'https' else 80))
+        except OSError:
+            pass
+
+
+def _open(url: str, timeout: float) -> Any:
+    """Ouvre `url` ; le span « open » couvre connexion, TLS, requête et en-têtes de réponse."""
+    import urllib.request
+    if tracing.enabled():
+        _trace_dns(url)
+    context = create_ssl_context()
+    with tracing.span('open', 'http', url=url) as sp:
+        response = urllib.request.urlopen(url, timeout=timeout, context=context)
+        sp.set(status=response.status)
+    return response
+
+
+def fetch_bytes(url: str, timeout: float = 5) -> bytes:
+    """Télécharge le contenu complet d'une URL (petits fichiers : Info.json, listes)."""
+    with metrics.request(url) as measured, tracing.span('GET', 'http', url=url):
+        with _open(url, timeout) as response:
+            with tracing.span('read', 'http') as sp:
+                data = response.read()
+                sp.set(bytes=len(data))
+            measured.bytes = len(data)
+            return data
+
+
+def fetch_json(url: str, timeout: float = 5) -> Any:
+    """Télécharge et décode un fichier JSON."""
+    return json.loads(fetch_bytes(url, timeout).decode('utf-8'))
+
+
+def download_to_file(url: str, fileobj: BinaryIO, timeout: float = 15, progress: 'Progress | None' = None) -> tuple[str, int]:
+    """Télécharge `url` dans `fileobj` par blocs, en calculant le SHA-256 au fil de l'eau.
+
+    Le fichier est vidé avant l'écriture pour qu'un essai précédent (autre branche)
+    ne laisse pas de données résiduelles. `progress` reçoit les octets reçus, sur le
+    total annoncé par Content-Length s'il existe. Retourne (empreinte, taille).
+    """
+    fileobj.seek(0)
+    fileobj.truncate()
+    with metrics.request(url) as measured, tracing.span('download', 'http', url=url), _open(url, timeout) as response:
+        with tracing.span('read', 'http') as sp:
+            if progress is None:
+                digest, size = stream_copy(response, fileobj)
+            else:
+                length = response.headers.get('Content-Length')
+                progress.total = int(length) if length and length.isdigit() else None
+                digest, size = stream_copy(response, fileobj, progress.advance)
+            sp.set(bytes=size)
+        measured.bytes = size
+        return digest, size
@@ -0,0 +1,48 @@
+"""Chemins partagés : dossier data/ et dossier d'extensions utilisateur d'Inkscape."""
+import os
+import sys
+from typing import Any
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+
+
+def data_path(name: str, data_dir: str | None = None) -> str:
+    """Chemin d'un fichier du dossier data/ (ou d'un autre dossier d'état)."""
+    return os.path.join(data_dir or DATA_DIR, name)
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """Écrit `data` en JSON de façon atomique (voir `write_text_atomic`)."""
+    import json
+    write_text_atomic(path, json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def write_text_atomic(path: str, text: str) -> None:
+    """Écrit `text` dans un fichier temporaire du même dossier puis le renomme.
+
+    os.replace est atomique : une interruption laisse l'ancien fichier intact, jamais un
+    fichier tronqué.
+    """
+    import threading
+    tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def inkscape_extensions_dir() -> str:
+    """Dossier d'extensions utilisateur d'Inkscape selon l'OS."""
+    if sys.platform.startswith('win'):
+        user_dir = os.path.expandvars(r'%APPDATA%')
+        return os.path.join(user_dir, 'Inkscape', 'extensions')
+    user_dir = os.path.expanduser('~')
+    return os.path.join(user_dir, '.config', 'inkscape', 'extensions')
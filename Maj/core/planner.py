@@ -0,0 +1,291 @@
+"""Planification d'une installation : différence exacte entre l'archive et le dossier cible.
+
+Le plan est calculé sans rien écrire sur le disque, puis sert tel quel à l'exécution :
+les fichiers identiques (même taille, même empreinte) ne sont ni supprimés ni recopiés.
+"""
+import json
+import os
+from typing import TYPE_CHECKING, Any
+from i18n import _
+from core import integrity, tracing
+
+if TYPE_CHECKING:
+    import zipfile
+    from core.progress import Progress
+
+ADD = 'add'
+REPLACE = 'replace'
+DELETE = 'delete'
+KEEP = 'keep'
+ACTIONS = (ADD, REPLACE, DELETE, KEEP)
+
+
+class FileOp:
+    """Opération sur un fichier du dossier cible."""
+    __slots__ = ('action', 'rel', 'dest', 'member', 'size', 'sha256')
+
+    def __init__(self, action: str, rel: str, dest: str, member: str | None, size: int, sha256: str | None = None) -> None:
+        self.action = action
+        self.rel = rel
+        self.dest = dest
+        self.member = member
+        self.size = size
+        self.sha256 = sha256
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'action': self.action, 'path': self.rel, 'size': self.size}
+
+
+class TargetPlan:
+    """Plan d'un élément de la clé `download` (dossier ou fichier)."""
+
+    def __init__(self, item: str, dest: str, is_dir: bool) -> None:
+        self.item = item
+        self.dest = dest
+        self.is_dir = is_dir
+        self.missing = False
+        self.ops: list[FileOp] = []
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'item': self.item,
+            'dest': self.dest,
+            'missing': self.missing,
+            'files': [op.to_dict() for op in self.ops],
+        }
+
+
+class InstallPlan:
+    """Ensemble des opérations d'une installation ou d'une mise à jour."""
+
+    def __init__(self, dest_base: str) -> None:
+        self.dest_base = dest_base
+        self.targets: list[TargetPlan] = []
+
+    def ops(self) -> list[FileOp]:
+        return [op for target in self.targets for op in target.ops]
+
+    def summary(self) -> dict[str, dict[str, int]]:
+        """Nombre de fichiers et d'octets par action."""
+        result = {action: {'count': 0, 'bytes': 0} for action in ACTIONS}
+        for op in self.ops():
+            result[op.action]['count'] += 1
+            result[op.action]['bytes'] += op.size
+        return result
+
+    def has_changes(self) -> bool:
+        return any(op.action != KEEP for op in self.ops())
+
+    def copy_totals(self) -> tuple[int, int]:
+        """(octets, fichiers) que `apply_plan` va extraire de l'archive."""
+        copied = [op for target in self.targets if not target.missing for op in target.ops if op.action in (ADD, REPLACE)]
+        return sum(op.size for op in copied), len(copied)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'dest_base': self.dest_base, 'summary': self.summary(), 'targets': [t.to_dict() for t in self.targets]}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+
+    def describe(self) -> str:
+        """Résumé lisible pour le journal."""
+        s = self.summary()
+        return _("Plan : {add} ajout(s) ({add_b} o), {rep} remplacement(s) ({rep_b} o), {dele} suppression(s) ({dele_b} o), {keep} inchangé(s) ({keep_b} o)").format(
+            add=s[ADD]['count'], add_b=s[ADD]['bytes'],
+            rep=s[REPLACE]['count'], rep_b=s[REPLACE]['bytes'],
+            dele=s[DELETE]['count'], dele_b=s[DELETE]['bytes'],
+            keep=s[KEEP]['count'], keep_b=s[KEEP]['bytes'])
+
+
+def download_items(ext: dict[str, Any]) -> list[str]:
+    """Retourne la clé `download` sous forme de liste (elle peut être une chaîne)."""
+    download: Any = ext.get('download') or []
+    return [download] if isinstance(download, str) else [str(d) for d in download]  # type: ignore[union-attr]
+
+
+def install_base_dir(ext: dict[str, Any]) -> str:
+    """Dossier parent dans lequel les éléments `download` d'une extension installée sont copiés.
+
+    `Installed_dir` pointe sur le dossier du Info.json retenu, qui peut être
+    `<extension>/locale/<lang>/LC_MESSAGES` : on remonte au dossier de l'extension,
+    puis à son parent si son nom est celui du dossier téléchargé.
+    """
+    path = os.path.normpath(str(ext.get('Installed_dir', '')))
+    parts = path.split(os.sep)
+    if len(parts) >= 3 and parts[-1] == 'LC_MESSAGES' and parts[-3] == 'locale':
+        path = os.sep.join(parts[:-3])
+    folders = [item.rstrip('/') for item in download_items(ext) if item.endswith('/')]
+    if folders and os.path.basename(path) == os.path.basename(folders[0]):
+        path = os.path.dirname(path)
+    return path
+
+
+def find_archive_root(zf: 'zipfile.ZipFile', preferred: str) -> str:
+    """Dossier racine de l'archive (<repo>-<branche> sur GitHub, variable ailleurs)."""
+    names = zf.namelist()
+    if any(n.startswith(preferred + '/') for n in names):
+        return preferred
+    tops = {n.split('/', 1)[0] for n in names if '/' in n}
+    return tops.pop() if len(tops) == 1 else ''
+
+
+def _member_sha256(zf: 'zipfile.ZipFile', member: str) -> str:
+    digest = integrity.new_sha256()
+    with zf.open(member) as f:
+        for chunk in iter(lambda: f.read(integrity.CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _dest_sha256(path: str, st: os.stat_result, known: dict[str, Any] | None) -> str:
+    # Empreinte enregistrée à l'installation, valable si le fichier n'a pas bougé
+    if known and known.get('size') == st.st_size and known.get('mtime_ns') == st.st_mtime_ns:
+        return str(known.get('sha256'))
+    return integrity.sha256_file(path)
+
+
+def _members_under(zf: 'zipfile.ZipFile', prefix: str) -> dict[str, 'zipfile.ZipInfo']:
+    result: dict[str, 'zipfile.ZipInfo'] = {}
+    for info in zf.infolist():
+        if info.is_dir() or not info.filename.startswith(prefix):
+            continue
+        result[info.filename[len(prefix):]] = info
+    return result
+
+
+def _safe_dest(base: str, rel: str) -> str:
+    """Chemin de destination de `rel` sous `base` ; lève IntegrityError si le nom du membre
+    de l'archive sortirait de `base` (composant « .. », chemin absolu, lecteur Windows)."""
+    parts = rel.replace('\\', '/').split('/')
+    if (not rel or rel.startswith('/') or '..' in parts
+            or os.path.isabs(rel) or os.path.splitdrive(rel)[0] or ':' in parts[0]):
+        raise integrity.IntegrityError(_("Chemin refusé dans l'archive : {path}").format(path=rel))
+    dest = os.path.join(base, *parts)
+    real_base = os.path.realpath(base)
+    real_dest = os.path.realpath(dest)
+    if os.path.commonpath([real_base, real_dest]) != real_base:
+        raise integrity.IntegrityError(_("Chemin refusé dans l'archive : {path}").format(path=rel))
+    return dest
+
+
+def verify_members(zf: 'zipfile.ZipFile', prefix: str, checksums: Any) -> None:
+    """Vérifie les membres de l'archive contre une clé `checksums` ({chemin: sha256})."""
+    if not isinstance(checksums, dict):
+        return
+    for rel, expected in checksums.items():  # type: ignore[union-attr]
+        member = prefix + str(rel)
+        try:
+            zf.getinfo(member)
+        except KeyError:
+            raise integrity.IntegrityError(_("Fichier manquant dans l'archive : {path}").format(path=rel))
+        integrity.check_checksum(_member_sha256(zf, member), expected, str(rel))
+
+
+def _plan_file(zf: 'zipfile.ZipFile', info: 'zipfile.ZipInfo', rel: str, dest: str, known: dict[str, Any] | None) -> FileOp:
+    try:
+        st = os.stat(dest)
+    except OSError:
+        return FileOp(ADD, rel, dest, info.filename, info.file_size)
+    if st.st_size == info.file_size:
+        member_sha = _member_sha256(zf, info.filename)
+        if member_sha == _dest_sha256(dest, st, known):
+            return FileOp(KEEP, rel, dest, info.filename, info.file_size, member_sha)
+    return FileOp(REPLACE, rel, dest, info.filename, info.file_size)
+
+
+def build_plan(zf: 'zipfile.ZipFile', root: str, download: list[str], dest_base: str, hashes: integrity.InstalledHashes | None = None, progress: 'Progress | None' = None) -> InstallPlan:
+    """Compare les éléments `download` de l'archive avec le dossier cible, sans rien écrire.
+
+    `progress` compte les fichiers de l'archive comparés. Lève IntegrityError si un
+    Info.json de l'archive déclare des `checksums` non respectés, ou si un nom de membre
+    sortirait du dossier cible : le plan est alors abandonné avant toute écriture.
+    """
+    plan = InstallPlan(dest_base)
+    prefix_root = root + '/' if root else ''
+    recorded = hashes.data if hashes else {}
+    for item in download:
+        if item.endswith('/'):
+            name = os.path.basename(item.rstrip('/'))
+            target = TargetPlan(item, os.path.join(dest_base, name), True)
+            prefix = prefix_root + item
+            members = _members_under(zf, prefix)
+            if not members:
+                target.missing = True
+                plan.targets.append(target)
+                continue
+            if 'Info.json' in members:
+                with zf.open(members['Info.json']) as f:
+                    verify_members(zf, prefix, json.load(f).get('checksums'))
+            known = recorded.get(os.path.normpath(target.dest), {})
+            for rel, info in sorted(members.items()):
+                dest = _safe_dest(target.dest, rel)
+                target.ops.append(_plan_file(zf, info, rel, dest, known.get(rel)))
+                if progress:
+                    progress.advance(info.file_size, files=1)
+            # Fichiers présents dans le dossier cible mais absents de l'archive
+            if os.path.isdir(target.dest):
+                for dirpath, _dirs, files in os.walk(target.dest):
+                    for fname in files:
+                        full = os.path.join(dirpath, fname)
+                        rel = os.path.relpath(full, target.dest).replace('\\', '/')
+                        if rel in members:
+                            continue
+                        size = os.path.getsize(full)
+                        # Un Info.json local est conservé si l'archive n'en fournit pas
+                        action = KEEP if rel == 'Info.json' else DELETE
+                        target.ops.append(FileOp(action, rel, full, None, size))
+        else:
+            name = os.path.basename(item)
+            target = TargetPlan(item, dest_base, False)
+            try:
+                info = zf.getinfo(prefix_root + item)
+            except KeyError:
+                target.missing = True
+                plan.targets.append(target)
+                continue
+            known = recorded.get(os.path.normpath(dest_base), {})
+            target.ops.append(_plan_file(zf, info, name, _safe_dest(dest_base, name), known.get(name)))
+            if progress:
+                progress.advance(info.file_size, files=1)
+        plan.targets.append(target)
+    return plan
+
+
+def apply_plan(zf: 'zipfile.ZipFile', plan: InstallPlan, hashes: integrity.InstalledHashes, progress: 'Progress | None' = None) -> None:
+    """Exécute le plan : extrait uniquement les fichiers ajoutés ou remplacés, supprime les
+    fichiers obsolètes et enregistre les empreintes de tous les fichiers conservés ou copiés.
+
+    `progress` reçoit les octets et les fichiers écrits (voir `InstallPlan.copy_totals`).
+    """
+    for target in plan.targets:
+        if target.missing:
+            continue
+        manifest: dict[str, dict[str, Any]] = {}
+        for op in target.ops:
+            if op.action == DELETE:
+                try:
+                    os.remove(op.dest)
+                except OSError:
+                    pass
+                continue
+            if op.action == KEEP:
+                if op.member is not None and op.sha256:
+                    st = os.stat(op.dest)
+                    manifest[op.rel] = {'sha256': op.sha256, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+                continue
+            os.makedirs(os.path.dirname(op.dest), exist_ok=True)
+            assert op.member is not None
+            with tracing.span('copy', 'file', file=op.rel, bytes=op.size), zf.open(op.member) as fsrc, open(op.dest, 'wb') as fdst:
+                sha, size = integrity.stream_copy(fsrc, fdst, progress.advance if progress else None)
+            if progress:
+                progress.advance(files=1)
+            manifest[op.rel] = {'sha256': sha, 'size': size, 'mtime_ns': os.stat(op.dest).st_mtime_ns}
+        if target.is_dir:
+            # Supprimer les dossiers devenus vides
+            for dirpath, _dirs, _files in os.walk(target.dest, topdown=False):
+                if dirpath != target.dest and not os.listdir(dirpath):
+                    try:
+                        os.rmdir(dirpath)
+                    except OSError:
+                        pass
+        hashes.record(target.dest, manifest, replace=target.is_dir)
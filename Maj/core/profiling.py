@@ -0,0 +1,135 @@
+"""Profilage cProfile de chaque action de l'utilisateur, activé à la demande.
+
+    MAJ_PROFILE=1 python Maj.py                  -> data/profiles/
+    MAJ_PROFILE=/tmp/profils python Maj.py update --all
+
+ou, sans variable d'environnement (Maj lancé depuis Inkscape), la clé cachée
+`"profiling": true` dans Params[0] de config.json.
+
+Chaque action (démarrage, ouverture d'onglet, opération de fond : scan, installation,
+mise à jour, suppression…, commande de la ligne de commande) est exécutée sous
+cProfile. Un fichier <date>-<pid>-<numéro>-<action>.pstats est écrit par action (à
+lire avec `python -m pstats` ou snakeviz) et un résumé des fonctions les plus
+coûteuses est envoyé au journal.
+
+Une action lancée pendant une autre dans le même thread fait partie du profil de la
+première. Désactivé (cas normal), `action` ne fait rien : cProfile et pstats ne sont
+pas importés.
+"""
+import itertools
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterator
+
+if TYPE_CHECKING:
+    import cProfile
+
+ENV_VAR = 'MAJ_PROFILE'
+PROFILES_DIR = 'profiles'
+# Fonctions citées dans le résumé envoyé au journal
+TOP_FUNCTIONS = 8
+
+Reporter = Callable[[str, bool], None]
+
+_directory: str | None = None
+_reporter: Reporter | None = None
+_ids = itertools.count(1)
+# Profil en cours dans le thread courant (les actions imbriquées y sont incluses)
+_local = threading.local()
+
+
+def _print_report(message: str, erreur: bool = False) -> None:
+    print(message, file=sys.stderr)
+
+
+def enable(directory: str | None = None) -> str:
+    """Active le profilage ; les fichiers .pstats sont écrits dans `directory` (data/profiles/)."""
+    global _directory
+    if _directory is None:
+        if not directory:
+            from core import paths
+            directory = paths.data_path(PROFILES_DIR)
+        _directory = directory
+    return _directory
+
+
+def enabled() -> bool:
+    return _directory is not None
+
+
+def set_reporter(reporter: Reporter | None) -> None:
+    """Destination des résumés (`reporter(message, erreur)`, appelé depuis le thread de l'action) ;
+    par défaut la sortie d'erreur."""
+    global _reporter
+    _reporter = reporter
+
+
+def _report(message: str, erreur: bool = False) -> None:
+    (_reporter or _print_report)(message, erreur)
+
+
+def _file_name(name: str) -> str:
+    slug = re.sub(r'[^\w.-]+', '_', name, flags=re.UNICODE).strip('_')[:60] or 'action'
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_ids):03d}-{slug}.pstats"
+
+
+def summarize(profile: 'cProfile.Profile', limit: int = TOP_FUNCTIONS) -> list[str]:
+    """Fonctions au temps propre le plus élevé : « temps propre (cumulé, appels) fichier:ligne fonction »."""
+    import pstats
+    stats = pstats.Stats(profile)
+    entries = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)  # type: ignore[attr-defined]
+    lines: list[str] = []
+    for (filename, line, function), (_cc, calls, own, cumulative, _callers) in entries[:limit]:
+        where = f"{os.path.basename(filename)}:{line} " if line else ''
+        lines.append(f"  {own * 1000:8.1f} ms  (cumul {cumulative * 1000:.1f} ms, {calls}×)  {where}{function}")
+    return lines
+
+
+def _write(profile: 'cProfile.Profile', name: str, elapsed: float) -> None:
+    assert _directory is not None
+    import pstats
+    try:
+        os.makedirs(_directory, exist_ok=True)
+        path = os.path.join(_directory, _file_name(name))
+        profile.dump_stats(path)
+    except OSError as e:
+        _report(f"[profil] {name} : fichier non écrit ({e})", True)
+        return
+    calls = pstats.Stats(profile).total_calls  # type: ignore[attr-defined]
+    header = f"[profil] {name} : {elapsed * 1000:.0f} ms, {calls} appels -> {path}"
+    _report("\n".join([header, *summarize(profile)]))
+
+
+@contextmanager
+def action(name: str) -> Iterator[None]:
+    """`with action('install X'):` – profile le bloc si le profilage est activé."""
+    if _directory is None or getattr(_local, 'active', False):
+        yield
+        return
+    import cProfile
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError as e:
+        # Un autre profileur est déjà actif (autre thread sous Python 3.12+, débogueur…)
+        _report(f"[profil] {name} : non profilé ({e})", True)
+        yield
+        return
+    _local.active = True
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.disable()
+        _local.active = False
+        _write(profile, name, time.perf_counter() - started)
+
+
+# MAJ_PROFILE=1 (dossier data/profiles) ou MAJ_PROFILE=<dossier>
+_env = os.environ.get(ENV_VAR, '')
+if _env and _env != '0':
+    enable(None if _env == '1' else _env)
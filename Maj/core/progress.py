@@ -0,0 +1,109 @@
+"""Avancement des opérations longues (téléchargement, copie) avec débit et temps restant.
+
+Le cœur émet des événements PROGRESS (voir core.events) ; l'interface ou la ligne de
+commande les affichent comme elles le souhaitent. Les émissions sont espacées
+d'au moins `min_interval` secondes pour ne pas saturer la file de l'interface.
+"""
+import time
+from typing import Any, Callable
+
+from i18n import _
+from core.events import PROGRESS
+
+# Phases d'une installation
+DOWNLOAD = 'download'
+PLAN = 'plan'
+COPY = 'copy'
+
+
+def phase_label(phase: str) -> str:
+    return {
+        DOWNLOAD: _("Téléchargement"),
+        PLAN: _("Comparaison"),
+        COPY: _("Copie"),
+    }.get(phase, phase)
+
+
+def format_size(size: float) -> str:
+    if abs(size) < 1024:
+        return f"{size:.0f} o"
+    for unit in ("Ko", "Mo"):
+        size /= 1024
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+    return f"{size / 1024:.1f} Go"
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds} s"
+    return f"{seconds // 60} min {seconds % 60:02d} s"
+
+
+class Progress:
+    """Compteur d'une phase : octets (ou éléments) traités, fichiers traités, débit et temps restant."""
+
+    def __init__(self, emit: Callable[..., None], phase: str, total: int | None = None, files_total: int | None = None, name: str = '', min_interval: float = 0.1) -> None:
+        self._emit = emit
+        self.phase = phase
+        self.total = total
+        self.files_total = files_total
+        self.name = name
+        self.min_interval = min_interval
+        self.done = 0
+        self.files = 0
+        self.started = time.perf_counter()
+        self._last_emit = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self) -> float:
+        """Débit moyen depuis le début de la phase (unités par seconde)."""
+        elapsed = self.elapsed
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """Temps restant estimé en secondes (None si le total est inconnu)."""
+        rate = self.rate
+        if not self.total or rate <= 0:
+            return None
+        return max(0.0, (self.total - self.done) / rate)
+
+    def advance(self, amount: int = 0, files: int = 0) -> None:
+        self.done += amount
+        self.files += files
+        now = time.perf_counter()
+        if now - self._last_emit >= self.min_interval:
+            self._last_emit = now
+            self._send(False)
+
+    def finish(self) -> None:
+        self._send(True)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'phase': self.phase, 'name': self.name,
+            'done': self.done, 'total': self.total,
+            'files': self.files, 'files_total': self.files_total,
+            'rate': round(self.rate, 1), 'eta': self.eta,
+            'elapsed': round(self.elapsed, 3),
+        }
+
+    def describe(self) -> str:
+        """Texte court : « Téléchargement : 1.2 Mo / 3.4 Mo – 850.0 Ko/s – reste 3 s »."""
+        parts = [format_size(self.done) + (f" / {format_size(self.total)}" if self.total else "")]
+        if self.files_total:
+            parts.append(_("{files}/{files_total} fichiers").format(files=self.files, files_total=self.files_total))
+        parts.append(f"{format_size(self.rate)}/s")
+        eta = self.eta
+        if eta:
+            parts.append(_("reste {eta}").format(eta=format_duration(eta)))
+        return f"{phase_label(self.phase)} : " + " – ".join(parts)
+
+    def _send(self, finished: bool) -> None:
+        self._emit(PROGRESS, self.describe(), finished=finished, **self.to_dict())
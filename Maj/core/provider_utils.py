@@ -17,6 +17,12 @@ class ProviderUtils:
                 return provider
         return None
 
+    def file_host(self, repo_url: str) -> str:
+        """Hôte qui sert les fichiers bruts du dépôt (clé des compteurs de core.metrics)."""
+        from core.metrics import host_of
+        provider = self.get_provider_for_url(repo_url)
+        return host_of(provider["download_file_url"] if provider else repo_url)
+
     def split_repo_url(self, repo_url: str, provider: dict[str, Any]) -> tuple[str, str]:
         """Extrait owner et repo depuis l'URL du dépôt."""
         base: str = provider["main_url"].split("{owner}")[0]
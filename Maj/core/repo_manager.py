@@ -1,25 +1,197 @@
 """Gestion des dépôts d'extensions (GitHub, ZIP, local)."""
 import json
+from typing import Any
+import i18n
 from i18n import _
 from core.config import Config
+from core.events import EventCallback, EventEmitter
+from core.provider_utils import ProviderUtils
+from core.network import fetch_json
+from core import metrics, paths, tracing
+from core.translations import LISTING, LISTING_KEYS, get_store, pick, translated_path
 
-class RepoManager:
-    def __init__(self, config: Config):
+# Clés conservées pour chaque extension du catalogue
+CATALOG_KEYS = [
+    "name", "short_description", "subject", "author",
+    "version", "default_install_dir", "compatibility",
+    "repos", "download", "start_here", "sha256"
+]
+
+
+class RepoManager(EventEmitter):
+    """Dépôts configurés et catalogue des extensions installables, sans interface graphique."""
+
+    def __init__(self, config: Config, on_event: EventCallback | None = None) -> None:
+        super().__init__(on_event)
         self.config = config
+        self.provider_utils = ProviderUtils(config)
+        self.catalog_path = paths.data_path('installable_extensions.json')
+        # Variantes traduites des catalogues, pour changer de langue sans retélécharger
+        self.translations = get_store()
         self.repos = self.load_repos()
 
-    def load_repos(self):
-        # TODO: Charger la liste des dépôts depuis la config
-        return []
+    def load_repos(self) -> list[str]:
+        """Liste des dépôts configurés."""
+        return self.config.repos
+
+    def add_repo(self, repo: str) -> bool:
+        """Ajoute un dépôt à la configuration. Retourne False s'il est vide ou déjà présent."""
+        repo = repo.strip()
+        if not repo or repo in self.config.repos:
+            return False
+        self.config.repos.append(repo)
+        self.config.schedule_save()
+        self.log(_("Dépôt ajouté : {repo}").format(repo=repo))
+        return True
+
+    def remove_repo(self, repo: str) -> bool:
+        """Retire un dépôt de la configuration."""
+        if repo not in self.config.repos:
+            return False
+        self.config.repos.remove(repo)
+        self.config.schedule_save()
+        self.log(_("Dépôt supprimé : {repo}").format(repo=repo))
+        return True
+
+    def fetch_repo_extensions(self, repo_url: str) -> list[dict[str, Any]] | None:
+        """Télécharge list_of_inkscape_extensions.json d'un dépôt et ses traductions.
+
+        Toutes les langues de l'interface sont téléchargées et mises en cache (voir
+        core.translations) ; le résultat est dans la langue courante. Retourne None si le
+        dépôt n'a pas pu être lu.
+        """
+        with tracing.span('catalog', 'provider', repo=repo_url) as sp, metrics.phase('catalog'):
+            extensions = self._fetch_repo_extensions(repo_url)
+            sp.set(extensions=None if extensions is None else len(extensions))
+            return extensions
+
+    def _fetch_repo_extensions(self, repo_url: str) -> list[dict[str, Any]] | None:
+        provider = self.provider_utils.get_provider_for_url(repo_url)
+        if not provider:
+            self.log(f"Provider inconnu pour : {repo_url}", erreur=True)
+            return None
+
+        owner, repo = self.provider_utils.split_repo_url(repo_url, provider)
+
+        # Tester toutes les branches possibles
+        for branch in provider["alternative_main_branch"]:
+            url_json = self.provider_utils.build_file_url(provider, owner, repo, branch, LISTING)
+            try:
+                ext_list = fetch_json(url_json)
+            except Exception:
+                continue
+            ext_items: list[Any] = ext_list['extensions'] if isinstance(ext_list, dict) and 'extensions' in ext_list else []  # type: ignore[assignment]
+            # Texte racine (langue par défaut), pour revenir au français sans retélécharger
+            self.translations.put(repo_url, LISTING, i18n.DEFAULT_LANG, {
+                str(ext['repos']): pick(ext, LISTING_KEYS) for ext in ext_items if ext.get('repos')
+            })
+
+            # Versions traduites, clé = URL du dépôt de l'extension
+            for lang in i18n.available_languages():
+                if lang == i18n.DEFAULT_LANG:
+                    continue
+                url_translated = self.provider_utils.build_file_url(provider, owner, repo, branch, translated_path(LISTING, lang))
+                try:
+                    tr_list = fetch_json(url_translated)
+                except Exception:
+                    continue  # Pas de traduction disponible (la variante déjà en cache est gardée)
+                tr_items: list[Any] = tr_list.get('extensions', []) if isinstance(tr_list, dict) else []  # type: ignore[assignment]
+                self.translations.put(repo_url, LISTING, lang, {
+                    str(tr_ext['repos']): pick(tr_ext, LISTING_KEYS) for tr_ext in tr_items if tr_ext.get('repos')
+                })
+
+            repo_extensions = [{key: ext[key] for key in CATALOG_KEYS if key in ext} for ext in ext_items]
+            # Traductions de la langue courante, tri alphabétique par name
+            return self.translations.localize_listing(repo_url, repo_extensions, i18n.lang_code)
+        return None
+
+    def fetch_all(self, repos: list[str]) -> list[list[dict[str, Any]] | None]:
+        """Télécharge en parallèle le catalogue de chaque dépôt (None si injoignable)."""
+        if not repos:
+            return []
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(repos))) as pool:
+            return list(pool.map(self.fetch_repo_extensions, repos))
+
+    def list_extensions(self) -> dict[str, list[dict[str, Any]]]:
+        """Télécharge le catalogue de tous les dépôts configurés (clé = URL du dépôt),
+        l'enregistre dans installable_extensions.json et met à jour la liste des sujets."""
+        extensions_by_repo: dict[str, list[dict[str, Any]]] = {}
+        repos = list(self.config.repos)
+        for repo_url, repo_extensions in zip(repos, self.fetch_all(repos)):
+            if repo_extensions is None:
+                self.log(f"Aucune extension trouvée pour {repo_url}", erreur=True)
+                repo_extensions = []
+            extensions_by_repo[repo_url] = repo_extensions
+
+        self.save_catalog(extensions_by_repo)
+        self.save_subjects(extract_subjects(extensions_by_repo))
+        self.translations.save()
+        return extensions_by_repo
+
+    def revalidate_catalog(self, cached: dict[str, list[dict[str, Any]]] | None = None) -> tuple[dict[str, list[dict[str, Any]]], list[str]]:
+        """Retélécharge le catalogue et le compare au dernier enregistré.
+
+        Retourne le catalogue à jour et les dépôts dont le contenu a changé (ajoutés, modifiés
+        ou retirés). Un dépôt injoignable garde son contenu enregistré. Le fichier n'est
+        réécrit que si quelque chose a changé.
+        """
+        if cached is None:
+            cached = self.load_catalog()
+        repos = list(self.config.repos)
+        for repo_url in repos:
+            if repo_url in cached:
+                metrics.revalidation(self.provider_utils.file_host(repo_url))
+        catalog: dict[str, list[dict[str, Any]]] = {}
+        for repo_url, repo_extensions in zip(repos, self.fetch_all(repos)):
+            if repo_extensions is None:
+                self.log(_("Dépôt injoignable, dernier catalogue conservé : {repo}").format(repo=repo_url), erreur=True)
+                repo_extensions = cached.get(repo_url, [])
+            catalog[repo_url] = repo_extensions
+        changed = [repo for repo in repos if catalog[repo] != cached.get(repo)]
+        changed += [repo for repo in cached if repo not in catalog]
+        if changed or list(cached) != repos:
+            self.save_catalog(catalog)
+            self.save_subjects(extract_subjects(catalog))
+        self.translations.save()
+        return catalog, changed
+
+    def load_catalog(self) -> dict[str, list[dict[str, Any]]]:
+        """Dernier catalogue enregistré (installable_extensions.json), dans la langue courante."""
+        try:
+            with open(self.catalog_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception:
+            return {}
+        return self.localize_catalog(data) if isinstance(data, dict) else {}  # type: ignore[arg-type]
+
+    def localize_catalog(self, extensions_by_repo: dict[str, list[dict[str, Any]]], lang: str | None = None) -> dict[str, list[dict[str, Any]]]:
+        """Catalogue traduit dans `lang` (langue courante par défaut) depuis le cache, sans accès réseau."""
+        lang = lang or i18n.lang_code
+        return {repo: self.translations.localize_listing(repo, exts, lang) for repo, exts in extensions_by_repo.items()}
+
+    def save_catalog(self, extensions_by_repo: dict[str, list[dict[str, Any]]]) -> None:
+        try:
+            paths.write_json_atomic(self.catalog_path, extensions_by_repo)
+        except Exception as e:
+            self.log(_("Erreur écriture installable_extensions.json: {e}").format(e=e), erreur=True)
+
+    def save_subjects(self, subjects_list: list[str]) -> None:
+        """Enregistre la liste des sujets dans la configuration (Params[0].subjects de config.json)."""
+        if subjects_list != self.config.subjects:
+            self.config.subjects = subjects_list
+            self.config.schedule_save()
 
-    def add_repo(self, repo):
-        # TODO: Ajouter un dépôt
-        pass
 
-    def remove_repo(self, repo):
-        # TODO: Supprimer un dépôt
-        pass
+def extract_subjects(extensions_by_repo: dict[str, list[dict[str, Any]]]) -> list[str]:
+    """Tous les sujets distincts du catalogue, triés."""
+    subjects_set: set[str] = set()
+    for repo_exts in extensions_by_repo.values():
+        for ext in repo_exts:
+            subj = ext.get('subject')
+            if isinstance(subj, list):
+                subjects_set.update(subj)  # type: ignore[arg-type]
+            elif subj:
+                subjects_set.add(subj)
+    return sorted(subjects_set)
 
-    def list_extensions(self):
-        # TODO: Lister les extensions valides dans chaque repo
-        return []
@@ -0,0 +1,145 @@
+"""Traces d'exécution au format Chrome « trace_event », activées à la demande.
+
+    MAJ_TRACE=1 python Maj.py                 -> data/trace-<date>-<pid>.json
+    MAJ_TRACE=/tmp/maj.json python Maj.py update --all
+
+Chaque `span` devient un événement complet (ph « X ») : nom, catégorie, début et durée en
+microsecondes, processus et thread, arguments. Le fichier est écrit à la sortie du
+programme et s'ouvre dans chrome://tracing ou https://ui.perfetto.dev.
+
+Désactivé (cas normal), `span` renvoie un objet partagé qui ne fait rien : le coût se
+limite à un appel de fonction et un test.
+"""
+import atexit
+import os
+import sys
+import threading
+import time
+from types import TracebackType
+from typing import Any
+
+ENV_VAR = 'MAJ_TRACE'
+
+
+class _NullSpan:
+    """Span inactif : aucun enregistrement."""
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None) -> None:
+        return None
+
+    def set(self, **args: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """Intervalle mesuré ; `set()` ajoute des arguments (statut, taille…) avant la fin."""
+    __slots__ = ('tracer', 'name', 'cat', 'args', 'start')
+
+    def __init__(self, tracer: 'Tracer', name: str, cat: str, args: dict[str, Any]) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = 0
+
+    def __enter__(self) -> 'Span':
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None) -> None:
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer.add(self.name, self.cat, self.start, end - self.start, self.args)
+
+    def set(self, **args: Any) -> None:
+        self.args.update(args)
+
+
+class Tracer:
+    """Événements enregistrés pendant l'exécution, exportés en JSON (`export`)."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._events: list[dict[str, Any]] = []
+        self._threads: set[int] = set()
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+        self._pid = os.getpid()
+
+    def add(self, name: str, cat: str, start_ns: int, duration_ns: int, args: dict[str, Any]) -> None:
+        tid = threading.get_ident()
+        event = {
+            'name': name, 'cat': cat, 'ph': 'X',
+            'ts': (start_ns - self._origin) / 1000, 'dur': duration_ns / 1000,
+            'pid': self._pid, 'tid': tid,
+        }
+        if args:
+            event['args'] = args
+        with self._lock:
+            if tid not in self._threads:
+                # Nom du thread affiché par le visualiseur (Tk, tâche de fond, pool…)
+                self._threads.add(tid)
+                self._events.append({'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': tid,
+                                     'args': {'name': threading.current_thread().name}})
+            self._events.append(event)
+
+    def export(self, path: str | None = None) -> str:
+        """Écrit le fichier de trace ; retourne son chemin."""
+        from core import paths
+        path = path or self.path
+        with self._lock:
+            events = list(self._events)
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        paths.write_json_atomic(path, {'traceEvents': events, 'displayTimeUnit': 'ms'})
+        return path
+
+
+_tracer: Tracer | None = None
+
+
+def enable(path: str | None = None) -> Tracer:
+    """Active l'enregistrement ; la trace est écrite dans `path` à la sortie du programme."""
+    global _tracer
+    if _tracer is None:
+        if not path:
+            from core import paths
+            path = paths.data_path(f"trace-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.json")
+        _tracer = Tracer(path)
+        atexit.register(_export_at_exit)
+    return _tracer
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def span(name: str, cat: str = 'maj', /, **args: Any) -> Span | _NullSpan:
+    """`with span('GET', 'http', url=url) as sp:` – ne fait rien si les traces sont désactivées."""
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return Span(tracer, name, cat, args)
+
+
+def _export_at_exit() -> None:
+    if _tracer is not None:
+        try:
+            print(f"[Maj] Trace : {_tracer.export()}", file=sys.stderr)
+        except OSError as e:
+            print(f"[Maj] Trace non écrite : {e}", file=sys.stderr)
+
+
+# MAJ_TRACE=1 (fichier dans data/) ou MAJ_TRACE=<chemin du fichier>
+_env = os.environ.get(ENV_VAR, '')
+if _env and _env != '0':
+    enable(None if _env == '1' else _env)
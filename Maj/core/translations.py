@@ -0,0 +1,114 @@
+"""Variantes traduites des listes d'extensions et des Info.json, gardées pour toutes les langues.
+
+Chaque variante est indexée par dépôt, chemin du fichier dans le dépôt et langue
+(« fr » pour le fichier racine, non traduit). Changer de langue se fait alors depuis
+ce cache, sans accès réseau ni nouveau scan. Le cache est enregistré dans
+data/translations_cache.json.
+"""
+import json
+import threading
+from typing import Any
+
+from i18n import DEFAULT_LANG
+from core import paths
+
+CACHE_FILE = 'translations_cache.json'
+# Fichier du catalogue de chaque dépôt (variante traduite : locale/<lang>/LC_MESSAGES/<même nom>)
+LISTING = 'list_of_inkscape_extensions.json'
+# Champs traduits d'une entrée du catalogue et d'un Info.json installé
+LISTING_KEYS = ('name', 'short_description', 'subject', 'start_here')
+INFO_KEYS = ('name', 'short_description')
+
+
+def translated_path(path: str, lang: str) -> str:
+    """Chemin de la variante `lang` de `path` dans le dépôt (`path` lui-même pour la langue par défaut)."""
+    if lang == DEFAULT_LANG:
+        return path
+    folder, _sep, name = path.rpartition('/')
+    prefix = f"{folder}/" if folder else ''
+    return f"{prefix}locale/{lang}/LC_MESSAGES/{name}"
+
+
+def pick(data: dict[str, Any], keys: tuple[str, ...]) -> dict[str, Any]:
+    return {key: data[key] for key in keys if key in data}
+
+
+class TranslationStore:
+    """Cache {dépôt: {chemin: {langue: valeur}}}, lu à la première demande, partagé entre threads."""
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path or paths.data_path(CACHE_FILE)
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, dict[str, Any]]] | None = None
+        self._dirty = False
+
+    def _loaded(self) -> dict[str, dict[str, dict[str, Any]]]:
+        if self._entries is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self._entries = data if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, repo: str, path: str, lang: str) -> Any:
+        with self._lock:
+            return self._loaded().get(repo, {}).get(path, {}).get(lang)
+
+    def put(self, repo: str, path: str, lang: str, value: Any) -> None:
+        with self._lock:
+            variants = self._loaded().setdefault(repo, {}).setdefault(path, {})
+            if variants.get(lang) != value:
+                variants[lang] = value
+                self._dirty = True
+
+    def languages(self, repo: str, path: str) -> list[str]:
+        with self._lock:
+            return sorted(self._loaded().get(repo, {}).get(path, {}))
+
+    def save(self) -> None:
+        """Écrit le cache s'il a changé depuis la dernière écriture."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            data = json.loads(json.dumps(self._entries))
+            self._dirty = False
+        paths.write_json_atomic(self.path, data)
+
+    # --- application d'une langue ------------------------------------------------
+
+    def localize_listing(self, repo: str, extensions: list[dict[str, Any]], lang: str) -> list[dict[str, Any]]:
+        """Catalogue d'un dépôt dans la langue `lang` (texte racine si la variante manque), trié par nom."""
+        base: dict[str, Any] = self.get(repo, LISTING, DEFAULT_LANG) or {}
+        translated: dict[str, Any] = (self.get(repo, LISTING, lang) or {}) if lang != DEFAULT_LANG else {}
+        if not base and not translated:
+            return extensions
+        result: list[dict[str, Any]] = []
+        for ext in extensions:
+            key = str(ext.get('repos', ''))
+            fields = {**base.get(key, {}), **translated.get(key, {})}
+            result.append({**ext, **fields} if fields else ext)
+        return sorted(result, key=lambda e: str(e.get('name', '')).lower())
+
+    def localize_info(self, repo: str, path: str, ext: dict[str, Any], lang: str) -> dict[str, Any]:
+        """Extension installée avec le nom et la description de la langue `lang`, si elle est en cache
+        pour la version installée (à défaut, ceux du Info.json racine)."""
+        for candidate in (lang, DEFAULT_LANG):
+            fields = self.get(repo, path, candidate)
+            if isinstance(fields, dict) and fields.get('version') == ext.get('version'):
+                return {**ext, **pick(fields, INFO_KEYS)}
+        return ext
+
+
+_store: TranslationStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> TranslationStore:
+    """Cache du processus, partagé par le catalogue et le scan des extensions installées."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = TranslationStore()
+        return _store
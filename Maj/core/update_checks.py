@@ -0,0 +1,100 @@
+"""Résultats des recherches de mises à jour, mémorisés pour la durée de la session.
+
+Une extension n'est interrogée en ligne qu'une fois par session : les demandes
+suivantes sont servies depuis la mémoire, et des demandes simultanées pour la même
+extension partagent un seul téléchargement (« single-flight »). Seules les entrées
+des extensions installées, mises à jour ou supprimées sont invalidées.
+"""
+import json
+import threading
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+Key = tuple[str, str]
+
+
+def extension_key(ext: dict[str, Any]) -> Key:
+    """Identité d'une extension quelle que soit la langue de son nom : dépôt et chemin de
+    téléchargement. Les mises à jour trouvées sont rapprochées des extensions installées par
+    cette clé."""
+    return (str(ext.get('repos') or ''), json.dumps(ext.get('download'), sort_keys=True))
+
+
+class UpdateCheckStore:
+    """Mémoire des Info.json en ligne, par extension (dépôt + chemin de téléchargement)."""
+
+    def __init__(self, fetch: Callable[[dict[str, Any]], dict[str, Any] | None], host: Callable[[dict[str, Any]], str] | None = None) -> None:
+        self._fetch = fetch
+        # Hôte interrogé par `fetch` pour une extension : les réponses servies sans requête
+        # sont comptées comme succès de cache de cet hôte (core.metrics)
+        self._host = host
+        self._lock = threading.Lock()
+        self._results: dict[Key, dict[str, Any]] = {}
+        self._inflight: dict[Key, 'Future[dict[str, Any] | None]'] = {}
+        # Incrémenté à chaque invalidation : un téléchargement lancé avant n'est pas mémorisé
+        self._generation: dict[Key, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def key(ext: dict[str, Any]) -> Key:
+        return extension_key(ext)
+
+    def get(self, ext: dict[str, Any]) -> dict[str, Any] | None:
+        """Info.json en ligne de `ext` (None si introuvable ; un échec n'est pas mémorisé)."""
+        key = self.key(ext)
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                self._count_hit(ext)
+                return self._results[key]
+            pending = self._inflight.get(key)
+            if pending is None:
+                self.misses += 1
+                from concurrent.futures import Future
+                future: Future[dict[str, Any] | None] = Future()
+                self._inflight[key] = future
+                generation = self._generation.get(key, 0)
+            else:
+                self.coalesced += 1
+                self._count_hit(ext)
+        if pending is not None:
+            # Même extension déjà en cours de téléchargement : on attend son résultat
+            return pending.result()
+        try:
+            info = self._fetch(ext)
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._inflight[key]
+            if info is not None and self._generation.get(key, 0) == generation:
+                self._results[key] = info
+        future.set_result(info)
+        return info
+
+    def _count_hit(self, ext: dict[str, Any]) -> None:
+        if self._host is not None:
+            from core import metrics
+            metrics.cache_hit(self._host(ext))
+
+    def invalidate(self, ext: dict[str, Any]) -> None:
+        """Oublie le résultat d'une extension (après installation, mise à jour ou suppression)."""
+        key = self.key(ext)
+        with self._lock:
+            self._results.pop(key, None)
+            self._generation[key] = self._generation.get(key, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._results) + list(self._inflight):
+                self._generation[key] = self._generation.get(key, 0) + 1
+            self._results.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {'entries': len(self._results), 'hits': self.hits, 'misses': self.misses, 'coalesced': self.coalesced}
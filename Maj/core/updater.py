@@ -1,15 +1,138 @@
 """Gestion des mises à jour des extensions."""
+from typing import Any
+import i18n
 from i18n import _
 from core.config import Config
+from core.events import EventCallback, EventEmitter, SUCCESS
+from core.installer import Installer
+from core.provider_utils import ProviderUtils
+from core.repo_manager import RepoManager
+from core.network import fetch_json
+from core import integrity, metrics, planner, tracing
+from core.update_checks import UpdateCheckStore
 
-class Updater:
-    def __init__(self, config: Config):
+# Requêtes simultanées lors d'une recherche de mises à jour
+CHECK_WORKERS = 8
+
+
+def parse_version(v: str) -> list[int]:
+    return [int(x) for x in str(v).split('.') if x.isdigit()]
+
+
+class Updater(EventEmitter):
+    """Détection des extensions obsolètes et mise à jour, sans interface graphique."""
+
+    def __init__(self, config: Config, on_event: EventCallback | None = None, installer: Installer | None = None) -> None:
+        super().__init__(on_event)
         self.config = config
+        self.provider_utils = ProviderUtils(config)
+        self.installer = installer or Installer(config, on_event)
+        # Info.json en ligne déjà lus pendant la session (voir UpdateCheckStore)
+        self.checks = UpdateCheckStore(self.fetch_online_info, host=lambda ext: self.provider_utils.file_host(str(ext.get('repos') or '')))
+
+    def fetch_online_info(self, ext: dict[str, Any]) -> dict[str, Any] | None:
+        """Télécharge le Info.json en ligne d'une extension installée (traduit si possible)."""
+        repo_url: str | None = ext.get('repos')
+        download: Any = ext.get('download')
+        if not repo_url or not download:
+            return None
+
+        # Déterminer le chemin de téléchargement
+        if isinstance(download, list):
+            download_path: str = str(download[0]) if len(download) == 1 else ''  # type: ignore[arg-type]
+        else:
+            download_path = str(download) if download else ''
+        if download_path and not download_path.endswith('/'):
+            download_path += '/'
+
+        # Trouver le provider
+        provider = self.provider_utils.get_provider_for_url(repo_url)
+        if not provider:
+            return None
+        owner, repo = self.provider_utils.split_repo_url(repo_url, provider)
+
+        # Tester toutes les branches possibles : Info.json traduit d'abord, puis Info.json racine
+        for branch_try in provider["alternative_main_branch"]:
+            for path in (f"{download_path}locale/{i18n.lang_code}/LC_MESSAGES/Info.json", f"{download_path}Info.json"):
+                url = self.provider_utils.build_file_url(provider, owner, repo, branch_try, path)
+                try:
+                    info_json = fetch_json(url)
+                    if isinstance(info_json, dict):
+                        return info_json  # type: ignore[return-value]
+                except Exception:
+                    continue
+        return None
+
+    def check_extension(self, ext: dict[str, Any]) -> dict[str, Any] | None:
+        """Compare la version installée et la version en ligne d'une extension.
+
+        Retourne {name, repos, download, online_version, local_version} si une mise à jour est
+        disponible ; le nom vient du Info.json en ligne, `extension_key` identifie l'extension.
+        """
+        local_version: str | None = ext.get('version')
+        with tracing.span('check', 'provider', name=ext.get('name'), repos=ext.get('repos')):
+            info_json = self.checks.get(ext)
+        online_version = info_json.get('version') if info_json else None
+        if not online_version or not local_version:
+            return None
+        try:
+            if parse_version(local_version) < parse_version(online_version):
+                ext_copy: dict[str, Any] = {}
+                if info_json and 'name' in info_json:
+                    ext_copy['name'] = info_json['name']
+                # Le dépôt et le chemin de téléchargement identifient l'extension quelle que soit la langue du nom
+                ext_copy['repos'] = ext.get('repos')
+                ext_copy['download'] = ext.get('download')
+                ext_copy['online_version'] = online_version
+                ext_copy['local_version'] = local_version
+                return ext_copy
+        except Exception:
+            pass
+        return None
+
+    def check_updates(self, extensions: list[dict[str, Any]] | None = None) -> list[dict[str, Any]]:
+        """
+        Compare les versions installées et en ligne, retourne la liste des extensions à mettre à jour.
+        """
+        if extensions is None:
+            extensions = self.installer.load_installed()
+        with tracing.span('check_updates', 'provider', extensions=len(extensions)), metrics.phase('check_updates'):
+            return self._check_all(extensions)
+
+    def _check_all(self, extensions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if len(extensions) <= 1:
+            results = [self.check_extension(ext) for ext in extensions]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(CHECK_WORKERS, len(extensions))) as pool:
+                results = list(pool.map(self.check_extension, extensions))
+        return [result for result in results if result]
+
+    def update(self, ext: dict[str, Any], dry_run: bool = False) -> bool:
+        """Met à jour une extension installée. Retourne True en cas de succès.
+
+        Avec `dry_run`, seul le plan est calculé (voir Installer.last_plan).
+        """
+        ext_name = ext.get('name', '?')
+        self.log(_("Mise à jour de l'extension : {ext_name}").format(ext_name=ext_name), gras_part=ext_name)
 
-    def check_updates(self):
-        # TODO: Vérifier les mises à jour disponibles
-        pass
+        if 'download' not in ext or not ext['download'] or 'repos' not in ext or not ext.get('Installed_dir'):
+            self.log(_("Information de téléchargement ou dossier d'installation manquante."), erreur=True)
+            return False
 
-    def update(self, extension):
-        # TODO: Mettre à jour une extension
-        pass
+        # Dossier parent de l'extension installée (Installed_dir peut pointer sur locale/<lang>/LC_MESSAGES)
+        install_dir = planner.install_base_dir(ext)
+        expected = integrity.find_expected_checksum(ext, RepoManager(self.config).load_catalog())
+        try:
+            with metrics.phase('update') as phase:
+                updated = self.installer.install_from_repo(ext, install_dir, expected, dry_run)
+                phase.failed = not updated
+            if updated:
+                if dry_run:
+                    return True
+                self.checks.invalidate(ext)
+                self.emit(SUCCESS, _(u"Mise à jour terminée ! Relancez InkScape pour voir l'extension.\n"), start_here=ext.get('start_here'))
+                return True
+        except Exception as e:
+            self.log(_("Erreur lors de la mise à jour : {e}").format(e=e), erreur=True, gras_part=str(e))
+        return False
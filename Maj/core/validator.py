@@ -1,10 +1,292 @@
-"""Validation des extensions (Info.json, compatibilité, intégrité)."""
-from i18n import _
+"""Validation des extensions installées (Info.json, fichiers .inx, fichiers Python).
 
-class Validator:
-    def __init__(self):
-        pass
+Les vérifications coûteuses (analyse des .inx, compilation des .py) tournent dans un pool
+de processus ; leur résultat est mis en cache par empreinte du contenu de l'extension,
+si bien qu'une extension inchangée n'est pas revalidée au lancement suivant.
+"""
+import json
+import os
+import time
+from typing import Any
+from i18n import N_, _
+from core.events import EventCallback, EventEmitter
+from core import integrity, paths, planner
 
-    def validate(self, extension):
-        # TODO: Valider une extension (Info.json, type, version, fichiers, compatibilité)
-        pass
+REQUIRED_KEYS = ('type', 'name', 'version', 'download', 'repos')
+CACHE_FILE = paths.data_path('validation_cache.json')
+# Incrémenté quand les règles changent, pour invalider les résultats en cache
+RULES_VERSION = 1
+
+# Codes de problème renvoyés par les processus de validation, traduits dans le processus principal
+MESSAGES = {
+    'missing_key': N_("Clé manquante dans Info.json : {key}"),
+    'bad_type': N_("Type inconnu : {type}"),
+    'bad_value': N_("Valeur invalide pour {key} : {value}"),
+    'missing_dir': N_("Dossier d'installation introuvable : {path}"),
+    'inx_parse': N_("{path} : fichier .inx illisible ({error})"),
+    'inx_script': N_("{path} : script introuvable {script}"),
+    'py_compile': N_("{path} : erreur de syntaxe ligne {line} ({error})"),
+    'unreadable': N_("{path} : lecture impossible ({error})"),
+}
+
+Problem = tuple[str, dict[str, Any]]
+
+
+def extension_files(ext: dict[str, Any]) -> list[tuple[str, str]]:
+    """Fichiers installés d'une extension : liste triée de (chemin relatif, chemin complet)."""
+    base = planner.install_base_dir(ext)
+    files: list[tuple[str, str]] = []
+    for item in planner.download_items(ext):
+        path = os.path.join(base, item.rstrip('/'))
+        if os.path.isdir(path):
+            for dirpath, _dirs, names in os.walk(path):
+                for name in names:
+                    full = os.path.join(dirpath, name)
+                    files.append((os.path.relpath(full, base).replace('\\', '/'), full))
+        elif os.path.isfile(path):
+            files.append((item, path))
+    files.sort()
+    return files
+
+
+def _check_info(ext: dict[str, Any]) -> list[Problem]:
+    problems: list[Problem] = []
+    for key in REQUIRED_KEYS:
+        if not ext.get(key):
+            problems.append(('missing_key', {'key': key}))
+    if ext.get('type') and ext.get('type') != 'InkScape extension':
+        problems.append(('bad_type', {'type': ext.get('type')}))
+    for key in ('name', 'version', 'repos'):
+        if ext.get(key) and not isinstance(ext[key], str):
+            problems.append(('bad_value', {'key': key, 'value': ext[key]}))
+    version = ext.get('version')
+    if isinstance(version, str) and version and not all(part.isdigit() for part in version.split('.')):
+        problems.append(('bad_value', {'key': 'version', 'value': version}))
+    download = ext.get('download')
+    if download and not (isinstance(download, str) or (isinstance(download, list) and all(isinstance(d, str) for d in download))):  # type: ignore[union-attr]
+        problems.append(('bad_value', {'key': 'download', 'value': download}))
+    checksums = ext.get('checksums')
+    if checksums is not None and not isinstance(checksums, dict):
+        problems.append(('bad_value', {'key': 'checksums', 'value': type(checksums).__name__}))
+    return problems
+
+
+def _check_inx(rel: str, full: str, extensions_dir: str) -> list[Problem]:
+    import xml.etree.ElementTree as ET
+    try:
+        tree = ET.parse(full)
+    except (ET.ParseError, OSError) as e:
+        return [('inx_parse', {'path': rel, 'error': str(e)})]
+    problems: list[Problem] = []
+    inx_dir = os.path.dirname(full)
+    for elem in tree.iter():
+        tag = elem.tag.rsplit('}', 1)[-1]
+        if tag != 'command' or not (elem.text or '').strip():
+            continue
+        script = elem.text.strip()  # type: ignore[union-attr]
+        location = elem.get('location', 'inx')
+        if location == 'extensions':
+            candidates = [os.path.join(extensions_dir, script)]
+        elif location == 'inx':
+            candidates = [os.path.join(inx_dir, script)]
+        else:
+            # Commande système (location="path") : rien à vérifier localement
+            continue
+        if not any(os.path.isfile(c) for c in candidates):
+            problems.append(('inx_script', {'path': rel, 'script': script}))
+    return problems
+
+
+def _check_python(rel: str, full: str) -> list[Problem]:
+    try:
+        with open(full, 'rb') as f:
+            source = f.read()
+    except OSError as e:
+        return [('unreadable', {'path': rel, 'error': str(e)})]
+    try:
+        compile(source, full, 'exec', dont_inherit=True)
+    except SyntaxError as e:
+        return [('py_compile', {'path': rel, 'line': e.lineno, 'error': e.msg})]
+    except ValueError as e:
+        return [('py_compile', {'path': rel, 'line': 0, 'error': str(e)})]
+    return []
+
+
+def check_extension(ext: dict[str, Any], files: list[tuple[str, str]], extensions_dir: str) -> list[Problem]:
+    """Vérifications d'une extension ; exécutée dans un processus du pool (aucune traduction ici)."""
+    problems = _check_info(ext)
+    for rel, full in files:
+        if full.endswith('.inx'):
+            problems.extend(_check_inx(rel, full, extensions_dir))
+        elif full.endswith('.py'):
+            problems.extend(_check_python(rel, full))
+    return problems
+
+
+class ValidationReport:
+    """Résultat d'une validation groupée, avec le détail des temps."""
+
+    def __init__(self) -> None:
+        self.results: dict[str, list[str]] = {}
+        self.validated = 0
+        self.cached = 0
+        self.hash_ms = 0.0
+        self.check_ms = 0.0
+        self.total_ms = 0.0
+
+    def invalid(self) -> dict[str, list[str]]:
+        return {name: problems for name, problems in self.results.items() if problems}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'results': self.results,
+            'validated': self.validated,
+            'cached': self.cached,
+            'timings_ms': {'hash': round(self.hash_ms, 1), 'check': round(self.check_ms, 1), 'total': round(self.total_ms, 1)},
+        }
+
+    def describe(self) -> str:
+        return _("Validation : {total} extension(s), {invalid} en erreur, {validated} validée(s), {cached} en cache — {ms} ms (empreintes {hash_ms} ms, contrôles {check_ms} ms)").format(
+            total=len(self.results), invalid=len(self.invalid()), validated=self.validated, cached=self.cached,
+            ms=round(self.total_ms), hash_ms=round(self.hash_ms), check_ms=round(self.check_ms))
+
+
+class Validator(EventEmitter):
+    """Valide les extensions installées, en parallèle et avec un cache par empreinte du contenu."""
+
+    def __init__(self, on_event: EventCallback | None = None, cache_path: str = CACHE_FILE, extensions_dir: str | None = None, max_workers: int | None = None) -> None:
+        super().__init__(on_event)
+        self.cache_path = cache_path
+        self.extensions_dir = extensions_dir or paths.inkscape_extensions_dir()
+        self.max_workers = max_workers
+        self.cache = self._load_cache()
+        self._dirty = False
+
+    # --- cache --------------------------------------------------------------
+
+    def _load_cache(self) -> dict[str, Any]:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('rules') == RULES_VERSION:
+                return data
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {'rules': RULES_VERSION, 'files': {}, 'results': {}}
+
+    def save_cache(self) -> None:
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        paths.write_json_atomic(self.cache_path, self.cache)
+        self._dirty = False
+
+    def _file_sha256(self, full: str) -> str:
+        # Empreinte mémorisée tant que la taille et la date du fichier n'ont pas changé
+        st = os.stat(full)
+        known = self.cache['files'].get(full)
+        if known and known.get('size') == st.st_size and known.get('mtime_ns') == st.st_mtime_ns:
+            return str(known['sha256'])
+        sha = integrity.sha256_file(full)
+        self.cache['files'][full] = {'sha256': sha, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+        self._dirty = True
+        return sha
+
+    def content_key(self, ext: dict[str, Any], files: list[tuple[str, str]]) -> str:
+        """Empreinte de l'extension : métadonnées Info.json et contenu de chacun de ses fichiers."""
+        digest = integrity.new_sha256()
+        digest.update(json.dumps({k: ext.get(k) for k in sorted(ext) if k != 'Installed_dir'}, sort_keys=True, default=str).encode('utf-8'))
+        digest.update(self.extensions_dir.encode('utf-8'))
+        for rel, full in files:
+            try:
+                sha = self._file_sha256(full)
+            except OSError:
+                sha = '-'
+            digest.update(f"\0{rel}\0{sha}".encode('utf-8'))
+        return digest.hexdigest()
+
+    # --- validation ---------------------------------------------------------
+
+    def _translate(self, ext: dict[str, Any], problems: list[Problem]) -> list[str]:
+        messages = [_(MESSAGES[code]).format(**params) for code, params in problems]
+        installed_dir = ext.get('Installed_dir')
+        if installed_dir and not os.path.isdir(installed_dir):
+            messages.append(_(MESSAGES['missing_dir']).format(path=installed_dir))
+        return messages
+
+    def validate(self, extension: dict[str, Any]) -> list[str]:
+        """Valide une extension installée (entrée de installed_extensions.json).
+
+        Retourne la liste des problèmes trouvés (vide si l'extension est valide).
+        """
+        return self.validate_all([extension], use_pool=False, prune=False).results.get(str(extension.get('name', '?')), [])
+
+    def validate_all(self, extensions: list[dict[str, Any]], use_cache: bool = True, use_pool: bool = True, prune: bool = True) -> ValidationReport:
+        """Valide toutes les extensions ; seules celles dont le contenu a changé sont recontrôlées.
+
+        Avec `prune`, les entrées du cache qui ne concernent plus aucune de ces extensions sont oubliées.
+        """
+        report = ValidationReport()
+        start = time.perf_counter()
+        seen_keys: set[str] = set()
+        seen_files: set[str] = set()
+        pending: list[tuple[str, dict[str, Any], list[tuple[str, str]], str]] = []
+        raw: dict[str, list[Problem]] = {}
+        for ext in extensions:
+            name = str(ext.get('name', '?'))
+            files = extension_files(ext)
+            key = self.content_key(ext, files)
+            seen_keys.add(key)
+            seen_files.update(full for _rel, full in files)
+            cached = self.cache['results'].get(key) if use_cache else None
+            if cached is not None:
+                raw[name] = [(code, params) for code, params in cached]
+                report.cached += 1
+            else:
+                pending.append((name, ext, files, key))
+        report.hash_ms = (time.perf_counter() - start) * 1000
+
+        check_start = time.perf_counter()
+        for (name, _ext, _files, key), problems in zip(pending, self._run_checks(pending, use_pool)):
+            raw[name] = problems
+            self.cache['results'][key] = problems
+            self._dirty = True
+        report.validated = len(pending)
+        report.check_ms = (time.perf_counter() - check_start) * 1000
+
+        for ext in extensions:
+            name = str(ext.get('name', '?'))
+            report.results[name] = self._translate(ext, raw.get(name, []))
+        if prune:
+            for section, seen in (('results', seen_keys), ('files', seen_files)):
+                stale = [k for k in self.cache[section] if k not in seen]
+                for k in stale:
+                    del self.cache[section][k]
+                self._dirty = self._dirty or bool(stale)
+        if self._dirty:
+            try:
+                self.save_cache()
+            except OSError as e:
+                self.log(_("Impossible d'enregistrer le cache de validation : {e}").format(e=e), erreur=True)
+        report.total_ms = (time.perf_counter() - start) * 1000
+        return report
+
+    def _run_checks(self, pending: list[tuple[str, dict[str, Any], list[tuple[str, str]], str]], use_pool: bool) -> list[list[Problem]]:
+        if use_pool and len(pending) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    futures = [pool.submit(check_extension, ext, files, self.extensions_dir) for _n, ext, files, _k in pending]
+                    return [f.result() for f in futures]
+            except (OSError, ImportError, RuntimeError) as e:
+                # Pool indisponible (environnement restreint) : validation dans le processus courant
+                self.log(_("Validation parallèle indisponible ({e}), validation séquentielle.").format(e=e))
+        return [check_extension(ext, files, self.extensions_dir) for _n, ext, files, _k in pending]
+
+    def report(self, extensions: list[dict[str, Any]], use_cache: bool = True) -> ValidationReport:
+        """Valide toutes les extensions et écrit le résultat dans le journal."""
+        result = self.validate_all(extensions, use_cache)
+        for name, problems in result.invalid().items():
+            self.log(_("Extension invalide : {name}").format(name=name), erreur=True, gras_part=name)
+            for problem in problems:
+                self.log(f"   {problem}", erreur=True)
+        self.log(result.describe())
+        return result
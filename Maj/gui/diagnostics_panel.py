@@ -0,0 +1,115 @@
+"""Onglet Diagnostic : compteurs réseau et caches par hôte, durée des phases (core.metrics)."""
+from __future__ import annotations
+
+import os
+import time
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable
+
+from i18n import _
+from core import metrics, tracing
+from core.progress import format_size
+
+HOST_COLUMNS = ('requests', 'bytes', 'failures', 'timeouts', 'cache_hits', 'revalidations', 'p50', 'p90', 'p99')
+PHASE_COLUMNS = ('count', 'failures', 'total', 'p50', 'p90', 'p99')
+
+
+def _ms(value: float | None) -> str:
+    return "" if value is None else f"{value:.0f} ms" if value >= 10 else f"{value:.1f} ms"
+
+
+class DiagnosticsPanel(tk.Frame):
+    """Tableaux des compteurs de la session, rafraîchis à la demande (`refresh`) et exportables.
+
+    `session_info` fournit les lignes de résumé propres à la fenêtre (cache des recherches de
+    mises à jour, opérations du journal).
+    """
+
+    def __init__(self, parent: tk.Widget, bg: str, fg: str, button_bg: str, button_fg: str,
+                 session_info: Callable[[], list[str]] | None = None, *args: Any, **kwargs: Any) -> None:
+        super().__init__(parent, *args, bg=bg, **kwargs)
+        self.registry = metrics.get_registry()
+        self.session_info = session_info
+
+        self.summary_label = tk.Label(self, bg=bg, fg=fg, font=("Arial", 10), anchor="w", justify=tk.LEFT)
+        self.summary_label.pack(fill=tk.X, padx=10, pady=(10, 5))
+
+        tk.Label(self, text=_("Requêtes par hôte :"), bg=bg, fg=fg, font=("Arial", 12, "bold")).pack(anchor="w", padx=10)
+        self.hosts_tree = self._make_tree(HOST_COLUMNS, (
+            _("Requêtes"), _("Reçu"), _("Échecs"), _("Délais"), _("Cache"), _("Revalid."), "p50", "p90", "p99",
+        ), _("Hôte"))
+        tk.Label(self, text=_("Durée des phases :"), bg=bg, fg=fg, font=("Arial", 12, "bold")).pack(anchor="w", padx=10, pady=(10, 0))
+        self.phases_tree = self._make_tree(PHASE_COLUMNS, (
+            _("Exécutions"), _("Échecs"), _("Total"), "p50", "p90", "p99",
+        ), _("Phase"))
+
+        frame_buttons = tk.Frame(self, bg=bg)
+        frame_buttons.pack(fill=tk.X, padx=10, pady=10)
+        for text, command in (
+            (_("Actualiser"), self.refresh),
+            (_("Exporter en JSON…"), lambda: self.export('.json')),
+            (_("Exporter pour Prometheus…"), lambda: self.export(metrics.PROMETHEUS_SUFFIX)),
+            (_("Remettre à zéro"), self.reset),
+        ):
+            tk.Button(frame_buttons, text=text, bg=button_bg, fg=button_fg, command=command).pack(side=tk.LEFT, padx=(0, 5))
+        self.status_label = tk.Label(frame_buttons, bg=bg, fg=fg, font=("Arial", 9, "italic"), anchor="w")
+        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.refresh()
+
+    def _make_tree(self, columns: tuple[str, ...], headings: tuple[str, ...], first_heading: str) -> ttk.Treeview:
+        tree = ttk.Treeview(self, columns=columns, height=5)
+        tree.heading('#0', text=first_heading, anchor="w")
+        tree.column('#0', width=200, stretch=True)
+        for column, heading in zip(columns, headings):
+            tree.heading(column, text=heading)
+            tree.column(column, width=75, anchor="e", stretch=False)
+        tree.pack(fill=tk.X, padx=10)
+        return tree
+
+    def refresh(self) -> None:
+        """Relit le registre et remplace le contenu des tableaux."""
+        snapshot = self.registry.snapshot()
+        self.hosts_tree.delete(*self.hosts_tree.get_children())
+        for host, stats in snapshot['hosts'].items():
+            latency = stats['latency_ms']
+            self.hosts_tree.insert('', tk.END, text=host, values=(
+                stats['requests'], format_size(stats['bytes']), stats['failures'], stats['timeouts'],
+                stats['cache_hits'], stats['revalidations'],
+                _ms(latency.get('p50')), _ms(latency.get('p90')), _ms(latency.get('p99')),
+            ))
+        self.phases_tree.delete(*self.phases_tree.get_children())
+        for name, stats in snapshot['phases'].items():
+            duration = stats['duration_ms']
+            self.phases_tree.insert('', tk.END, text=name, values=(
+                stats['count'], stats['failures'], _ms(stats['total_ms']),
+                _ms(duration.get('p50')), _ms(duration.get('p90')), _ms(duration.get('p99')),
+            ))
+        lines = [_("Session commencée le {date}").format(date=time.strftime('%d/%m/%Y %H:%M:%S', time.localtime(snapshot['started'])))]
+        if self.session_info is not None:
+            lines += self.session_info()
+        if tracing.enabled():
+            lines.append(_("Traces activées ({var})").format(var=tracing.ENV_VAR))
+        self.summary_label.config(text="\n".join(lines))
+
+    def reset(self) -> None:
+        self.registry.reset()
+        self.refresh()
+
+    def export(self, suffix: str) -> None:
+        """Enregistre les compteurs dans un fichier choisi (JSON ou format texte Prometheus)."""
+        from tkinter import filedialog
+        if suffix == metrics.PROMETHEUS_SUFFIX:
+            filetypes = [(_("Prometheus (textfile)"), f"*{suffix}")]
+        else:
+            filetypes = [("JSON", f"*{suffix}")]
+        path = filedialog.asksaveasfilename(parent=self, defaultextension=suffix, filetypes=filetypes,
+                                            initialfile=f"maj-metrics{suffix}")
+        if not path:
+            return
+        try:
+            self.registry.export(path, prometheus=(suffix == metrics.PROMETHEUS_SUFFIX))
+        except OSError as e:
+            self.status_label.config(text=_("Export impossible : {e}").format(e=e))
+            return
+        self.status_label.config(text=_("Exporté : {path}").format(path=os.path.basename(path)))
@@ -2,72 +2,72 @@ from __future__ import annotations
 
 import tkinter as tk
 from i18n import _
-from tkinter import font
+from tkinter import ttk
 from typing import Any, Callable
+from gui.theme import get_theme
 
 class InstallableExtensionsListWidget(tk.Frame):
     """
     Widget custom pour afficher les extensions par dépôt avec mise en forme couleur et gras.
+
+    Le contenu est mis à jour sur place : `set_items()` n'insère ou ne retire que les
+    entrées qui ont changé, `set_filter()` masque ou affiche les entrées (option `elide`
+    des tags) sans toucher au texte.
     """
-    def __init__(self, parent: tk.Widget, extensions_by_repo: dict[str, list[dict[str, Any]]], on_select: Callable[[dict[str, Any]], None] | None = None, *args: Any, **kwargs: Any) -> None:
+    def __init__(self, parent: tk.Widget, extensions_by_repo: dict[str, list[dict[str, Any]]], on_select: Callable[[dict[str, Any] | None], None] | None = None, *args: Any, **kwargs: Any) -> None:
         super().__init__(parent, *args, **kwargs)
         self.extensions_by_repo = extensions_by_repo
         self.on_select = on_select
-        # Charger les couleurs et formats de police depuis config.json
-        import os, json
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'config.json')
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            template = config_data.get('Template', [{}])[0]
-            self.colors: dict[str, str] = template.get('colors', {})
-            self.format_text: dict[str, Any] = template.get('format_text', {})
-        except Exception as e:
-            print("[Maj] Erreur chargement config.json:", e)
-            self.colors: dict[str, str] = {}
-            self.format_text: dict[str, Any] = {}
-        def get_color(key: str) -> str:
-            return self.colors.get(key, "#FF00FF") 
-        self.get_color = get_color
-        
-        def get_font_cfg(key: str, fallback: tuple[Any, ...]) -> tuple[Any, ...]:
-            val = self.format_text.get(key)
-            return tuple(val) if val else fallback
-        self.get_font = get_font_cfg
-
-        from tkinter import ttk
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure('Custom.Vertical.TScrollbar',
-            background=self.get_color('scrollbar_slider'),
-            troughcolor=self.get_color('scrollbar_trough'),
-            bordercolor=self.get_color('scrollbar_trough'),
-            arrowcolor=self.get_color('scrollbar_arrow'),
-            lightcolor=self.get_color('scrollbar_trough'),
-            darkcolor=self.get_color('scrollbar_trough'),
-            relief='flat')
-        style.map('Custom.Vertical.TScrollbar',
-            background=[('active', self.get_color('scrollbar_slider_hover'))]
-        )
+        self.theme = get_theme()
+        self.get_color = self.theme.color
+        self.get_font = self.theme.font_spec
         self.text = tk.Text(self, wrap=tk.WORD, bg=self.get_color('fond_ligne_paire'), fg=self.get_color('text_sombre'), font=self.get_font('font_base', ("Arial", 11)), state=tk.NORMAL, height=18, width=70, cursor="arrow")
         self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         # Empêcher l'édition
         def block_edit(event: tk.Event[tk.Text]) -> str:
             return "break"
         self.text.bind("<Key>", block_edit)
-        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.text.yview, style='Custom.Vertical.TScrollbar')  # type: ignore[arg-type]
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.text.yview, style=self.theme.scrollbar_style())  # type: ignore[arg-type]
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.text.configure(yscrollcommand=self.scrollbar.set)
-        self.bold_font = font.Font(self.text, self.get_font('font_bold', ("Arial", 11, "bold")))
-        self.repo_font = font.Font(self.text, self.get_font('font_repo', ("Arial", 12, "bold")))
-        self.author_font = font.Font(self.text, self.get_font('font_author', ("Arial", 10, "italic")))
-        self.desc_font = font.Font(self.text, self.get_font('font_desc', ("Arial", 11)))
-        self.litle_font = font.Font(self.text, self.get_font('font_litle', ("Arial", 9)))
-        self.warning_font = font.Font(self.text, self.get_font('font_warning', ("Arial", 10, "italic")))
-        self._ext_line_map: dict[int, dict[str, Any]] = {}  # map line number to ext dict
-        self._selected_line: int | None = None
+        self.bold_font = self.theme.font('font_bold', ("Arial", 11, "bold"))
+        self.repo_font = self.theme.font('font_repo', ("Arial", 12, "bold"))
+        self.author_font = self.theme.font('font_author', ("Arial", 10, "italic"))
+        self.desc_font = self.theme.font('font_desc', ("Arial", 11))
+        self.litle_font = self.theme.font('font_litle', ("Arial", 9))
+        self.warning_font = self.theme.font('font_warning', ("Arial", 10, "italic"))
+        self._ext_tag_map: dict[str, dict[str, Any]] = {}
+        self._selected_ext_tag: str | None = None
+        # Par dépôt : tag du bloc (titre + ligne vide finale) et entrées {clé: tag}, dans l'ordre
+        self._repo_tags: dict[str, str] = {}
+        self._repo_entries: dict[str, dict[str, str]] = {}
+        self._seq = 0
+        self._visible: set[int] | None = None   # id() des extensions visibles (None : toutes)
+        self._pending_width: int | None = None
+        self._tab_width: int | None = None
+        self._configure_tags()
         self.text.bind("<Button-1>", self._on_click)
-        self._populate()
+        self.text.bind("<Configure>", self._on_configure)
+        self.set_items(extensions_by_repo)
+
+    # --- géométrie -----------------------------------------------------------
+
+    def _on_configure(self, event: tk.Event[tk.Text]) -> None:
+        # Redimensionnement : seule la dernière largeur est appliquée, une fois par passage
+        # de la boucle Tk (changer la tabulation remet en page tout le texte)
+        if self._pending_width is None:
+            self.after_idle(self._apply_width)
+        self._pending_width = event.width
+
+    def _apply_width(self) -> None:
+        width, self._pending_width = self._pending_width, None
+        if width is None or width == self._tab_width or not self.winfo_exists():
+            return
+        self._tab_width = width
+        # Version alignée à droite par une tabulation : aucune mesure de texte par ligne
+        self.text.tag_configure("compatibility", tabs=(max(100, width - 16), tk.RIGHT))
+
+    # --- sélection -----------------------------------------------------------
 
     def _on_click(self, event: tk.Event[tk.Text]) -> None:
         index = self.text.index(f"@{event.x},{event.y}")
@@ -89,84 +89,179 @@ class InstallableExtensionsListWidget(tk.Frame):
         if self.on_select:
             self.on_select(ext)
 
-    def _select_ext_tag(self, ext_tag: str) -> None:
+    def _select_ext_tag(self, ext_tag: str | None) -> None:
         # Désélectionner l'ancienne zone
-        if hasattr(self, '_selected_ext_tag') and self._selected_ext_tag:
-            old_ranges = self.text.tag_ranges(self._selected_ext_tag)
-            for i in range(0, len(old_ranges), 2):
-                self.text.tag_remove("selected_ext", old_ranges[i], old_ranges[i+1])
+        self.text.tag_remove("selected_ext", "1.0", tk.END)
         self._selected_ext_tag = ext_tag
-        if ext_tag:
-            ranges = self.text.tag_ranges(ext_tag)
-            for i in range(0, len(ranges), 2):
-                self.text.tag_add("selected_ext", ranges[i], ranges[i+1])
-
-    def _populate(self) -> None:
-        # Si le widget n'est pas encore affiché, attendre et relancer _populate
-        if self.text.winfo_width() <= 1:
-            self.after(20, self._populate)
-            return
+        if ext_tag and self.text.tag_ranges(ext_tag):
+            self.text.tag_add("selected_ext", f"{ext_tag}.first", f"{ext_tag}.last")
+
+    def _deselect(self) -> None:
+        self._select_ext_tag(None)
+        if self.on_select:
+            self.on_select(None)
+
+    # --- mise à jour sur place -------------------------------------------------
+
+    @staticmethod
+    def _entry_key(ext: dict[str, Any]) -> str:
+        return str(ext.get('repos') or ext.get('name', ''))
+
+    def set_items(self, extensions_by_repo: dict[str, list[dict[str, Any]]], visible_by_repo: dict[str, list[dict[str, Any]]] | None = None) -> None:
+        """Met le texte en accord avec le catalogue en n'insérant ou retirant que les entrées
+        modifiées, puis applique le filtre `visible_by_repo` (voir set_filter)."""
         self.text.config(state=tk.NORMAL)
-        self.text.delete("1.0", tk.END)
-        self._ext_tag_map: dict[str, dict[str, Any]] = {}
-        repos = list(self.extensions_by_repo.items())
-        for idx_repo, (repo, exts) in enumerate(repos):
-            self.text.insert(tk.END, repo + "\n", ("repo_bar",))
-            numExt=0
-            for _idx, ext in enumerate(exts):
-                ext_tag = f"ext_{id(ext)}"
-                ext_start_idx = self.text.index(tk.END)
-                bg_tag = "ligne_paire" if numExt % 2 == 0 else "ligne_impaire"
-                self.text.insert(tk.END, f"  {ext.get('name', '?')}", ("bold", ext_tag, bg_tag))
-                self.text.insert(tk.END, _(" par "), ("text_by", ext_tag, bg_tag))
-                self.text.insert(tk.END, ext.get("author", "?") + "\n", ("author", ext_tag, bg_tag))
-                # Description
-                if ext.get("short_description", ""):
-                    self.text.insert(tk.END, f"    {ext.get('short_description', '')}\n", ("desc", ext_tag, bg_tag))
-                    
-                # Ligne version + compatibilité
-                version_str: str = _("Version : {version}").format(version=ext.get('version', '?'))
-                compat: Any = ext.get('compatibility', None)
-                if isinstance(compat, list):
-                    compat_str: str = ', '.join(str(c) for c in compat)  # type: ignore[arg-type]
-                elif compat:
-                    compat_str = str(compat)
-                else:
-                    compat_str = ""
-                # Calcul alignement : compat à gauche, version à droite
-                self.espace_px = self.litle_font.measure(" ")
-                left: str = _("Pour {compat}").format(compat=compat_str) if compat_str else ""
-                right: str = version_str
-
-                
-                spaces=" " * (((self.text.winfo_width()-self.litle_font.measure(left+right))//self.espace_px )-8)
-                
-                
-                self.text.insert(tk.END, f"    {left}", ("compatibility", ext_tag, bg_tag))
-                self.text.insert(tk.END, f"{spaces}{right}\n", ("version", ext_tag, bg_tag))
-                ext_end_idx = self.text.index(tk.END)
-                self.text.tag_add(ext_tag, ext_start_idx, ext_end_idx)
-                self.text.tag_add(bg_tag, ext_start_idx, ext_end_idx)
-                self._ext_tag_map[ext_tag] = ext
-                numExt+=1
-
-            if idx_repo < len(repos) - 1:
-                self.text.insert(tk.END, "\n")
+        for repo in [r for r in self._repo_tags if r not in extensions_by_repo]:
+            self._remove_repo(repo)
+        repos = list(extensions_by_repo)
+        for pos, repo in enumerate(repos):
+            if repo not in self._repo_tags:
+                # Nouveau dépôt : avant le premier dépôt affiché qui le suit
+                index = tk.END
+                for next_repo in repos[pos + 1:]:
+                    if next_repo in self._repo_tags:
+                        index = self.text.index(f"{self._repo_tags[next_repo]}.first")
+                        break
+                self._insert_repo(index, repo)
+            self._sync_entries(repo, extensions_by_repo[repo])
+        self.extensions_by_repo = extensions_by_repo
+        self.text.config(state=tk.DISABLED)
+        self.set_filter(visible_by_repo)
+
+    def _sync_entries(self, repo: str, exts: list[dict[str, Any]]) -> None:
+        entries = self._repo_entries[repo]
+        wanted = {self._entry_key(ext): ext for ext in exts}
+        keys = list(wanted)
+        for key in [k for k in entries if k not in wanted]:
+            self._remove_entry(entries.pop(key))
+        if list(entries) != [k for k in keys if k in entries]:
+            # Ordre modifié : plus simple de réinsérer tout le dépôt
+            for tag in entries.values():
+                self._remove_entry(tag)
+            entries.clear()
+        new_entries: dict[str, str] = {}
+        for pos, key in enumerate(keys):
+            ext = wanted[key]
+            tag = entries.get(key)
+            if tag is not None and self._ext_tag_map[tag] == ext:
+                # Inchangée : on garde le texte, on suit simplement le nouvel objet
+                self._ext_tag_map[tag] = ext
+                new_entries[key] = tag
+                continue
+            if tag is not None:
+                self._remove_entry(tag)
+                del entries[key]
+            index = self._entry_insert_index(repo, entries, keys[pos + 1:])
+            new_entries[key] = self._insert_entry(index, ext)
+        self._repo_entries[repo] = new_entries
+
+    def _entry_insert_index(self, repo: str, entries: dict[str, str], following: list[str]) -> str:
+        for key in following:
+            tag = entries.get(key)
+            if tag is not None and self.text.tag_ranges(tag):
+                return self.text.index(f"{tag}.first")
+        return self.text.index(f"sep_{self._repo_tags[repo]}.first")
+
+    def _insert_repo(self, index: str, repo: str) -> None:
+        self._seq += 1
+        repo_tag = f"repo_{self._seq}"
+        self._repo_tags[repo] = repo_tag
+        self._repo_entries[repo] = {}
+        # Titre puis ligne vide de séparation ; les entrées sont insérées entre les deux
+        self.text.insert(index, repo + "\n", ("repo_bar", repo_tag))
+        sep_index = self.text.index(f"{repo_tag}.last")
+        self.text.insert(sep_index, "\n", (repo_tag, f"sep_{repo_tag}"))
+
+    def _remove_repo(self, repo: str) -> None:
+        for tag in self._repo_entries.pop(repo, {}).values():
+            self._remove_entry(tag)
+        repo_tag = self._repo_tags.pop(repo)
+        for tag in (repo_tag, f"sep_{repo_tag}"):
+            if self.text.tag_ranges(tag):
+                self.text.delete(f"{tag}.first", f"{tag}.last")
+            self.text.tag_delete(tag)
+
+    def _insert_entry(self, index: str, ext: dict[str, Any]) -> str:
+        self._seq += 1
+        ext_tag = f"ext_{self._seq}"
+        parts: list[tuple[str, str]] = [
+            (f"  {ext.get('name', '?')}", "bold"),
+            (_(" par "), "text_by"),
+            (str(ext.get("author", "?")) + "\n", "author"),
+        ]
+        # Description
+        if ext.get("short_description", ""):
+            parts.append((f"    {ext.get('short_description', '')}\n", "desc"))
+        # Ligne version + compatibilité : compat à gauche, version à droite (tabulation alignée à droite)
+        compat: Any = ext.get('compatibility', None)
+        if isinstance(compat, list):
+            compat_str: str = ', '.join(str(c) for c in compat)  # type: ignore[arg-type]
+        elif compat:
+            compat_str = str(compat)
+        else:
+            compat_str = ""
+        left: str = _("Pour {compat}").format(compat=compat_str) if compat_str else ""
+        parts.append((f"    {left}\t", "compatibility"))
+        parts.append((_("Version : {version}").format(version=ext.get('version', '?')) + "\n", "version"))
+        args: list[Any] = []
+        for chars, tag in parts:
+            args.extend((chars, (tag, ext_tag)))
+        self.text.insert(index, *args)
+        self._ext_tag_map[ext_tag] = ext
+        return ext_tag
+
+    def _remove_entry(self, ext_tag: str) -> None:
+        if ext_tag == self._selected_ext_tag:
+            self._deselect()
+        if self.text.tag_ranges(ext_tag):
+            self.text.delete(f"{ext_tag}.first", f"{ext_tag}.last")
+        self.text.tag_delete(ext_tag)
+        self._ext_tag_map.pop(ext_tag, None)
+
+    def set_filter(self, visible_by_repo: dict[str, list[dict[str, Any]]] | None) -> None:
+        """Affiche seulement les extensions de `visible_by_repo` (None : tout afficher).
+
+        Les entrées sont masquées par l'option `elide` de leur tag : le texte n'est pas modifié.
+        """
+        visible = None if visible_by_repo is None else {id(ext) for exts in visible_by_repo.values() for ext in exts}
+        for repo, entries in self._repo_entries.items():
+            shown = 0
+            for tag in entries.values():
+                hidden = visible is not None and id(self._ext_tag_map[tag]) not in visible
+                self.text.tag_configure(tag, elide=hidden)
+                if hidden and tag == self._selected_ext_tag:
+                    self._deselect()
+                shown += not hidden
+            self.text.tag_configure(self._repo_tags[repo], elide=shown == 0)
+        self._visible = visible
+        self._restripe()
+
+    def _restripe(self) -> None:
+        """Alternance des couleurs de fond sur les seules entrées visibles."""
+        visible = self._visible
+        self.text.tag_remove("ligne_paire", "1.0", tk.END)
+        self.text.tag_remove("ligne_impaire", "1.0", tk.END)
+        for entries in self._repo_entries.values():
+            num_ext = 0
+            for tag in entries.values():
+                if visible is not None and id(self._ext_tag_map[tag]) not in visible:
+                    continue
+                bg_tag = "ligne_paire" if num_ext % 2 == 0 else "ligne_impaire"
+                self.text.tag_add(bg_tag, f"{tag}.first", f"{tag}.last")
+                num_ext += 1
+
+    def _configure_tags(self) -> None:
         self.text.tag_configure("repo_bar", font=self.repo_font, background=self.get_color('fond_repo_bar'), foreground=self.get_color('text_repo_bar'), spacing1=2, spacing3=2)
         self.text.tag_configure("ligne_impaire",  background=self.get_color('fond_ligne_impaire'))
         self.text.tag_configure("ligne_paire",  background=self.get_color('fond_ligne_paire'))
         self.text.tag_configure("bold", font=self.bold_font)
         self.text.tag_configure("author", font=self.author_font, foreground=self.get_color('text_author'))
         self.text.tag_configure("desc", font=self.desc_font, foreground=self.get_color('text_desc'))
-        self.text.tag_configure("version", font=self.litle_font, foreground=self.get_color('text_version'), justify="right")
+        self.text.tag_configure("version", font=self.litle_font, foreground=self.get_color('text_version'))
         self.text.tag_configure("selected_ext", background=self.get_color('fond_selected_ext'))
         self.text.tag_configure("text_by", foreground=self.get_color('text_by'))
-        self.text.tag_configure("compatibility",font=self.litle_font, foreground=self.get_color('text_compatibility'))
+        self.text.tag_configure("compatibility",font=self.litle_font, foreground=self.get_color('text_compatibility'), tabs=(max(100, self.text.winfo_reqwidth() - 16), tk.RIGHT))
         self.text.tag_configure("text_highlight", font=self.warning_font, foreground=self.get_color('text_highlight'))
         self.text.tag_configure("text_lien", font=self.warning_font, foreground=self.get_color('text_lien'))
-        
-        
-        
-        self.text.config(state=tk.DISABLED)
-
-   
\ No newline at end of file
+        # La sélection passe au-dessus de l'alternance des couleurs
+        self.text.tag_raise("selected_ext")
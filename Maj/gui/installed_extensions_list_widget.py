@@ -1,45 +1,59 @@
 from __future__ import annotations
 
+import bisect
 import tkinter as tk
-from tkinter import font
-import os
+from tkinter import font, ttk
 from typing import Any, Callable
 from i18n import _
-import json
+from core.update_checks import extension_key
+from gui.theme import get_theme
+
+# Au-delà de ce nombre d'extensions, la liste est virtualisée (seules les lignes visibles sont dessinées)
+VIRTUAL_THRESHOLD = 60
+MAJ_REPO_URL = "https://github.com/FrankSAURET/Maj"
+
+
+class _FrameEntry:
+    """Lignes (titre, description, version) d'une extension en mode Frame, réutilisées par `set_items`."""
+    __slots__ = ('ext', 'signature', 'frames', 'desc_labels', 'bg', 'wrap_width')
+
+    def __init__(self, ext: dict[str, Any], signature: tuple[Any, ...], bg: str, wrap_width: int) -> None:
+        self.ext = ext
+        # Contenu affiché : une ligne n'est recréée que si ce contenu change
+        self.signature = signature
+        self.frames: list[tk.Frame] = []
+        self.desc_labels: list[tk.Label] = []
+        self.bg = bg
+        self.wrap_width = wrap_width
+
 
 class InstalledExtensionsListWidget(tk.Frame):
     """
     Canvas + Frame scrollable, lignes alternées, sélection,
     molette, et icône upgradable à droite sur la ligne version.
+
+    En mode virtuel (`virtual=True`, ou automatiquement au-delà de VIRTUAL_THRESHOLD
+    extensions), les lignes sont dessinées directement sur le Canvas et seules les
+    lignes visibles existent ; la description tient alors sur une ligne (coupée par « … »).
+
+    `set_items()` remplace le contenu en réutilisant le widget et, en mode Frame, les lignes
+    des extensions dont l'affichage n'a pas changé ; couleurs, polices et images viennent
+    du registre partagé (gui.theme).
+
+    Les redimensionnements sont regroupés : une seule mise en page par passage de la
+    boucle Tk, et le retour à la ligne des descriptions n'est refait que pour les
+    lignes visibles (les autres le sont quand elles entrent dans la vue).
     """
 
-    def __init__(self, parent: tk.Widget, installed_extensions: list[dict[str, Any]], outdated_extensions: list[dict[str, Any]], on_select: Callable[[dict[str, Any]], None] | None = None, *args: Any, **kwargs: Any) -> None:
+    def __init__(self, parent: tk.Widget, installed_extensions: list[dict[str, Any]], outdated_extensions: list[dict[str, Any]], on_select: Callable[[dict[str, Any]], None] | None = None, *args: Any, virtual: bool | None = None, **kwargs: Any) -> None:
         super().__init__(parent, *args, **kwargs)
-        self.installed_extensions = installed_extensions
-        self.outdated_extensions = outdated_extensions
         self.on_select = on_select
+        self._virtual_option = virtual
+        self.selected_ext: dict[str, Any] | None = None
 
-        # Charger config.json
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'config.json')
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            template = config_data.get('Template', [{}])[0]
-            self.colors: dict[str, str] = template.get('colors', {})
-            self.format_text: dict[str, Any] = template.get('format_text', {})
-        except Exception as e:
-            print("[Maj] Erreur chargement config.json:", e)
-            self.colors: dict[str, str] = {}
-            self.format_text: dict[str, Any] = {}
-
-        def get_color(key: str) -> str:
-            return self.colors.get(key, "#FF00FF")
-        self.get_color = get_color
-
-        def get_font_cfg(key: str, fallback: tuple[Any, ...]) -> tuple[Any, ...]:
-            val = self.format_text.get(key)
-            return tuple(val) if val else fallback
-        self.get_font = get_font_cfg
+        self.theme = get_theme()
+        self.get_color = self.theme.color
+        self.get_font = self.theme.font_spec
 
         # Canvas + Scrollbar
         self.canvas = tk.Canvas(self,
@@ -49,72 +63,168 @@ class InstalledExtensionsListWidget(tk.Frame):
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # Scrollbar ttk avec style personnalisé
-        from tkinter import ttk
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure('Custom.Vertical.TScrollbar',
-            background=self.get_color('scrollbar_slider'),
-            troughcolor=self.get_color('scrollbar_trough'),
-            bordercolor=self.get_color('scrollbar_trough'),
-            arrowcolor=self.get_color('scrollbar_arrow'),
-            lightcolor=self.get_color('scrollbar_trough'),
-            darkcolor=self.get_color('scrollbar_trough'),
-            relief='flat')
-        style.map('Custom.Vertical.TScrollbar',
-            background=[('active', self.get_color('scrollbar_slider_hover'))]
-        )
-        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview, style='Custom.Vertical.TScrollbar')  # type: ignore[arg-type]
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview, style=self.theme.scrollbar_style())  # type: ignore[arg-type]
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-
-        # Frame interne
-        self.inner = tk.Frame(self.canvas, bg=self.get_color('fond_ligne_paire'))
-        self.inner_window = self.canvas.create_window((0, 0), window=self.inner, anchor="nw")
-
-        # Fix largeur/marge
-        self.inner.bind("<Configure>", self._on_inner_configure)
-        self.canvas.bind("<Configure>", self._on_canvas_configure)
 
         # Molette
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)  # type: ignore[arg-type]
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel)  # type: ignore[arg-type]
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel)  # type: ignore[arg-type]
+        self.theme.register_wheel(self.canvas, self._on_mousewheel)
 
         # Polices
-        self.font_name   = font.Font(self, self.get_font('font_bold', ("Arial", 11, "bold")))
-        self.font_author = font.Font(self, self.get_font('font_author', ("Arial", 10, "italic")))
-        self.font_desc   = font.Font(self, self.get_font('font_desc', ("Arial", 11)))
-        self.font_ver    = font.Font(self, self.get_font('font_litle', ("Arial", 9)))
-        self.font_warning    = font.Font(self, self.get_font('font_warning', ("Arial", 10, "italic")))
+        self.font_name   = self.theme.font('font_bold', ("Arial", 11, "bold"))
+        self.font_author = self.theme.font('font_author', ("Arial", 10, "italic"))
+        self.font_desc   = self.theme.font('font_desc', ("Arial", 11))
+        self.font_ver    = self.theme.font('font_litle', ("Arial", 9))
+        self.font_warning    = self.theme.font('font_warning', ("Arial", 10, "italic"))
 
         self._wrap_width = 500
 
         self.rows: list[tuple[tk.Frame, dict[str, Any], str]] = []          # (row_frame, ext, original_bg)
         self.selected_rows: list[tk.Frame] | None = None
-
-        # Icône upgradable
-        self._upgradable_icon = None
-        icon_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'upgradable2.png')
-        if os.path.exists(icon_path):
-            self._upgradable_icon = tk.PhotoImage(file=icon_path)
-
-        self._populate()
+        self.inner: tk.Frame | None = None
+        self.virtual: bool | None = None
+        # Textes coupés par _elide pour la largeur courante
+        self._measure_cache: dict[tuple[str, str, int], str] = {}
+        # Mode Frame : bandeau, lignes de chaque extension (réutilisées d'un set_items à l'autre)
+        # et extensions dont le retour à la ligne est à refaire (appliqué seulement quand elles
+        # deviennent visibles)
+        self._banner: tk.Frame | None = None
+        self._entries: list[_FrameEntry] = []
+        self._stale_wrap: set[int] = set()
+        self._pending_width: int | None = None
+        self._layout_pending = False
+
+        # Icônes
+        self._upgradable_icon = self.theme.image('upgradable2.png')
+        self._danger_icon = self.theme.image('Danger32.png')
+
+        self.set_items(installed_extensions, outdated_extensions)
+
+    def set_items(self, installed_extensions: list[dict[str, Any]], outdated_extensions: list[dict[str, Any]]) -> None:
+        """Remplace la liste affichée sans recréer le widget.
+
+        En mode Frame, seules les lignes ajoutées, retirées ou dont le contenu a changé sont
+        créées ou détruites. La sélection est conservée si l'extension est toujours listée.
+        """
+        self.installed_extensions = installed_extensions
+        self.outdated_extensions = outdated_extensions
+        previous = self.selected_ext
+        self.selected_ext = None
+        if previous is not None:
+            previous_key = extension_key(previous)
+            self.selected_ext = next((ext for ext in installed_extensions if extension_key(ext) == previous_key), None)
+        virtual = len(installed_extensions) > VIRTUAL_THRESHOLD if self._virtual_option is None else self._virtual_option
+        if virtual != self.virtual:
+            self._set_mode(virtual)
+        if self.virtual:
+            self._layout_virtual()
+            self._schedule_render()
+        else:
+            self._update_frame_rows()
+            if self.selected_ext is not None:
+                self._select_ext(self.selected_ext, notify=False)
+
+    def _set_mode(self, virtual: bool) -> None:
+        """Prépare le Canvas pour le mode virtuel ou pour le mode à Frame interne."""
+        self.virtual = virtual
+        self.canvas.delete("all")
+        if self.inner is not None:
+            self.inner.destroy()
+            self.inner = None
+            self._banner = None
+            self._entries = []
+            self._stale_wrap = set()
+            self.rows = []
+            self.selected_rows = None
+        if virtual:
+            # Les lignes visibles sont redessinées à chaque déplacement de la vue
+            self.canvas.configure(yscrollcommand=self._on_virtual_scroll)
+            self.canvas.bind("<Configure>", self._on_virtual_configure)
+            self.canvas.bind("<Button-1>", self._on_virtual_click)
+            self._drawn: dict[int, int] = {}   # index -> largeur utilisée pour le dessin
+            self._render_pending = False
+            self._banner_width = 0
+        else:
+            # Les retours à la ligne en attente sont appliqués quand la vue se déplace
+            self.canvas.configure(yscrollcommand=self._on_frame_scroll)
+            self.canvas.unbind("<Button-1>")
+            # Frame interne
+            self.inner = tk.Frame(self.canvas, bg=self.get_color('fond_ligne_paire'))
+            self.inner_window = self.canvas.create_window((0, 0), window=self.inner, anchor="nw")
+
+            # Fix largeur/marge
+            self.inner.bind("<Configure>", self._on_inner_configure)
+            self.canvas.bind("<Configure>", self._on_canvas_configure)
+            self._banner = self._build_banner()
 
     # --- géométrie / scroll ------------------------------------------------
 
     def _on_inner_configure(self, event: tk.Event[tk.Frame]) -> None:
-        # scrollregion
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        # scrollregion = taille du frame interne, seul élément du Canvas (pas de bbox("all"))
+        self.canvas.configure(scrollregion=(0, 0, event.width, event.height))
 
     def _on_canvas_configure(self, event: tk.Event[tk.Canvas]) -> None:
-        # largeur du frame interne = largeur du canvas
-        self.canvas.itemconfig(self.inner_window, width=event.width)
-        self._wrap_width = max(100, event.width - 30)
-        # mettre à jour les wraplength
-        for row, _ext, _original_bg in self.rows:
-            for w in row.winfo_children():
-                if hasattr(w, "_is_desc"):
-                    w.configure(wraplength=self._wrap_width)  # type: ignore[call-overload]
+        # Un redimensionnement produit une rafale d'événements : seule la dernière
+        # largeur est appliquée, une fois par passage de la boucle Tk
+        self._pending_width = event.width
+        self._schedule_layout()
+
+    def _schedule_layout(self) -> None:
+        if not self._layout_pending:
+            self._layout_pending = True
+            self.after_idle(self._apply_layout)
+
+    def _apply_layout(self) -> None:
+        self._layout_pending = False
+        if not self.winfo_exists() or self.inner is None:
+            return
+        width = self._pending_width
+        if width is not None:
+            self._pending_width = None
+            # largeur du frame interne = largeur du canvas
+            self.canvas.itemconfig(self.inner_window, width=width)
+            wrap_width = max(100, width - 30)
+            if wrap_width != self._wrap_width:
+                self._wrap_width = wrap_width
+                self._stale_wrap = set(range(len(self._entries)))
+        if self._stale_wrap:
+            self._rewrap_visible()
+
+    def _rewrap_visible(self) -> None:
+        """Met à jour le wraplength des descriptions visibles ; les autres attendent d'être affichées."""
+        for idx in self._visible_desc_rows():
+            if idx in self._stale_wrap:
+                self._stale_wrap.discard(idx)
+                entry = self._entries[idx]
+                entry.wrap_width = self._wrap_width
+                for label in entry.desc_labels:
+                    label.configure(wraplength=self._wrap_width)
+
+    def _visible_desc_rows(self) -> range:
+        """Indices des extensions dont la ligne de description est dans la vue (recherche dichotomique)."""
+        if not self._entries:
+            return range(0)
+        top = self.canvas.canvasy(0)
+        bottom = self.canvas.canvasy(self.canvas.winfo_height())
+
+        def first_below(y: float) -> int:
+            lo, hi = 0, len(self._entries)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                row = self._entries[mid].frames[1]
+                if row.winfo_y() + row.winfo_height() <= y:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            return lo
+
+        first = first_below(top)
+        last = first_below(bottom)
+        return range(first, min(last + 1, len(self._entries)))
+
+    def _on_frame_scroll(self, first: str, last: str) -> None:
+        self.scrollbar.set(first, last)
+        if self._stale_wrap:
+            self._schedule_layout()
 
     def _on_mousewheel(self, event: tk.Event[tk.Canvas]) -> None:
         if event.num == 4:
@@ -127,22 +237,15 @@ class InstalledExtensionsListWidget(tk.Frame):
     # --- contenu -----------------------------------------------------------
 
 
-    def _populate(self) -> None:
-        # Ajout du panneau danger et du label d'avertissement en haut de la liste
+    def _build_banner(self) -> tk.Frame:
+        """Panneau danger et label d'avertissement en haut de la liste (créé une fois par mode Frame)."""
+        assert self.inner is not None
         warning_frame = tk.Frame(self.inner, bg=self.get_color('fond_warning'))
         warning_frame.pack(fill="x", padx=5, pady=(5, 5), anchor="e")
 
-        # Chargement icône panneau danger
-        danger_icon_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'Danger32.png')
-        if os.path.exists(danger_icon_path):
-            danger_icon = tk.PhotoImage(file=danger_icon_path)
-        else:
-            danger_icon = None
-
+        danger_icon = self._danger_icon
         if danger_icon:
             tk.Label(warning_frame, image=danger_icon, bg=self.get_color('fond_warning')).pack(side="left", padx=(5, 20))
-            # Conserver la référence pour éviter le garbage collection
-            setattr(warning_frame, 'danger_icon', danger_icon)
 
             tk.Label(warning_frame,
                 text=_("Attention : seules les extensions avec un fichier Info.json sont listées !"),
@@ -151,140 +254,365 @@ class InstalledExtensionsListWidget(tk.Frame):
                 bg=self.get_color('fond_warning'),
                 wraplength=350,
                 justify="left").pack(side="left")
-
+        return warning_frame
+
+    def _frame_signature(self, ext: dict[str, Any]) -> tuple[Any, ...]:
+        """Tout ce que les lignes d'une extension affichent (hors couleur de fond)."""
+        return (ext.get('name', '?'), ext.get('author', '?'), ext.get("short_description", ""),
+                ext.get("repos", "") == MAJ_REPO_URL, ext.get('version', '?'), self._version_status(ext))
+
+    def _update_frame_rows(self) -> None:
+        """Rapproche les lignes existantes de la nouvelle liste.
+
+        Les lignes dont le contenu est inchangé sont gardées (recolorées si leur rang change
+        de parité) ; les autres sont créées ou détruites, puis seules les lignes nouvelles
+        sont empaquetées à leur place, sauf si l'ordre des lignes gardées a changé.
+        """
+        assert self.inner is not None and self._banner is not None
+        # La sélection est réappliquée par set_items : les lignes reprennent leur couleur
+        for entry in self._entries:
+            if self.selected_rows and entry.frames[0] in self.selected_rows:
+                self._paint_entry(entry, entry.bg)
+        self.selected_rows = None
+
+        pool: dict[tuple[Any, ...], list[_FrameEntry]] = {}
+        for entry in self._entries:
+            pool.setdefault(entry.signature, []).append(entry)
+        old_index = {id(entry): idx for idx, entry in enumerate(self._entries)}
+        entries: list[_FrameEntry] = []
         for idx, ext in enumerate(self.installed_extensions):
-            local_version = ext.get('version', '?')
-            online_txt = ""
-            upgradable = False
-
-            for outdated in self.outdated_extensions:
-                if outdated.get('name') == ext.get('name'):
-                    upgradable = True
-                    online_txt = _(" | Version en ligne : {version}").format(version=outdated.get('online_version'))
-                    break
-            else:
-                online_txt = _(" - À jour")
-
             bg_color = (
                 self.get_color('fond_ligne_paire')
                 if idx % 2 == 0
                 else self.get_color('fond_ligne_impaire')
             )
-
-            row_title = tk.Frame(self.inner, bg=bg_color)
-            row_title.pack(fill="x", expand=True)
-
-            row_description = tk.Frame(self.inner, bg=bg_color)
-            row_description.pack(fill="x", expand=True)
-
-            row_version = tk.Frame(self.inner, bg=bg_color)
-            row_version.pack(fill="x", expand=True)
-
-            self.rows.append((row_title, ext, bg_color))
-            self.rows.append((row_description, ext, bg_color))
-            self.rows.append((row_version, ext, bg_color))
-
-            # ? Ligne 1
-            tk.Label(row_title,
-                     text=ext.get('name', '?'),
-                     font=self.font_name,
-                     bg=bg_color,
-                     fg=self.get_color('text_sombre')).pack(side="left")
-
-            tk.Label(row_title,
-                     text=_(" par "),
-                     font=self.font_author,
-                     bg=bg_color,
-                     fg=self.get_color('text_by')).pack(side="left")
-
-            tk.Label(row_title,
-                     text=ext.get('author', '?'),
-                     font=self.font_author,
-                     bg=bg_color,
-                     fg=self.get_color('text_author')).pack(side="left")
-
-            # ? Ligne 2
-            if ext.get("repos", "") == "https://github.com/FrankSAURET/Maj":
-                # Ligne 1 : description courte
-                desc_label = tk.Label(row_description,
-                                      text=ext.get("short_description", ""),
-                                      font=self.font_desc,
-                                      bg=bg_color,
-                                      fg=self.get_color('text_desc'),
-                                      wraplength=self._wrap_width,
-                                      justify="left")
-                setattr(desc_label, '_is_desc', True)
-                desc_label.pack(side="top", anchor="w")
-                # Ligne 2 : message d'avertissement
-                msg = _("« M à j » ne peut pas être mis à jour par elle même. Pour la mettre à jour allez dans le dépôt :")
-                github_maj_url = "https://github.com/FrankSAURET/Maj"
-                warning_label = tk.Label(
-                    row_description,
-                    text=msg,
-                    font=self.get_font('font_warning', ("Arial", 10, "italic")),
-                    bg=bg_color,
-                    fg=self.get_color('text_highlight'),
-                    anchor="w",
-                    justify="left",
-                    wraplength=self._wrap_width,
-                    padx=20
-                )
-                warning_label.pack(side="top", anchor="w")
-                # Ligne 3 : lien cliquable seul
-                link_label = tk.Label(
-                    row_description,
-                    text=github_maj_url,
-                    font=self.get_font('font_warning', ("Arial", 10, "underline")),
-                    bg=bg_color,
-                    fg=self.get_color('text_lien'),
-                    cursor="hand2",
-                    padx=40
-                )
-                link_label.pack(side="top", anchor="w")
-                link_label.config(state="normal")
-                def open_github_url(event: tk.Event[tk.Label], url: str = github_maj_url) -> None:
-                    import webbrowser
-                    try:
-                        webbrowser.open_new_tab(url)
-                    except Exception as ex:
-                        print("[Maj] Erreur ouverture navigateur:", ex)
-                link_label.bind("<Button-1>", open_github_url)
-                link_label.bind("<ButtonRelease-1>", open_github_url)
+            signature = self._frame_signature(ext)
+            reusable = pool.get(signature)
+            if reusable:
+                entry = reusable.pop(0)
+                entry.ext = ext
+                if entry.bg != bg_color:
+                    entry.bg = bg_color
+                    self._paint_entry(entry, bg_color)
             else:
-                desc_label = tk.Label(row_description,
-                                      text=ext.get("short_description", ""),
-                                      font=self.font_desc,
-                                      bg=bg_color,
-                                      fg=self.get_color('text_desc'),
-                                      wraplength=self._wrap_width,
-                                      justify="left")
-                setattr(desc_label, '_is_desc', True)
-                desc_label.pack(side="left", anchor="w")
-
-            # ? Ligne 3 : texte à gauche, icône à droite
-            left_frame = tk.Frame(row_version, bg=bg_color)
-            left_frame.pack(side="left", fill="x", expand=True)
-
+                entry = self._build_entry(ext, signature, bg_color)
+            entries.append(entry)
+        for unused in pool.values():
+            for entry in unused:
+                for row in entry.frames:
+                    row.destroy()
+
+        kept = [old_index[id(entry)] for entry in entries if id(entry) in old_index]
+        repack_all = kept != sorted(kept)
+        previous: tk.Widget = self._banner
+        for entry in entries:
+            if repack_all or id(entry) not in old_index:
+                for row in entry.frames:
+                    row.pack(fill="x", expand=True, after=previous)
+                    previous = row
+            previous = entry.frames[-1]
+
+        self._entries = entries
+        self.rows = [(row, entry.ext, entry.bg) for entry in entries for row in entry.frames]
+        self._stale_wrap = {idx for idx, entry in enumerate(entries) if entry.wrap_width != self._wrap_width}
+        if self._stale_wrap:
+            self._schedule_layout()
+
+    def _paint_entry(self, entry: _FrameEntry, color: str) -> None:
+        for row in entry.frames:
+            row.config(bg=color)
+            for w in row.winfo_children():
+                w.configure(bg=color)  # type: ignore[call-overload]
+
+    def _build_entry(self, ext: dict[str, Any], signature: tuple[Any, ...], bg_color: str) -> _FrameEntry:
+        """Crée les trois lignes d'une extension, sans les empaqueter dans la liste."""
+        assert self.inner is not None
+        entry = _FrameEntry(ext, signature, bg_color, self._wrap_width)
+        local_version = ext.get('version', '?')
+        upgradable, online_txt = signature[-1]
+
+        row_title = tk.Frame(self.inner, bg=bg_color)
+        row_description = tk.Frame(self.inner, bg=bg_color)
+        row_version = tk.Frame(self.inner, bg=bg_color)
+        entry.frames = [row_title, row_description, row_version]
+        desc_labels = entry.desc_labels
+        # ? Ligne 1
+        tk.Label(row_title,
+                 text=ext.get('name', '?'),
+                 font=self.font_name,
+                 bg=bg_color,
+                 fg=self.get_color('text_sombre')).pack(side="left")
+
+        tk.Label(row_title,
+                 text=_(" par "),
+                 font=self.font_author,
+                 bg=bg_color,
+                 fg=self.get_color('text_by')).pack(side="left")
+
+        tk.Label(row_title,
+                 text=ext.get('author', '?'),
+                 font=self.font_author,
+                 bg=bg_color,
+                 fg=self.get_color('text_author')).pack(side="left")
+
+        # ? Ligne 2
+        if ext.get("repos", "") == MAJ_REPO_URL:
+            # Ligne 1 : description courte
+            desc_label = tk.Label(row_description,
+                                  text=ext.get("short_description", ""),
+                                  font=self.font_desc,
+                                  bg=bg_color,
+                                  fg=self.get_color('text_desc'),
+                                  wraplength=self._wrap_width,
+                                  justify="left")
+            desc_labels.append(desc_label)
+            desc_label.pack(side="top", anchor="w")
+            # Ligne 2 : message d'avertissement
+            msg = _("« M à j » ne peut pas être mis à jour par elle même. Pour la mettre à jour allez dans le dépôt :")
+            github_maj_url = MAJ_REPO_URL
+            warning_label = tk.Label(
+                row_description,
+                text=msg,
+                font=self.get_font('font_warning', ("Arial", 10, "italic")),
+                bg=bg_color,
+                fg=self.get_color('text_highlight'),
+                anchor="w",
+                justify="left",
+                wraplength=self._wrap_width,
+                padx=20
+            )
+            warning_label.pack(side="top", anchor="w")
+            desc_labels.append(warning_label)
+            # Ligne 3 : lien cliquable seul
+            link_label = tk.Label(
+                row_description,
+                text=github_maj_url,
+                font=self.get_font('font_warning', ("Arial", 10, "underline")),
+                bg=bg_color,
+                fg=self.get_color('text_lien'),
+                cursor="hand2",
+                padx=40
+            )
+            link_label.pack(side="top", anchor="w")
+            link_label.config(state="normal")
+            def open_github_url(event: tk.Event[tk.Label], url: str = github_maj_url) -> None:
+                import webbrowser
+                try:
+                    webbrowser.open_new_tab(url)
+                except Exception as ex:
+                    print("[Maj] Erreur ouverture navigateur:", ex)
+            link_label.bind("<Button-1>", open_github_url)
+            link_label.bind("<ButtonRelease-1>", open_github_url)
+        else:
+            desc_label = tk.Label(row_description,
+                                  text=ext.get("short_description", ""),
+                                  font=self.font_desc,
+                                  bg=bg_color,
+                                  fg=self.get_color('text_desc'),
+                                  wraplength=self._wrap_width,
+                                  justify="left")
+            desc_labels.append(desc_label)
+            desc_label.pack(side="left", anchor="w")
+
+        # ? Ligne 3 : texte à gauche, icône à droite
+        left_frame = tk.Frame(row_version, bg=bg_color)
+        left_frame.pack(side="left", fill="x", expand=True)
+
+        tk.Label(row_version,
+                 text=_("(Version installée: {local_version}{online_txt})").format(local_version=local_version, online_txt=online_txt),
+                 font=self.font_ver,
+                 bg=bg_color,
+                 fg=self.get_color('text_version')).pack(side="left")
+
+        if upgradable and self._upgradable_icon is not None:
             tk.Label(row_version,
-                     text=_("(Version installée: {local_version}{online_txt})").format(local_version=local_version, online_txt=online_txt),
-                     font=self.font_ver,
-                     bg=bg_color,
-                     fg=self.get_color('text_version')).pack(side="left")
-
-            if upgradable and self._upgradable_icon is not None:
-                tk.Label(row_version,
-                         image=self._upgradable_icon,
-                         bg=bg_color).pack(side="right", padx=5)
-
-            # clic sélection
-            for row in (row_title, row_description, row_version):
-                row.bind("<Button-1>", lambda e, ext=ext: self._select_ext(ext))
-                for w in row.winfo_children():
-                    w.bind("<Button-1>", lambda e, ext=ext: self._select_ext(ext))
+                     image=self._upgradable_icon,
+                     bg=bg_color).pack(side="right", padx=5)
+
+        # clic sélection (l'extension affichée par une ligne réutilisée peut changer)
+        for row in entry.frames:
+            row.bind("<Button-1>", lambda e, entry=entry: self._select_ext(entry.ext))
+            for w in row.winfo_children():
+                w.bind("<Button-1>", lambda e, entry=entry: self._select_ext(entry.ext))
+        return entry
+
+    def _version_status(self, ext: dict[str, Any]) -> tuple[bool, str]:
+        """(mise à jour disponible, suffixe de la ligne version)."""
+        key = extension_key(ext)
+        for outdated in self.outdated_extensions:
+            if extension_key(outdated) == key:
+                return True, _(" | Version en ligne : {version}").format(version=outdated.get('online_version'))
+        return False, _(" - À jour")
+
+    # --- mode virtuel --------------------------------------------------------
+
+    def _layout_virtual(self) -> None:
+        """Calcule la position de chaque ligne sans rien dessiner (hauteurs fixes par type de ligne)."""
+        line_title = max(self.font_name.metrics('linespace'), self.font_author.metrics('linespace'))
+        line_desc = self.font_desc.metrics('linespace')
+        line_warning = self.font_warning.metrics('linespace')
+        icon_h = self._upgradable_icon.height() if self._upgradable_icon is not None else 0
+        line_ver = max(self.font_ver.metrics('linespace'), icon_h)
+        self._line_heights = (line_title, line_desc, line_warning, line_ver)
+        self._banner_h = 42
+        self._offsets: list[int] = []
+        y = self._banner_h
+        for ext in self.installed_extensions:
+            self._offsets.append(y)
+            y += line_title + line_desc + line_ver + 4
+            if ext.get("repos", "") == MAJ_REPO_URL:
+                y += 2 * line_warning
+        self._total_h = y
+        # Contenu remplacé : tout est à redessiner
+        self.canvas.delete("row")
+        self._drawn = {}
+        self.canvas.configure(scrollregion=(0, 0, max(self.canvas.winfo_width(), 1), self._total_h))
+        self._draw_banner()
+
+    def _draw_banner(self) -> None:
+        width = max(self.canvas.winfo_width(), 1)
+        self._banner_width = width
+        self.canvas.delete("banner")
+        self.canvas.create_rectangle(5, 5, width - 5, self._banner_h - 5, fill=self.get_color('fond_warning'), width=0, tags=("banner",))
+        x = 10
+        if self._danger_icon is not None:
+            self.canvas.create_image(x, self._banner_h // 2, image=self._danger_icon, anchor="w", tags=("banner",))
+            x += self._danger_icon.width() + 20
+        self.canvas.create_text(x, self._banner_h // 2, text=_("Attention : seules les extensions avec un fichier Info.json sont listées !"),
+                                font=self.font_name, fill=self.get_color('text_version'), anchor="w", width=max(100, width - x - 10), tags=("banner",))
+
+    def _on_virtual_scroll(self, first: str, last: str) -> None:
+        self.scrollbar.set(first, last)
+        self._schedule_render()
+
+    def _on_virtual_configure(self, event: tk.Event[tk.Canvas]) -> None:
+        self.canvas.configure(scrollregion=(0, 0, event.width, self._total_h))
+        # Bandeau et lignes redessinés au prochain rendu, une seule fois par rafale d'événements
+        self._schedule_render()
+
+    def _schedule_render(self) -> None:
+        # Un seul rendu par passage de la boucle Tk, même si la vue bouge plusieurs fois
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render_visible)
+
+    def _visible_range(self) -> range:
+        top = self.canvas.canvasy(0)
+        bottom = self.canvas.canvasy(self.canvas.winfo_height())
+        first = max(0, bisect.bisect_right(self._offsets, top) - 1)
+        last = bisect.bisect_right(self._offsets, bottom)
+        return range(first, min(last, len(self._offsets)))
+
+    def _render_visible(self) -> None:
+        self._render_pending = False
+        if not self.winfo_exists():
+            return
+        width = self.canvas.winfo_width()
+        if max(width, 1) != self._banner_width:
+            # Les textes coupés pour l'ancienne largeur ne resserviront pas
+            self._measure_cache.clear()
+            self._draw_banner()
+        visible = self._visible_range()
+        for idx in list(self._drawn):
+            if idx not in visible or self._drawn[idx] != width:
+                self.canvas.delete(f"row{idx}")
+                del self._drawn[idx]
+        for idx in visible:
+            if idx not in self._drawn:
+                self._draw_row(idx, width)
+                self._drawn[idx] = width
+
+    def _elide(self, text: str, fnt: font.Font, key: str, max_width: int) -> str:
+        """Texte coupé par « … » pour tenir dans `max_width` pixels.
+
+        Le résultat est mémorisé pour la largeur courante du Canvas seulement (cache vidé à
+        chaque changement de largeur, voir `_render_visible`).
+        """
+        cache_key = (key, text, max_width)
+        if cache_key not in self._measure_cache:
+            result = text
+            if fnt.measure(text) > max_width:
+                lo, hi = 0, len(text)
+                while lo < hi:
+                    mid = (lo + hi + 1) // 2
+                    if fnt.measure(text[:mid] + "…") <= max_width:
+                        lo = mid
+                    else:
+                        hi = mid - 1
+                result = text[:lo] + "…"
+            self._measure_cache[cache_key] = result
+        return self._measure_cache[cache_key]
+
+    def _row_bg(self, idx: int) -> str:
+        if self.selected_ext is not None and self.installed_extensions[idx] is self.selected_ext:
+            return self.get_color('fond_selected_ext')
+        return self.get_color('fond_ligne_paire') if idx % 2 == 0 else self.get_color('fond_ligne_impaire')
+
+    def _draw_row(self, idx: int, width: int) -> None:
+        ext = self.installed_extensions[idx]
+        tags = ("row", f"row{idx}")
+        line_title, line_desc, line_warning, line_ver = self._line_heights
+        top = self._offsets[idx]
+        bottom = self._offsets[idx + 1] if idx + 1 < len(self._offsets) else self._total_h
+        self.canvas.create_rectangle(0, top, width, bottom, fill=self._row_bg(idx), width=0, tags=tags + (f"bg{idx}",))
+        y = top + 2
+        # Ligne 1 : nom par auteur
+        x = 2
+        name = str(ext.get('name', '?'))
+        self.canvas.create_text(x, y, text=name, font=self.font_name, fill=self.get_color('text_sombre'), anchor="nw", tags=tags)
+        x += self.font_name.measure(name)
+        by = _(" par ")
+        self.canvas.create_text(x, y, text=by, font=self.font_author, fill=self.get_color('text_by'), anchor="nw", tags=tags)
+        x += self.font_author.measure(by)
+        self.canvas.create_text(x, y, text=str(ext.get('author', '?')), font=self.font_author, fill=self.get_color('text_author'), anchor="nw", tags=tags)
+        y += line_title
+        # Ligne 2 : description (et avertissement pour Maj)
+        desc = self._elide(str(ext.get("short_description", "")), self.font_desc, 'desc', max(50, width - 10))
+        self.canvas.create_text(2, y, text=desc, font=self.font_desc, fill=self.get_color('text_desc'), anchor="nw", tags=tags)
+        y += line_desc
+        if ext.get("repos", "") == MAJ_REPO_URL:
+            msg = _("« M à j » ne peut pas être mis à jour par elle même. Pour la mettre à jour allez dans le dépôt :")
+            self.canvas.create_text(22, y, text=self._elide(msg, self.font_warning, 'warning', max(50, width - 30)), font=self.font_warning, fill=self.get_color('text_highlight'), anchor="nw", tags=tags)
+            y += line_warning
+            self.canvas.create_text(42, y, text=MAJ_REPO_URL, font=self.font_warning, fill=self.get_color('text_lien'), anchor="nw", tags=tags + ("link",))
+            y += line_warning
+        # Ligne 3 : version, icône à droite
+        upgradable, online_txt = self._version_status(ext)
+        text = _("(Version installée: {local_version}{online_txt})").format(local_version=ext.get('version', '?'), online_txt=online_txt)
+        self.canvas.create_text(2, y + line_ver // 2, text=text, font=self.font_ver, fill=self.get_color('text_version'), anchor="w", tags=tags)
+        if upgradable and self._upgradable_icon is not None:
+            self.canvas.create_image(width - 5, y + line_ver // 2, image=self._upgradable_icon, anchor="e", tags=tags)
+
+    def _on_virtual_click(self, event: tk.Event[tk.Canvas]) -> None:
+        if "link" in self.canvas.gettags("current"):
+            import webbrowser
+            try:
+                webbrowser.open_new_tab(MAJ_REPO_URL)
+            except Exception as ex:
+                print("[Maj] Erreur ouverture navigateur:", ex)
+            return
+        y = self.canvas.canvasy(event.y)
+        idx = bisect.bisect_right(self._offsets, y) - 1
+        if 0 <= idx < len(self.installed_extensions):
+            self._select_ext(self.installed_extensions[idx])
 
     # --- sélection ---------------------------------------------------------
 
-    def _select_ext(self, ext: dict[str, Any]) -> None:
+    def selected_extension(self) -> dict[str, Any] | None:
+        """Extension sélectionnée (None si aucune)."""
+        return self.selected_ext
+
+    def _select_ext(self, ext: dict[str, Any], notify: bool = True) -> None:
+        if self.virtual:
+            previous = self.selected_ext
+            self.selected_ext = ext
+            for idx, ext2 in enumerate(self.installed_extensions):
+                if ext2 is previous or ext2 is ext:
+                    self.canvas.itemconfig(f"bg{idx}", fill=self._row_bg(idx))
+            if self.on_select and notify:
+                self.on_select(ext)
+            return
+        self.selected_ext = ext
         if self.selected_rows:
             for row, _ext2, original_bg in self.rows:
                 if row in self.selected_rows:
@@ -300,5 +628,5 @@ class InstalledExtensionsListWidget(tk.Frame):
             for w in row.winfo_children():
                 w.configure(bg=self.get_color('fond_selected_ext'))  # type: ignore[call-overload]
 
-        if self.on_select:
+        if self.on_select and notify:
             self.on_select(ext)
@@ -7,464 +7,113 @@ Affiche la liste des extensions, permet l’installation, la mise à jour, la su
 import tkinter as tk
 import os
 from tkinter import ttk
-import ssl
 from typing import Any
 from core.repo_manager import RepoManager
+from core.catalog import Catalog
 from core.installer import Installer
 from core.updater import Updater
+from core.update_checks import extension_key
 from core.validator import Validator
 from core.config import Config
+from core import events, profiling
+from core.events import Event
+from core.journal import Journal, ERROR, INFO
+from gui.task_runner import TaskRunner
+from gui.theme import load_theme
+from gui.progress_panel import ProgressPanel
 import sys
-from i18n import _
+import threading
+import time
 import i18n
-import json
-import urllib.request
-import webbrowser
-from core.provider_utils import ProviderUtils
+from i18n import _
 
 
-def _create_ssl_context() -> ssl.SSLContext:
-    """Crée un contexte SSL sans vérification de certificats."""
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-    return ctx
+# Délai minimal entre deux revalidations du catalogue en ligne (secondes)
+CATALOG_MAX_AGE = 60
+# Nombre de lignes gardées dans la zone de log (les plus anciennes sont retirées par paquets)
+MAX_LOG_LINES = 1000
+LOG_TRIM_CHUNK = 100
 
 
 class MainWindow(tk.Frame):
     def scan_installed_extensions(self) -> list[dict[str, Any]]:
-        """
-        Parcourt le dossier d'extensions utilisateur, lit les Info.json, complète installed_extensions.json,
-        et retourne la liste des extensions installées.
-        """
-        if sys.platform.startswith('win'):
-            user_dir = os.path.expandvars(r'%APPDATA%')
-            ext_dir = os.path.join(user_dir, 'Inkscape', 'extensions')
-        else:
-            user_dir = os.path.expanduser('~')
-            ext_dir = os.path.join(user_dir, '.config', 'inkscape', 'extensions')
-               
-        installed_by_repo: dict[str, dict[str, Any]] = {}
-        current_lang: str = i18n.lang_code
-        import urllib.request
-
-        # Passe 1 : Collecter toutes les entrées avec leur locale, groupées par URL de dépôt
-        # Cela permet de ne garder qu'une seule version par extension (selon la langue courante)
-        entries_by_repos: dict[str, list[tuple[str, str, dict[str, Any]]]] = {}  # clé repos -> [(locale, root, info)]
-
-        for root, _, files in os.walk(ext_dir):
-            if 'Info.json' in files:
-                info_path = os.path.join(root, 'Info.json')
-                try:
-                    with open(info_path, 'r', encoding='utf-8') as f:
-                        info = json.load(f)
-                    # Vérifier le type
-                    if info.get('type') == 'InkScape extension':
-                        # Détecter la locale depuis le chemin du répertoire
-                        # Ex: .../locale/none/LC_MESSAGES -> "none" (= français par défaut)
-                        #     .../locale/en/LC_MESSAGES   -> "en"
-                        normalized_root = root.replace('\\', '/')
-                        entry_locale = 'none'
-                        parts = normalized_root.split('/')
-                        for i, part in enumerate(parts):
-                            if part == 'locale' and i + 1 < len(parts):
-                                entry_locale = parts[i + 1]
-                                break
-
-                        repo_url = info.get('repos', '') or root
-                        if repo_url not in entries_by_repos:
-                            entries_by_repos[repo_url] = []
-                        entries_by_repos[repo_url].append((entry_locale, root, info))
-                except Exception as e:
-                    self.log(f"Erreur lecture {info_path}: {e}", erreur=True)
-
-        # Passe 2 : Pour chaque extension, sélectionner la version correspondant à la langue courante
-        for _repo_key, entries in entries_by_repos.items():
-            chosen_locale = None
-            chosen_root = None
-            chosen_info = None
-
-            # Chercher la version correspondant à la langue courante
-            for entry_locale, root, info in entries:
-                # "none" est la locale par défaut = français
-                effective_lang = 'fr' if entry_locale == 'none' else entry_locale
-                if effective_lang == current_lang:
-                    chosen_locale = entry_locale
-                    chosen_root = root
-                    chosen_info = info
-                    break
-
-            # Fallback : prendre la version "none" (défaut, français)
-            if chosen_info is None:
-                for entry_locale, root, info in entries:
-                    if entry_locale == 'none':
-                        chosen_locale = entry_locale
-                        chosen_root = root
-                        chosen_info = info
-                        break
-
-            # Dernier fallback : première entrée disponible
-            if chosen_info is None:
-                chosen_locale, chosen_root, chosen_info = entries[0]
-
-            assert chosen_root is not None
-            assert chosen_locale is not None
-            info_to_write = dict(chosen_info)
-            download_val = info_to_write.get('download', [0])
-            download_dir = str(download_val[0])
-            actual_repo_url = info_to_write.get('repos', None)
-
-            # Si la locale sélectionnée ne correspond pas à la langue courante,
-            # tenter de charger le Info.json traduit (en ligne puis local)
-            selected_effective_lang = 'fr' if chosen_locale == 'none' else chosen_locale
-            if current_lang != selected_effective_lang and actual_repo_url:
-                try:
-                    provider = self.provider_utils.get_provider_for_url(actual_repo_url)
-                    if provider:
-                        owner, repo = self.provider_utils.split_repo_url(actual_repo_url, provider)
-                        found_online = False
-                        for branch_try in provider["alternative_main_branch"]:
-                            url_online = self.provider_utils.build_file_url(
-                                provider,
-                                owner,
-                                repo,
-                                branch_try,
-                                f"{download_dir}locale/{current_lang}/LC_MESSAGES/Info.json"
-                            )
-                            try:
-                                with urllib.request.urlopen(url_online, timeout=5, context=_create_ssl_context()) as resp:
-                                    online_info = json.load(resp)
-                                for tkey in ('name', 'short_description'):
-                                    if tkey in online_info:
-                                        info_to_write[tkey] = online_info[tkey]
-                                found_online = True
-                                break
-                            except Exception:
-                                continue
-                        if not found_online:
-                            translated_path = os.path.join(
-                                chosen_root, 'locale', current_lang, 'LC_MESSAGES', 'Info.json'
-                            )
-                            if os.path.isfile(translated_path):
-                                try:
-                                    with open(translated_path, 'r', encoding='utf-8') as ft:
-                                        translated_info = json.load(ft)
-                                    for tkey in ('name', 'short_description'):
-                                        if tkey in translated_info:
-                                            info_to_write[tkey] = translated_info[tkey]
-                                except Exception:
-                                    pass
-                except Exception:
-                    pass
-
-            info_to_write['Installed_dir'] = chosen_root
-            local_name = info_to_write.get('name')
-            if local_name:
-                installed_by_repo[local_name] = info_to_write
-        # Tri alphabétique
-        sorted_installed = dict(sorted(installed_by_repo.items(), key=lambda x: x[0].lower()))
-        # Écriture du fichier installed_extensions.json
-        installed_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'installed_extensions.json')
-        try:
-            with open(installed_path, 'w', encoding='utf-8') as f:
-                json.dump(sorted_installed, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            self.log(f"Erreur écriture installed_extensions.json: {e}", erreur=True)
-        # Retourne la liste à plat pour compatibilité usages existants
-        all_installed: list[dict[str, Any]] = []
-        for ext_list in installed_by_repo.values():
-            all_installed.append(ext_list)
-        return all_installed
+        """Rescanne le dossier d'extensions (voir Installer.scan_installed)."""
+        return self.installer.scan_installed()
 
     def get_outdated_extensions(self) -> list[dict[str, Any]]:
-        """
-        Compare les versions installées et en ligne, retourne la liste des extensions à mettre à jour.
-        """
-        installed_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'installed_extensions.json')
-        current_lang: str = i18n.lang_code
-        # Charger les extensions installées
-        try:
-            with open(installed_path, 'r', encoding='utf-8') as f:
-                data: Any = json.load(f)
-
-            if isinstance(data, dict):
-                extensions: list[dict[str, Any]] = []
-                for ext_val in data.values():  # type: ignore[union-attr]
-                    if isinstance(ext_val, list):
-                        extensions.extend(ext_val)  # type: ignore[arg-type]
-                    elif isinstance(ext_val, dict):
-                        extensions.append(ext_val)  # type: ignore[arg-type]
-            else:
-                extensions = list(data) if isinstance(data, list) else []  # type: ignore[arg-type]
-        except Exception:
-            extensions = []
-
-        upgradable: list[dict[str, Any]] = []
-
-        # Parcourir les extensions installées
-        for ext in extensions:
-            repo_url: str | None = ext.get('repos')
-            download: Any = ext.get('download')
-            local_version: str | None = ext.get('version')
-
-            online_version = None
-            info_json = None
-
-            if repo_url and download:
-
-                # Déterminer le chemin de téléchargement
-                if isinstance(download, list):
-                    download_path: str = str(download[0]) if len(download) == 1 else ''  # type: ignore[arg-type]
-                else:
-                    download_path = str(download) if download else ''
-
-                if download_path and not download_path.endswith('/'):
-                    download_path += '/'
-
-                # Trouver le provider
-                provider = self.provider_utils.get_provider_for_url(repo_url)
-                if not provider:
-                    continue
-
-                owner, repo = self.provider_utils.split_repo_url(repo_url, provider)
-
-                # Tester toutes les branches possibles
-                for branch_try in provider["alternative_main_branch"]:
-
-                    # On tente d'abord le Info.json traduit
-                    url_Infojson = self.provider_utils.build_file_url(
-                        provider,
-                        owner,
-                        repo,
-                        branch_try,
-                        f"{download_path}locale/{current_lang}/LC_MESSAGES/Info.json"
-                    )
-                    # Si le fichier n'existe pas en ligne, fallback sur le Info.json racine
-                    try:
-                        with urllib.request.urlopen(url_Infojson, timeout=5, context=_create_ssl_context()) as response:
-                            info_data = response.read().decode('utf-8')
-                            info_json = json.loads(info_data)
-                            online_version = info_json.get('version')
-                            break  # Succès → on arrête
-                    except Exception:
-                        # Fallback : Info.json racine (non traduit)
-                        url_Infojson_root = self.provider_utils.build_file_url(
-                            provider,
-                            owner,
-                            repo,
-                            branch_try,
-                            f"{download_path}Info.json"
-                        )
-                        try:
-                            with urllib.request.urlopen(url_Infojson_root, timeout=5, context=_create_ssl_context()) as response:
-                                info_data = response.read().decode('utf-8')
-                                info_json = json.loads(info_data)
-                                online_version = info_json.get('version')
-                                break
-                        except Exception:
-                            continue
-
-                    try:
-                        with urllib.request.urlopen(url_Infojson, timeout=5, context=_create_ssl_context()) as response:
-                            info_data = response.read().decode('utf-8')
-                            info_json = json.loads(info_data)
-                            online_version = info_json.get('version')
-                            break  # Succès → on arrête
-                    except Exception:
-                        continue
-
-            # Comparer les versions
-            if online_version and local_version:
-                def parse_version(v: str) -> list[int]:
-                    return [int(x) for x in str(v).split('.') if x.isdigit()]
-
-                try:
-                    if parse_version(local_version) < parse_version(online_version):
-                        ext_copy: dict[str, Any] = {}
-                        if info_json and 'name' in info_json:
-                            ext_copy['name'] = info_json['name']
-                        ext_copy['online_version'] = online_version
-                        ext_copy['local_version'] = local_version
-                        upgradable.append(ext_copy)
-                except Exception:
-                    pass
-
-        return upgradable
-    
-    def refresh_installable_extensions_list_widget(self) -> None:
+        """Extensions installées ayant une version plus récente en ligne (voir Updater.check_updates).
 
-        # 1. Construire la liste des dépôts (clé = URL du dépôt)
-        repos = self.config.repos
-        extensions_by_repo: dict[str, list[dict[str, Any]]] = {}
-
-        for repo_url in repos:
-
-            provider = self.provider_utils.get_provider_for_url(repo_url)
-            if not provider:
-                self.log(f"Provider inconnu pour : {repo_url}", erreur=True)
-                continue
-
-            owner, repo = self.provider_utils.split_repo_url(repo_url, provider)
-
-            found = False
-            repo_extensions: list[dict[str, Any]] = []
-            translated_exts: dict[str, dict[str, Any]] = {}  # clé = name FR
-            current_lang = i18n.lang_code
-
-            # Tester toutes les branches possibles
-            for branch in provider["alternative_main_branch"]:
-
-                url_json = self.provider_utils.build_file_url(
-                    provider,
-                    owner,
-                    repo,
-                    branch,
-                    "list_of_inkscape_extensions.json"
-                )
-
-                try:
-                    with urllib.request.urlopen(url_json, timeout=5, context=_create_ssl_context()) as response:
-                        data = response.read().decode("utf-8")
-                        ext_list = json.loads(data)
-
-                        ext_items: list[Any] = ext_list['extensions'] if isinstance(ext_list, dict) and 'extensions' in ext_list else []  # type: ignore[assignment]
-
-
-                        # Télécharger la version traduite si langue != fr
-                        if current_lang and current_lang != 'fr':
-                            url_translated = self.provider_utils.build_file_url(
-                                provider, owner, repo, branch,
-                                f"locale/{current_lang}/LC_MESSAGES/list_of_inkscape_extensions.json"
-                            )
-                            try:
-                                with urllib.request.urlopen(url_translated, timeout=5, context=_create_ssl_context()) as resp_tr:
-                                    tr_data = resp_tr.read().decode("utf-8")
-                                    tr_list = json.loads(tr_data)
-                                    tr_items: list[Any] = tr_list.get('extensions', []) if isinstance(tr_list, dict) else []  # type: ignore[assignment]
-                                    for tr_ext in tr_items:  # type: ignore[assignment]
-                                        tr_repos: str = str(tr_ext.get('repos', ''))  # type: ignore[union-attr]
-                                        if tr_repos:
-                                            translated_exts[tr_repos] = tr_ext
-                            except Exception:
-                                pass  # Pas de traduction disponible, on continue
-
-                        for ext in ext_items:  # type: ignore[assignment]
-                            new_ext: dict[str, Any] = {}
-                            for key in [
-                                "name", "short_description", "subject", "author",
-                                "version", "default_install_dir", "compatibility",
-                                "repos", "download", "start_here"
-                            ]:
-                                if key in ext:
-                                    new_ext[key] = ext[key]
-                            # Appliquer les traductions si disponibles
-                            ext_repos: str = str(ext.get('repos', ''))  # type: ignore[union-attr]
-                            if ext_repos in translated_exts:
-                                tr = translated_exts[ext_repos]
-                                for tkey in ('name', 'short_description', 'subject', 'start_here'):
-                                    if tkey in tr:
-                                        new_ext[tkey] = tr[tkey]
-                            repo_extensions.append(new_ext)
-
-                        found = True
-                        break  # Succès → on arrête
-                except Exception:
-                    continue
-
-            if not found:
-                self.log(f"Aucune extension trouvée pour {repo_url}", erreur=True)
-
-            # Tri alphabétique par name
-            repo_extensions = sorted(repo_extensions, key=lambda ext: ext.get('name', '').lower())
-            extensions_by_repo[repo_url] = repo_extensions
-
-        # 2. Écrire installable_extensions.json
-        installable_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'installable_extensions.json')
-        try:
-            with open(installable_path, 'w', encoding='utf-8') as f:
-                json.dump(extensions_by_repo, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            self.log(f"Erreur écriture installable_extensions.json: {e}", erreur=True)
-
-        # 2b. Extraire tous les subjects uniques
-        subjects_set: set[str] = set()
-        for repo_exts in extensions_by_repo.values():
-            for ext in repo_exts:
-                subj = ext.get('subject')
-                if isinstance(subj, list):
-                    subjects_set.update(subj)  # type: ignore[arg-type]
-                elif subj:
-                    subjects_set.add(subj)
-
-        subjects_list: list[str] = sorted(subjects_set)
-
-        # Sauvegarder dans config.json
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'config.json')
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            config_data['subjects'] = subjects_list
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            self.log(f"Erreur écriture subjects dans config.json: {e}", erreur=True)
+        Les Info.json en ligne sont mémorisés pour la session : seul le premier appel interroge
+        tous les dépôts.
+        """
+        return self.updater.check_updates()
 
-        # 3. Filtrer selon le sujet sélectionné
+    def refresh_installable_extensions_list_widget(self) -> None:
+        """Affiche tout de suite le dernier catalogue enregistré, puis le revalide en arrière-plan."""
+        if self.catalog is None:
+            self.catalog = Catalog(self.repo_manager.load_catalog())
+        self.show_installable_extensions()
+        if time.monotonic() - self._catalog_checked_at >= CATALOG_MAX_AGE:
+            self.run_task(self.repo_manager.revalidate_catalog, dict(self.catalog.by_repo), on_done=self.on_catalog_revalidated, key='catalog')
+
+    def filtered_catalog(self) -> dict[str, list[dict[str, Any]]]:
+        """Catalogue en mémoire filtré selon le dépôt et le sujet choisis (aucun accès réseau)."""
+        if self.catalog is None:
+            return {}
+        selected_repo = self.repo_var.get() if hasattr(self, 'repo_var') else None
         selected_subject = self.subject_var.get() if hasattr(self, 'subject_var') else None
-        if selected_subject and selected_subject != "Tous":
-            filtered_extensions_by_repo: dict[str, list[dict[str, Any]]] = {}
-            for repo, repo_exts in extensions_by_repo.items():
-                filtered: list[dict[str, Any]] = []
-                for ext in repo_exts:
-                    subj: Any = ext.get('subject')
-                    if isinstance(subj, list):
-                        if selected_subject in subj:
-                            filtered.append(ext)
-                    elif subj == selected_subject:
-                        filtered.append(ext)
-                if filtered:
-                    filtered_extensions_by_repo[repo] = filtered
-            extensions_by_repo = filtered_extensions_by_repo
+        return self.catalog.filter(selected_repo, selected_subject)
+
+    def on_catalog_revalidated(self, result: tuple[dict[str, list[dict[str, Any]]], list[str]]) -> None:
+        """Répercute dans la liste affichée les seules entrées des dépôts dont le contenu a changé."""
+        extensions_by_repo, changed = result
+        assert self.catalog is not None
+        self._catalog_checked_at = time.monotonic()
+        if not changed:
+            # Catalogue identique : on garde les objets affichés (et la sélection)
+            return
+        self.catalog.update(extensions_by_repo)
+        self.refresh_subject_combobox(keep_selection=True)
+        widget = self.installable_list_widget
+        if widget is None or not widget.winfo_exists():
+            return
+        widget.set_items(self.catalog.by_repo, self.filtered_catalog())
+
+    def show_installable_extensions(self) -> None:
+        """Applique le filtre courant à la liste, créée une seule fois puis mise à jour sur place."""
+        widget = self.installable_list_widget
+        if widget is not None and widget.winfo_exists():
+            widget.set_filter(self.filtered_catalog())
+            return
 
         # Nettoyer le frame d'affichage
-        for widget in self.extension_list_frame.winfo_children():
-            widget.destroy()
+        for child in self.extension_list_frame.winfo_children():
+            child.destroy()
 
         from gui.installable_extensions_list_widget import InstallableExtensionsListWidget
 
         def on_ext_select(ext: dict[str, Any] | None) -> None:
             if ext:
-                self.btn_install.config(state=tk.NORMAL)
+                self.btn_install.config(state=tk.DISABLED if self.tasks.busy else tk.NORMAL)
                 self._selected_extension = ext
             else:
                 self.btn_install.config(state=tk.DISABLED)
                 self._selected_extension = None
 
-        def deselect_extension() -> None:
-            self.btn_install.config(state=tk.DISABLED)
-            self._selected_extension = None
-
-        ext_widget = InstallableExtensionsListWidget(self.extension_list_frame, extensions_by_repo, on_select=on_ext_select)
+        ext_widget = InstallableExtensionsListWidget(self.extension_list_frame, self.catalog.by_repo if self.catalog else {}, on_select=on_ext_select)
         ext_widget.pack(fill=tk.BOTH, expand=True)
-
-        deselect_extension()
+        self.installable_list_widget = ext_widget
+        ext_widget.set_filter(self.filtered_catalog())
+        on_ext_select(None)
      
-    def __init__(self, master: tk.Tk, config: Config) -> None:
+    def __init__(self, master: tk.Tk, config: Config, scan_on_start: bool = True) -> None:
         super().__init__(master)
         self.master: tk.Tk = master  # type: ignore[assignment]
         self.config = config
-        # Charger les couleurs depuis config.json (Template[0][colors])
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'config.json')
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            template = config_data.get('Template', [{}])[0]
-            self.colors: dict[str, str] = template.get('colors', {})
-        except Exception:
-            self.colors: dict[str, str] = {}
-        def get_color(key: str) -> str:
-            result = self.colors.get(key, "#FF00FF")
-            return str(result)
+        # Couleurs, polices et images partagées par tous les widgets (Template[0] de config.json)
+        self.theme = load_theme(config.colors, config.format_text)
+        self.colors: dict[str, str] = self.theme.colors
+        get_color = self.theme.color
         self.couleur_fond = get_color('fond_principal')
         self.couleur_fond_bouton_supprimer = get_color('fond_bouton_supprimer')
         self.couleur_fond_saisie = get_color('fond_saisie')
@@ -481,19 +130,108 @@ class MainWindow(tk.Frame):
         # Charger format_text si présent
         format_text_value = getattr(self.config, 'format_text', {})
         self.format_text: dict[str, str] = format_text_value if isinstance(format_text_value, dict) else {}
-        self.repo_manager = RepoManager(config)
-        self.provider_utils = ProviderUtils(config)
-        self.installer = Installer(config)
-        self.updater = Updater(config)
-        self.validator = Validator()
+        # Cœur sans interface : les événements (journal, fin d'opération) reviennent par on_core_event
+        self._pending_events: list[Event] = []
+        # Copie de chaque entrée du journal dans data/maj.log.jsonl (opération, durée)
+        self.journal = Journal()
+        if profiling.enabled():
+            # Résumés des profils (MAJ_PROFILE) dans le journal et la zone de log
+            profiling.set_reporter(lambda message, erreur: self.on_core_event(Event(events.LOG, message, erreur)))
+        self.repo_manager = RepoManager(config, on_event=self.on_core_event)
+        self.installer = Installer(config, on_event=self.on_core_event)
+        self.updater = Updater(config, on_event=self.on_core_event, installer=self.installer)
+        self.validator = Validator(on_event=self.on_core_event)
         # Attributs créés dynamiquement dans les méthodes
         self._selected_extension: dict[str, Any] | None = None
         self.update_list_widget: Any = None
-        # Scan extensions installées et extensions obsolètes dès le lancement
-        self.scan_installed_extensions()
-        self.get_outdated_extensions()
+        self.outdated_extensions: list[dict[str, Any]] = []
+        # Catalogue des extensions installables : lu sur disque à la première ouverture de l'onglet
+        self.catalog: Catalog | None = None
+        self._catalog_checked_at = float('-inf')
+        self.installable_list_widget: Any = None
+        self.diagnostics_panel: Any = None
+        # Boutons désactivés pendant qu'une tâche de fond est en cours
+        self._action_buttons: list[tk.Button] = []
+        # Avancement des téléchargements et copies, affiché dans les onglets installées et ajout
+        self._progress_panels: list[ProgressPanel] = []
+        self.tasks = TaskRunner(self, on_busy=self.set_busy, on_callback_error=self.on_task_error)
         self.pack()
         self.create_widgets()
+        # Rejouer les événements émis avant la création de la zone de log
+        for event in self._pending_events:
+            self.show_core_event(event)
+        self._pending_events.clear()
+        # Scan des extensions installées et recherche des mises à jour une fois la fenêtre affichée
+        # (la liste affichée d'ici là est celle du dernier scan enregistré)
+        if scan_on_start:
+            self.run_task(self.scan_and_check, on_done=self.on_scan_done, key='scan')
+
+    def run_task(self, func: Any, *args: Any, on_done: Any = None, key: str | None = None, name: str | None = None) -> bool:
+        """Lance une opération longue hors du thread Tk ; les erreurs sont écrites dans le journal.
+
+        L'opération est enregistrée dans le journal persistant sous `name` (par défaut la clé
+        ou le nom de la fonction), avec sa durée.
+        """
+        name = name or key or getattr(func, '__name__', 'task')
+        return self.tasks.submit(self.journal.wrap(func, name), *args, on_done=on_done, on_error=self.on_task_error, key=key)
+
+    def on_task_error(self, error: BaseException) -> None:
+        self.log(_("Erreur : {e}").format(e=error), erreur=True)
+
+    def set_busy(self, busy: bool) -> None:
+        """Indicateur d'activité et boutons d'action pendant les tâches de fond."""
+        state = tk.DISABLED if busy else tk.NORMAL
+        if busy:
+            for panel in self._progress_panels:
+                panel.reset()
+        for btn in self._action_buttons:
+            btn.config(state=state)
+        if hasattr(self, 'btn_install'):
+            self.btn_install.config(state=tk.NORMAL if not busy and self._selected_extension else tk.DISABLED)
+        if hasattr(self, 'busy_bar'):
+            if busy:
+                self.busy_label.pack(side=tk.LEFT, padx=(10, 5))
+                self.busy_bar.pack(side=tk.LEFT)
+                self.busy_bar.start(15)
+            else:
+                self.busy_bar.stop()
+                self.busy_bar.pack_forget()
+                self.busy_label.pack_forget()
+        self.master.config(cursor='watch' if busy else '')
+
+    def scan_and_check(self) -> list[dict[str, Any]]:
+        """Rescanne les extensions installées puis cherche leurs mises à jour (thread de fond)."""
+        self.scan_installed_extensions()
+        return self.get_outdated_extensions()
+
+    def on_scan_done(self, outdated: list[dict[str, Any]] | None) -> None:
+        if outdated is not None:
+            self.outdated_extensions = outdated
+        with profiling.action('refresh installed'):
+            self.refresh_installed_extensions()
+
+    def on_core_event(self, event: Event) -> None:
+        """Enregistre un événement émis par le cœur dans le journal persistant, puis l'affiche."""
+        # Enregistré dans le thread d'origine : l'entrée garde l'opération en cours
+        self.journal.record_event(event)
+        self.show_core_event(event)
+
+    def show_core_event(self, event: Event) -> None:
+        """Affiche dans la zone de log (ou la barre d'avancement) un événement du cœur."""
+        if threading.current_thread() is not threading.main_thread():
+            # Événement émis par une tâche de fond : Tk ne doit être touché que depuis son thread
+            self.tasks.post(self.show_core_event, event)
+            return
+        if not hasattr(self, 'text_log'):
+            self._pending_events.append(event)
+            return
+        if event.kind == events.SUCCESS:
+            self.log_success(event.message, event.data.get('start_here'))
+        elif event.kind == events.LOG:
+            self.display_log(event.message, erreur=event.erreur, gras_part=event.gras_part)
+        elif event.kind == events.PROGRESS:
+            for panel in self._progress_panels:
+                panel.show_event(event)
 
     def center_window(self) -> None:
         min_w, min_h = 500, 580
@@ -530,22 +268,39 @@ class MainWindow(tk.Frame):
         style.map('TNotebook.Tab', background=[('selected', self.couleur_selectionne)])
         style.configure('TNotebook', background=self.couleur_fond, borderwidth=0)
 
-        notebook = ttk.Notebook(self)
+        notebook = self.notebook = ttk.Notebook(self)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # Onglet extensions installées
-        tab_installed = tk.Frame(notebook, bg=self.couleur_fond)
-        notebook.add(tab_installed, text=_("Extensions installées"))
-        self.create_tab_installed(tab_installed)
-
-        # Onglet ajouter une extension
-        tab_add = tk.Frame(notebook, bg=self.couleur_fond)
-        notebook.add(tab_add, text=_("Ajouter une extension"))
-        self.create_tab_add(tab_add)
+        # Seul le premier onglet est construit tout de suite ; les autres le sont à leur
+        # première ouverture, pour que la fenêtre s'affiche au plus vite
+        tab_builders = (
+            (_("Extensions installées"), self.create_tab_installed),
+            (_("Ajouter une extension"), self.create_tab_add),
+            (_("Paramètres"), self.create_tab_settings),
+            (_("Diagnostic"), self.create_tab_diagnostics),
+            (_("À propos"), self.create_tab_about),
+        )
+        tabs: list[tk.Frame] = []
+        for title, _builder in tab_builders:
+            tab = tk.Frame(notebook, bg=self.couleur_fond)
+            notebook.add(tab, text=title)
+            tabs.append(tab)
+        built: set[int] = set()
+
+        def ensure_tab(index: int) -> None:
+            if index not in built:
+                built.add(index)
+                tab_builders[index][1](tabs[index])
+        ensure_tab(0)
 
         # Zone de log partagée sous le notebook
-        lbl_log = tk.Label(self, text=_("Actions :"), bg=self.couleur_fond, fg=self.couleur_texte_sombre, font=("Arial", 11, "bold"))
-        lbl_log.pack(anchor="w", padx=10, pady=(0, 0))
+        frame_log_title = tk.Frame(self, bg=self.couleur_fond)
+        frame_log_title.pack(fill=tk.X, padx=10, pady=(0, 0))
+        lbl_log = tk.Label(frame_log_title, text=_("Actions :"), bg=self.couleur_fond, fg=self.couleur_texte_sombre, font=("Arial", 11, "bold"))
+        lbl_log.pack(side=tk.LEFT)
+        # Indicateur d'activité, affiché seulement pendant les tâches de fond
+        self.busy_label = tk.Label(frame_log_title, text=_("Travail en cours…"), bg=self.couleur_fond, fg=self.couleur_texte_sombre, font=("Arial", 10))
+        self.busy_bar = ttk.Progressbar(frame_log_title, mode='indeterminate', length=120)
         self.text_log = tk.Text(self, height=10, bg=self.couleur_fond_non_modifiable, fg=self.couleur_texte_sombre, font=("Arial", 10))
         self.text_log.pack(fill=tk.BOTH, expand=False, padx=10, pady=(0, 10))
         self.text_log.config(state=tk.NORMAL)
@@ -557,60 +312,40 @@ class MainWindow(tk.Frame):
 
         # Déclenche refresh_extension_list_widget à l'entrée dans l'onglet
         TAB_INDEX_ADD = 1  # Index de l'onglet "Ajouter une extension"
+        TAB_INDEX_DIAGNOSTICS = 3  # Index de l'onglet "Diagnostic"
         def on_tab_changed(event: tk.Event[ttk.Notebook]) -> None:
             tab_id = notebook.index("current")  # type: ignore[arg-type]
+            with profiling.action(f"tab {tab_builders[tab_id][0]}"):
+                show_tab(tab_id)
+
+        def show_tab(tab_id: int) -> None:
+            first_visit = tab_id not in built
+            ensure_tab(tab_id)
+            if tab_id == TAB_INDEX_DIAGNOSTICS and not first_visit and self.diagnostics_panel is not None:
+                self.diagnostics_panel.refresh()
             if tab_id == TAB_INDEX_ADD:
+                if self.catalog is None:
+                    self.catalog = Catalog(self.repo_manager.load_catalog())
                 self.refresh_subject_combobox()
                 self.refresh_installable_extensions_list_widget()
         notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
 
-        # Onglet paramètres
-        tab_settings = tk.Frame(notebook, bg=self.couleur_fond)
-        notebook.add(tab_settings, text=_("Paramètres"))
-        self.create_tab_settings(tab_settings)
-
-
-        # Onglet à propos
-        tab_about = tk.Frame(notebook, bg=self.couleur_fond)
-        notebook.add(tab_about, text=_("À propos"))
-        self.create_tab_about(tab_about)
-
     def create_tab_installed(self, parent: tk.Frame) -> None:
         from gui.installed_extensions_list_widget import InstalledExtensionsListWidget
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'config.json')
-        # Charger l'état initial de la case à cocher depuis config.json (Params[0])
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            params = config_data.get('Params', [{}])[0]
-            show_only_updates = params.get('show_only_updates', False)
-        except Exception:
-            show_only_updates = False
-
-        self.show_only_updates_var = tk.BooleanVar(value=show_only_updates)
-
-        def save_checkbox_state():
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
-            except Exception:
-                config_data = {}
-            # S'assurer que Params[0] existe
-            if 'Params' not in config_data or not isinstance(config_data['Params'], list) or not config_data['Params']:
-                config_data['Params'] = [{}]
-            config_data['Params'][0]['show_only_updates'] = self.show_only_updates_var.get()
-            try:
-                with open(config_path, 'w', encoding='utf-8') as f:
-                    json.dump(config_data, f, indent=2, ensure_ascii=False)
-            except Exception:
-                pass
+        # État initial de la case à cocher : Params[0].show_only_updates (config en mémoire)
+        self.show_only_updates_var = tk.BooleanVar(value=self.config.show_only_updates)
+
+        def on_show_only_updates_toggled() -> None:
+            self.config.show_only_updates = self.show_only_updates_var.get()
+            self.config.schedule_save()
+            refresh_installed_extensions()
 
         # Frame horizontal pour label + case à cocher
         frame_top = tk.Frame(parent, bg=self.couleur_fond)
         frame_top.pack(fill=tk.X, padx=10, pady=(10, 0))
         lbl_extensions = tk.Label(frame_top, text=_("Extensions installées :"), bg=self.couleur_fond, fg=self.couleur_texte_sombre, font=("Arial", 11, "bold"))
         lbl_extensions.pack(side=tk.LEFT)
-        chk = tk.Checkbutton(frame_top, text=_("Uniquement les extensions avec une mise à jour disponible"), variable=self.show_only_updates_var, bg=self.couleur_fond, fg=self.couleur_texte_sombre, selectcolor=self.couleur_fond, font=("Arial", 10), command=lambda: refresh_installed_extensions())
+        chk = tk.Checkbutton(frame_top, text=_("Uniquement les extensions avec une mise à jour disponible"), variable=self.show_only_updates_var, bg=self.couleur_fond, fg=self.couleur_texte_sombre, selectcolor=self.couleur_fond, font=("Arial", 10), command=on_show_only_updates_toggled)
         chk.pack(side=tk.LEFT, padx=(15,0))
 
         # Frame pour la liste
@@ -618,27 +353,17 @@ class MainWindow(tk.Frame):
         self.update_list_frame.pack(fill=tk.BOTH, expand=True, pady=(0,5), padx=10)
 
         def refresh_installed_extensions() -> None:
-            save_checkbox_state()
-            # Nettoyer le frame
-            for widget in self.update_list_frame.winfo_children():
-                widget.destroy()
-            # Charger toutes les extensions installées
-            installed_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'installed_extensions.json')
-            try:
-                with open(installed_path, 'r', encoding='utf-8') as f:
-                    data: dict[str, Any] = json.load(f)
-                    installed_extensions: list[dict[str, Any]] = []
-                    outdated_extensions = self.get_outdated_extensions()
-                    for ext_entry in data.values():
-                        if self.show_only_updates_var.get():
-                            for outdated in outdated_extensions:
-                                if outdated.get('name') == ext_entry.get('name'):
-                                    installed_extensions.append(ext_entry)
-                        else:
-                            installed_extensions.append(ext_entry)
-            except Exception:
-                installed_extensions = []
-            self.update_list_widget = InstalledExtensionsListWidget(self.update_list_frame, installed_extensions, self.get_outdated_extensions(), on_select=None)
+            # Dernier scan enregistré et dernière recherche de mises à jour (aucun accès réseau ici),
+            # dans la langue courante (traductions en cache)
+            installed_extensions = self.installer.localize_installed(self.installer.load_installed())
+            if self.show_only_updates_var.get():
+                outdated_keys = {extension_key(outdated) for outdated in self.outdated_extensions}
+                installed_extensions = [ext for ext in installed_extensions if extension_key(ext) in outdated_keys]
+            if self.update_list_widget is not None and self.update_list_widget.winfo_exists():
+                # Le widget (polices, images, liaisons) est réutilisé d'un rafraîchissement à l'autre
+                self.update_list_widget.set_items(installed_extensions, self.outdated_extensions)
+                return
+            self.update_list_widget = InstalledExtensionsListWidget(self.update_list_frame, installed_extensions, self.outdated_extensions, on_select=None)
             self.update_list_widget.pack(fill=tk.BOTH, expand=True)
 
         # Expose la méthode pour pouvoir l'appeler depuis l'extérieur
@@ -647,253 +372,77 @@ class MainWindow(tk.Frame):
         # Appel après la création du widget, pour garantir l'ordre
         self.refresh_installed_extensions()
 
+        progress_panel = ProgressPanel(parent, bg=self.couleur_fond, fg=self.couleur_texte_sombre)
+        progress_panel.pack(fill=tk.X, padx=10)
+        self._progress_panels.append(progress_panel)
+
         frame_btns = tk.Frame(parent, bg=self.couleur_fond)
         frame_btns.pack(fill=tk.X, padx=10, pady=10)
         btn_update = tk.Button(frame_btns, text=_("Mettre à jour"), bg=self.couleur_fond_bouton, fg=self.couleur_texte_clair, command=self.update_selected)
         btn_remove = tk.Button(frame_btns, text=_("Supprimer"), bg=self.couleur_fond_bouton_supprimer, fg=self.couleur_texte_clair, command=self.remove_selected)
+        btn_verify = tk.Button(frame_btns, text=_("Vérifier l'installation"), bg=self.couleur_fond_bouton, fg=self.couleur_texte_clair, command=self.verify_installation)
         btn_update.pack(side=tk.LEFT, padx=5)
         btn_remove.pack(side=tk.LEFT, padx=5)
-        
-    def update_selected(self) -> None:
-        import shutil, zipfile, tempfile
+        btn_validate = tk.Button(frame_btns, text=_("Valider tout"), bg=self.couleur_fond_bouton, fg=self.couleur_texte_clair, command=self.validate_all)
+        btn_verify.pack(side=tk.RIGHT, padx=5)
+        btn_validate.pack(side=tk.RIGHT, padx=5)
+        self._action_buttons.extend([btn_update, btn_remove, btn_verify, btn_validate])
 
-        # Vérifier qu'une extension est sélectionnée
-        ext_widget = getattr(self, 'update_list_widget', None)
-        if not ext_widget or not hasattr(ext_widget, 'selected_rows') or not ext_widget.selected_rows:
-            self.log(_("Aucune extension sélectionnée pour mise à jour."), erreur=True)
-            return
+    def verify_installation(self) -> None:
+        """Contrôle rapide des fichiers installés contre les empreintes enregistrées."""
+        self.run_task(self.installer.verify)
 
-        # Récupérer l'extension sélectionnée
-        ext = None
-        for row, ext2, _bg in ext_widget.rows:
-            if row in ext_widget.selected_rows:
-                ext = ext2
-                break
+    def validate_all(self) -> None:
+        """Valide toutes les extensions installées (Info.json, .inx, Python) et affiche les temps."""
+        self.run_task(lambda: self.validator.report(self.installer.load_installed()), name='validate')
 
+    def update_selected(self) -> None:
+        # Vérifier qu'une extension est sélectionnée
+        ext_widget = getattr(self, 'update_list_widget', None)
+        ext = ext_widget.selected_extension() if ext_widget else None
         if not ext:
             self.log(_("Aucune extension sélectionnée pour mise à jour."), erreur=True)
             return
 
-        ext_name = ext.get('name', '?')
-        self.log(_("Mise à jour de l'extension : {ext_name}").format(ext_name=ext_name), gras_part=ext_name)
-
-        if 'download' not in ext or not ext['download'] or 'repos' not in ext or not ext.get('Installed_dir'):
-            self.log(_("Information de téléchargement ou dossier d'installation manquante."), erreur=True)
-            return
-
-        # Dossier d'installation
-        install_dir = ext['Installed_dir']
-        os.makedirs(install_dir, exist_ok=True)
-        self.log(_("Dossier d'installation : \n   {install_dir}").format(install_dir=install_dir), gras_part=install_dir)
-
-        # Récupération du provider
-        repo_url = ext['repos']
-        provider = self.provider_utils.get_provider_for_url(repo_url)
-        if not provider:
-            self.log(_("Aucun provider compatible trouvé pour ce dépôt."), erreur=True)
-            return
-
-        owner, repo = self.provider_utils.split_repo_url(repo_url, provider)
-
-        # Télécharger le ZIP en testant toutes les branches possibles
-        tmp_zip = tempfile.NamedTemporaryFile(delete=False, suffix='.zip')
-        branch = None
-        zip_url = None
-
-        for branch_try in provider["alternative_main_branch"]:
-            try:
-                zip_url = self.provider_utils.build_zip_url(provider, owner, repo, branch_try)
-                self.log(_("Tentative téléchargement : {zip_url}").format(zip_url=zip_url), gras_part=zip_url)
-
-                with urllib.request.urlopen(zip_url, timeout=15, context=_create_ssl_context()) as response:
-                    tmp_zip.write(response.read())
-
-                branch = branch_try
-                break  # Succès → on arrête
-            except Exception:
-                continue
-
-        if branch is None:
-            self.log(_("Impossible de télécharger l'archive du dépôt sur aucune branche connue."), erreur=True)
-            return
-
-        tmp_zip.close()
+        def work() -> list[dict[str, Any]] | None:
+            return self.scan_and_check() if self.updater.update(ext) else None
+        self.run_task(work, on_done=self.on_scan_done, name=f"update {ext.get('name')}")
 
-        try:
-            # Extraction du ZIP
-            temp_extract_dir = tempfile.mkdtemp()
-            with zipfile.ZipFile(tmp_zip.name, 'r') as zip_ref:
-                zip_ref.extractall(temp_extract_dir)
-
-            # Dossier racine extrait (<repo>-<branch>)
-            repo_name = os.path.basename(repo_url)
-            root_folder = os.path.join(temp_extract_dir, f"{repo_name}-{branch}")
-
-            # Copier les fichiers/dossiers listés dans 'download'
-            for item in ext['download']:
-                src_path = os.path.join(root_folder, item)
-
-                if item.endswith('/'):
-                    # Dossier
-                    src_path = src_path.rstrip('/')
-                    dest_path = os.path.join(install_dir, os.path.basename(src_path))
-
-                    if os.path.isdir(src_path):
-                        # Sauvegarde éventuelle de Info.json
-                        info_json_in_dest = os.path.exists(os.path.join(dest_path, "Info.json"))
-                        info_json_in_src = os.path.exists(os.path.join(src_path, "Info.json"))
-                        info_json_backup = None
-
-                        if info_json_in_dest and not info_json_in_src:
-                            with open(os.path.join(dest_path, "Info.json"), "rb") as f:
-                                info_json_backup = f.read()
-
-                        # Vider le dossier cible
-                        if os.path.exists(dest_path):
-                            for root2, dirs2, files2 in os.walk(dest_path, topdown=False):
-                                for name2 in files2:
-                                    file_path = os.path.join(root2, name2)
-                                    if name2 == "Info.json" and info_json_backup is not None:
-                                        continue
-                                    try:
-                                        os.remove(file_path)
-                                    except Exception:
-                                        pass
-                                for name2 in dirs2:
-                                    try:
-                                        shutil.rmtree(os.path.join(root2, name2))
-                                    except Exception:
-                                        pass
-                        else:
-                            os.makedirs(dest_path, exist_ok=True)
-
-                        # Copier le contenu
-                        for item_name in os.listdir(src_path):
-                            s = os.path.join(src_path, item_name)
-                            d = os.path.join(dest_path, item_name)
-                            if os.path.isdir(s):
-                                shutil.copytree(s, d, dirs_exist_ok=True)
-                            else:
-                                shutil.copy2(s, d)
-
-                        # Restaurer Info.json si nécessaire
-                        if info_json_backup is not None and not info_json_in_src:
-                            with open(os.path.join(dest_path, "Info.json"), "wb") as f:
-                                f.write(info_json_backup)
-
-                        self.log(_("Dossier mis à jour : \n   {dest_path}").format(dest_path=dest_path), gras_part=dest_path)
-
-                    else:
-                        self.log(_("Dossier non trouvé dans l'archive : {src_path}").format(src_path=src_path), erreur=True)
-
-                else:
-                    # Fichier
-                    if os.path.isfile(src_path):
-                        dest_path = os.path.join(install_dir, os.path.basename(src_path))
-                        if os.path.exists(dest_path):
-                            try:
-                                os.remove(dest_path)
-                            except Exception:
-                                pass
-                        shutil.copy2(src_path, dest_path)
-                        self.log(_("Fichier mis à jour : \n{dest_path}").format(dest_path=dest_path), gras_part=dest_path)
-                    else:
-                        self.log(_("Fichier non trouvé dans l'archive : {src_path}").format(src_path=src_path), erreur=True)
-
-            # Nettoyage
-            shutil.rmtree(temp_extract_dir)
-            os.unlink(tmp_zip.name)
-
-            # Message final
-            self.text_log.config(state=tk.NORMAL)
-            self.text_log.tag_configure("highlight", foreground=self.couleur_text_highlight)
-            self.text_log.insert(tk.END, _(u"Mise à jour terminée ! Relancez InkScape pour voir l'extension.\n"), "highlight")
-            self.text_log.config(state=tk.DISABLED)
-
-            # start_here
-            start_here = ext.get('start_here')
-            if start_here:
-                self.text_log.config(state=tk.NORMAL)
-                self.text_log.tag_configure("highlight_gras", foreground=self.couleur_text_highlight, font=("Arial", 10, "bold"))
-                self.text_log.insert(tk.END, _(u"   Vous la trouverez ici :\n"), "highlight")
-                self.text_log.insert(tk.END, start_here + "\n", "highlight_gras")
-                self.text_log.config(state=tk.DISABLED)
-
-            self.text_log.see(tk.END)
-            self.scan_installed_extensions()
-            self.refresh_installed_extensions()
-
-        except Exception as e:
-            self.log(_("Erreur lors de la mise à jour : {e}").format(e=e), erreur=True, gras_part=str(e))
-            try:
-                if os.path.exists(tmp_zip.name):
-                    os.unlink(tmp_zip.name)
-            except Exception:
-                pass
+    def log_success(self, message: str, start_here: str | None) -> None:
+        """Affiche le message de fin en couleur highlight, suivi du chemin dans Inkscape."""
+        self.text_log.config(state=tk.NORMAL)
+        self.text_log.tag_configure("highlight", foreground=self.couleur_text_highlight)
+        self.text_log.insert(tk.END, message, "highlight")
+        if start_here:
+            # Tag combiné gras + couleur highlight
+            self.text_log.tag_configure("highlight_gras", foreground=self.couleur_text_highlight, font=("Arial", 10, "bold"))
+            self.text_log.insert(tk.END, _(u"   Vous la trouverez ici :\n"), "highlight")
+            self.text_log.insert(tk.END, start_here + "\n", "highlight_gras")
+        self.trim_log()
+        self.text_log.config(state=tk.DISABLED)
+        self.text_log.see(tk.END)
 
     def remove_selected(self) -> None:
         # Suppression de l'extension sélectionnée dans l'onglet extensions installées
         try:
             ext_widget = getattr(self, 'update_list_widget', None)
-            if not ext_widget or not hasattr(ext_widget, 'selected_rows') or not ext_widget.selected_rows:
-                self.log(_("Aucune extension sélectionnée pour suppression."), erreur=True)
-                return
             # Récupérer l'extension sélectionnée
-            ext = None
-            for row, ext2, _bg in ext_widget.rows:
-                if row in ext_widget.selected_rows:
-                    ext = ext2
-                    break
+            ext = ext_widget.selected_extension() if ext_widget else None
             if not ext:
                 self.log(_("Aucune extension sélectionnée pour suppression."), erreur=True)
                 return
-            # Suppression des fichiers de la clé download
-            import shutil
-            download: Any = ext.get('download')
-            install_dir: str | None = ext.get('Installed_dir')
-            if download and install_dir:
-                files: list[Any] = download if isinstance(download, list) else [download]  # type: ignore[assignment]
-                for f in files:
-                    file_str: str = str(f)
-                    # Si c'est un dossier (finissant par /), supprimer le dossier
-                    if isinstance(f, str) and f.endswith('/'):
-                        try:
-                            if os.path.isdir(install_dir):
-                                shutil.rmtree(install_dir)
-                        except Exception as ex:
-                            self.log(_("Erreur suppression dossier {install_dir}: {e}").format(install_dir=install_dir, e=ex), erreur=True)
-                    else:
-                        path = os.path.join(install_dir, file_str)
-                        try:
-                            if os.path.isdir(path):
-                                shutil.rmtree(path)
-                            elif os.path.isfile(path):
-                                os.remove(path)
-                        except Exception as e:
-                            self.log(_("Erreur suppression {path}: {e}").format(path=path, e=e), erreur=True)
-            # Supprimer le dossier si vide
-            try:
-                if install_dir and os.path.isdir(install_dir) and not os.listdir(install_dir):
-                    os.rmdir(install_dir)
-            except Exception as e:
-                self.log(_("Erreur suppression dossier {install_dir}: {e}").format(install_dir=install_dir, e=e), erreur=True)
-            # Mise à jour du fichier installed_extensions.json
-            installed_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'installed_extensions.json')
-            try:
-                with open(installed_path, 'r', encoding='utf-8') as f:
-                    data: Any = json.load(f)
-                name = ext.get('name')
-                if isinstance(data, dict):
-                    data.pop(name, None)  # type: ignore[arg-type]
-                elif isinstance(data, list):
-                    data = [e for e in data if not isinstance(e, dict) or e.get('name') != name]  # type: ignore[union-attr]
-                with open(installed_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-            except Exception as e:
-                self.log(_("Erreur mise à jour installed_extensions.json: {e}").format(e=e), erreur=True)
-            # Rafraîchir la liste
-            self.refresh_installed_extensions()
-            self.log(_("Extension supprimée : {name}").format(name=ext.get('name')))
+            name = ext.get('name')
+
+            def work() -> bool:
+                ok = self.installer.uninstall(ext)
+                self.updater.checks.invalidate(ext)
+                self.scan_installed_extensions()
+                return ok
+
+            def done(_ok: bool) -> None:
+                # Rafraîchir la liste
+                self.on_scan_done([o for o in self.outdated_extensions if extension_key(o) != extension_key(ext)])
+            self.run_task(work, on_done=done, name=f"remove {name}")
         except Exception as e:
             self.log(_("Erreur lors de la suppression : {e}").format(e=e), erreur=True)
 
@@ -914,12 +463,12 @@ class MainWindow(tk.Frame):
         self.repo_combobox = ttk.Combobox(frame_selects, textvariable=self.repo_var, state="readonly", width=40, values=repo_names)
         self.repo_combobox.current(0)
         self.repo_combobox.pack(side=tk.LEFT, padx=(0, 10))
-        self.repo_combobox.bind("<<ComboboxSelected>>", lambda e: self.refresh_installable_extensions_list_widget())
+        self.repo_combobox.bind("<<ComboboxSelected>>", lambda e: self.show_installable_extensions())
 
         self.subject_var = tk.StringVar()
         self.subject_combobox = ttk.Combobox(frame_selects, textvariable=self.subject_var, state="readonly", width=20)
         self.subject_combobox.pack(side=tk.LEFT, padx=(0, 0))
-        self.subject_combobox.bind("<<ComboboxSelected>>", lambda e: self.refresh_installable_extensions_list_widget())
+        self.subject_combobox.bind("<<ComboboxSelected>>", lambda e: self.show_installable_extensions())
         self.refresh_subject_combobox()
 
         # Bouton installer
@@ -929,168 +478,29 @@ class MainWindow(tk.Frame):
         # Liste des extensions installables
         self.extension_list_frame = tk.Frame(parent, bg=self.couleur_fond)
         self.extension_list_frame.pack(fill=tk.BOTH, expand=True, pady=5, padx=10)
+
+        progress_panel = ProgressPanel(parent, bg=self.couleur_fond, fg=self.couleur_texte_sombre)
+        progress_panel.pack(fill=tk.X, padx=10, pady=(0, 5))
+        self._progress_panels.append(progress_panel)
     
     def install_selected(self) -> None:
-        import shutil, zipfile, tempfile
         ext = getattr(self, '_selected_extension', None)
-        if not ext or 'name' not in ext:
-            self.log(_("Aucune extension sélectionnée ou information de téléchargement manquante."))
-            return
-        ext_name: str = str(ext['name'])
-        self.log(_("Installation de l'extension : {ext_name}").format(ext_name=ext_name), gras_part=ext_name)
-        if not ext or 'download' not in ext or not ext['download'] or 'repos' not in ext:
+        if not ext:
             self.log(_("Aucune extension sélectionnée ou information de téléchargement manquante."))
             return
 
-        # Déterminer le dossier utilisateur Inkscape
-        if sys.platform.startswith('win'):
-            user_dir = os.path.expandvars(r'%APPDATA%')
-            inkscape_dir = os.path.join(user_dir, 'Inkscape', 'extensions', ext['default_install_dir'])
-        else:
-            user_dir = os.path.expanduser('~')
-            inkscape_dir = os.path.join(user_dir, '.config', 'inkscape', 'extensions', ext['default_install_dir'])
-
-        # Créer le dossier d'installation s'il n'existe pas
-        os.makedirs(inkscape_dir, exist_ok=True)
-        self.log(_("Dossier d'installation : \n   {inkscape_dir}").format(inkscape_dir=inkscape_dir), gras_part=inkscape_dir)
-
-        # Déterminer la branche à utiliser via provider_utils
-        repo_url = ext['repos']
-        provider = self.provider_utils.get_provider_for_url(repo_url)
-        if not provider:
-            self.log(_("Aucun provider compatible trouvé pour ce dépôt."), erreur=True)
-            return
-
-        owner, repo = self.provider_utils.split_repo_url(repo_url, provider)
-
-        tmp_zip = tempfile.NamedTemporaryFile(delete=False, suffix='.zip')
-        branch = None
-        zip_url = None
-
-        for branch_try in provider["alternative_main_branch"]:
-            try:
-                zip_url = self.provider_utils.build_zip_url(provider, owner, repo, branch_try)
-                self.log(_("Tentative téléchargement : {zip_url}").format(zip_url=zip_url), gras_part=zip_url)
-                with urllib.request.urlopen(zip_url, timeout=15, context=_create_ssl_context()) as response:
-                    tmp_zip.write(response.read())
-                branch = branch_try
-                break
-            except Exception:
-                continue
-
-        if branch is None:
-            self.log(_("Impossible de télécharger l'archive du dépôt sur aucune branche connue."), erreur=True)
-            tmp_zip.close()
-            try:
-                os.unlink(tmp_zip.name)
-            except Exception:
-                pass
-            return
-
-        tmp_zip.close()
-
-        try:
-            # Extraire le zip dans un dossier temporaire
-            temp_extract_dir = tempfile.mkdtemp()
-            with zipfile.ZipFile(tmp_zip.name, 'r') as zip_ref:
-                zip_ref.extractall(temp_extract_dir)
-
-            # Trouver le dossier racine extrait (nommé <repo>-<branch>)
-            repo_name = os.path.basename(repo_url)
-            root_folder = os.path.join(temp_extract_dir, f"{repo_name}-{branch}")
-
-            # Copier les fichiers/dossiers listés dans 'download'
-            for item in ext['download']:
-                src_path = os.path.join(root_folder, item)
-                if item.endswith('/'):
-                    # Dossier à copier : vider d'abord le dossier cible si présent
-                    src_path = src_path.rstrip('/')
-                    dest_path = os.path.join(inkscape_dir, os.path.basename(src_path))
-                    if os.path.isdir(src_path):
-                        # Déterminer si Info.json existe dans le dossier cible et s'il sera remplacé
-                        info_json_in_dest = os.path.exists(os.path.join(dest_path, "Info.json"))
-                        info_json_in_src = os.path.exists(os.path.join(src_path, "Info.json"))
-                        # Sauvegarder Info.json si besoin
-                        info_json_backup = None
-                        if info_json_in_dest and not info_json_in_src:
-                            with open(os.path.join(dest_path, "Info.json"), "rb") as f:
-                                info_json_backup = f.read()
-                        # Vider le dossier cible (sauf Info.json si besoin)
-                        if os.path.exists(dest_path):
-                            for root2, dirs2, files2 in os.walk(dest_path, topdown=False):
-                                for name2 in files2:
-                                    file_path = os.path.join(root2, name2)
-                                    if name2 == "Info.json" and info_json_backup is not None:
-                                        continue
-                                    try:
-                                        os.remove(file_path)
-                                    except Exception:
-                                        pass
-                                for name2 in dirs2:
-                                    try:
-                                        shutil.rmtree(os.path.join(root2, name2))
-                                    except Exception:
-                                        pass
-                        else:
-                            os.makedirs(dest_path, exist_ok=True)
-                        # Copier le contenu du dossier source dans le dossier cible
-                        for item_name in os.listdir(src_path):
-                            s = os.path.join(src_path, item_name)
-                            d = os.path.join(dest_path, item_name)
-                            if os.path.isdir(s):
-                                shutil.copytree(s, d, dirs_exist_ok=True)
-                            else:
-                                shutil.copy2(s, d)
-                        # Restaurer Info.json si besoin
-                        if info_json_backup is not None and not info_json_in_src:
-                            with open(os.path.join(dest_path, "Info.json"), "wb") as f:
-                                f.write(info_json_backup)
-                        self.log(_("Dossier copié : \n   {dest_path}").format(dest_path=dest_path), gras_part=dest_path)
-                    else:
-                        self.log(_("Dossier non trouvé dans l'archive : {src_path}").format(src_path=src_path), erreur=True)
-                else:
-                    # Fichier à copier : remplacer uniquement ce fichier
-                    if os.path.isfile(src_path):
-                        dest_path = os.path.join(inkscape_dir, os.path.basename(src_path))
-                        if os.path.exists(dest_path):
-                            try:
-                                os.remove(dest_path)
-                            except Exception:
-                                pass
-                        shutil.copy2(src_path, dest_path)
-                        self.log(_("Fichier copié : \n{dest_path}").format(dest_path=dest_path), gras_part=dest_path)
-                    else:
-                        self.log(_("Fichier non trouvé dans l'archive : {src_path}").format(src_path=src_path), erreur=True)
-
-            # Nettoyer le dossier temporaire
-            shutil.rmtree(temp_extract_dir)
-            os.unlink(tmp_zip.name)
-            # Affiche le message de fin en couleur highlight
-            self.text_log.config(state=tk.NORMAL)
-            self.text_log.tag_configure("highlight", foreground=self.couleur_text_highlight)
-            self.text_log.insert(tk.END, _(u"Installation terminée ! Relancez InkScape pour voir l'extension.\n"), "highlight")
-            self.text_log.config(state=tk.DISABLED)
-            # Log du chemin d'accès dans Inkscape si start_here présent
-            start_here = ext.get('start_here')
-            if start_here:
-                self.text_log.config(state=tk.NORMAL)
-                # Tag combiné gras + couleur highlight
-                self.text_log.tag_configure("highlight_gras", foreground=self.couleur_text_highlight, font=("Arial", 10, "bold"))
-                self.text_log.insert(tk.END, _(u"   Vous la trouverez ici :\n"), "highlight")
-                self.text_log.insert(tk.END, start_here + "\n", "highlight_gras")
-                self.text_log.config(state=tk.DISABLED)
-            self.text_log.see(tk.END)
-            self.scan_installed_extensions()
-            self.refresh_installed_extensions()
-        except Exception as e:
-            self.log(_("Erreur lors de l'installation : {e}").format(e=e), erreur=True, gras_part=str(e))
-            try:
-                if os.path.exists(tmp_zip.name):
-                    os.unlink(tmp_zip.name)
-            except Exception:
-                pass
+        def work() -> list[dict[str, Any]] | None:
+            if not self.installer.install(ext):
+                return None
+            # Seule l'extension installée est revérifiée en ligne, les autres restent en mémoire
+            self.updater.checks.invalidate(ext)
+            return self.scan_and_check()
+        self.run_task(work, on_done=self.on_scan_done, name=f"install {ext.get('name')}")
 
     def refresh_repo_combobox(self) -> None:
+        if not hasattr(self, 'repo_combobox'):
+            # Onglet d'ajout pas encore construit : il lira la liste à jour à sa création
+            return
         repo_names = ["Tous"] + self.config.repos
         self.repo_combobox['values'] = repo_names
         if self.repo_var.get() not in repo_names:
@@ -1126,33 +536,120 @@ class MainWindow(tk.Frame):
         btn_del_repo.pack(side=tk.LEFT, padx=5)
         self.refresh_repo_listbox()
 
+        # Langue de l'interface, changée sur place depuis les traductions en cache
+        frame_lang = tk.Frame(parent, bg=self.couleur_fond)
+        frame_lang.pack(fill=tk.X, padx=10, pady=(0, 10))
+        lbl_lang = tk.Label(frame_lang, text=_("Langue :"), bg=self.couleur_fond, fg=self.couleur_texte_sombre, font=("Arial", 12, "bold"))
+        lbl_lang.pack(side=tk.LEFT, padx=(0, 10))
+        languages = i18n.available_languages()
+        if i18n.lang_code not in languages:
+            languages.append(i18n.lang_code)
+        lang_combobox = ttk.Combobox(frame_lang, state="readonly", width=20, values=[i18n.language_name(lang) for lang in languages])
+        lang_combobox.current(languages.index(i18n.lang_code))
+        lang_combobox.pack(side=tk.LEFT)
+
+        def on_language_selected(event: tk.Event[ttk.Combobox]) -> None:
+            lang = languages[lang_combobox.current()]
+            # Après le traitement de l'événement : la liste déroulante va être détruite
+            self.after_idle(lambda: self.set_language(lang))
+        lang_combobox.bind("<<ComboboxSelected>>", on_language_selected)
+
+    def set_language(self, lang: str) -> None:
+        """Change la langue de l'interface sans accès réseau ni nouveau scan.
+
+        Les catalogues gettext et les traductions des extensions (catalogue et extensions
+        installées) viennent des caches ; les widgets sont reconstruits avec les nouveaux textes.
+        """
+        if lang == i18n.lang_code:
+            return
+        i18n.set_language(lang)
+        self.config.language = lang
+        self.config.schedule_save()
+        if self.catalog is not None:
+            self.catalog.update(self.repo_manager.localize_catalog(self.catalog.by_repo, lang))
+        # Les mises à jour trouvées sont rapprochées des extensions installées par dépôt et chemin
+        # de téléchargement (extension_key), pas par leur nom : leur nom suit la nouvelle langue
+        names = {extension_key(ext): ext.get('name') for ext in self.installer.localize_installed(self.installer.load_installed(), lang)}
+        self.outdated_extensions = [{**o, 'name': names.get(extension_key(o), o.get('name'))} for o in self.outdated_extensions]
+        self.rebuild_widgets()
+
+    def rebuild_widgets(self) -> None:
+        """Recrée tous les widgets (textes traduits) en gardant l'onglet courant et le contenu du log."""
+        log_dump = self.text_log.dump('1.0', 'end-1c', text=True, tag=True)
+        current_tab = self.notebook.index('current')
+        for child in self.winfo_children():
+            child.destroy()
+        self.update_list_widget = None
+        self.installable_list_widget = None
+        self.diagnostics_panel = None
+        self._selected_extension = None
+        self._action_buttons = []
+        self._progress_panels = []
+        # Widgets des onglets construits à leur première ouverture : ils le seront de nouveau
+        for name in ('repo_var', 'repo_combobox', 'subject_var', 'subject_combobox', 'btn_install', 'extension_list_frame', 'entry_repo', 'listbox_repos'):
+            self.__dict__.pop(name, None)
+        self.create_widgets()
+        self.notebook.select(current_tab)
+        self.text_log.config(state=tk.NORMAL)
+        self.text_log.tag_configure("highlight", foreground=self.couleur_text_highlight)
+        self.text_log.tag_configure("highlight_gras", foreground=self.couleur_text_highlight, font=("Arial", 10, "bold"))
+        tags: list[str] = []
+        for key, value, _index in log_dump:
+            if key == 'tagon' and value != 'sel':
+                tags.append(value)
+            elif key == 'tagoff' and value in tags:
+                tags.remove(value)
+            elif key == 'text':
+                self.text_log.insert(tk.END, value, tuple(tags))
+        self.text_log.config(state=tk.DISABLED)
+        self.text_log.see(tk.END)
+        self.set_busy(self.tasks.busy)
+
     def refresh_repo_listbox(self) -> None:
         self.listbox_repos.delete(0, tk.END)
         for repo in self.config.repos:
             self.listbox_repos.insert(tk.END, repo)
 
     def add_repo(self) -> None:
-        repo = self.entry_repo.get().strip()
-        if repo and repo not in self.config.repos:
-            self.config.repos.append(repo)
-            self.config.save()
+        if self.repo_manager.add_repo(self.entry_repo.get()):
+            # Le catalogue sera revalidé à la prochaine ouverture de l'onglet
+            self._catalog_checked_at = float('-inf')
             self.refresh_repo_listbox()
             self.refresh_repo_combobox()
             self.entry_repo.delete(0, tk.END)
-            self.log(_("Dépôt ajouté : {repo}").format(repo=repo))
 
     def delete_repo(self) -> None:
         sel: tuple[int, ...] = self.listbox_repos.curselection()  # type: ignore[assignment]
         if sel:
             repo: str = str(self.listbox_repos.get(sel[0]))  # type: ignore[arg-type]
-            if repo in self.config.repos:
-                self.config.repos.remove(repo)
-                self.config.save()
+            self.repo_manager.remove_repo(repo)
+            self._catalog_checked_at = float('-inf')
             self.refresh_repo_listbox()
             self.refresh_repo_combobox()
-            self.log(_("Dépôt supprimé : {repo}").format(repo=repo))
+
+    def create_tab_diagnostics(self, parent: tk.Frame) -> None:
+        from gui.diagnostics_panel import DiagnosticsPanel
+        parent.configure(bg=self.couleur_fond)
+        self.diagnostics_panel = DiagnosticsPanel(parent, bg=self.couleur_fond, fg=self.couleur_texte_sombre,
+                                                  button_bg=self.couleur_fond_bouton, button_fg=self.couleur_texte_clair,
+                                                  session_info=self.diagnostics_session_info)
+        self.diagnostics_panel.pack(fill=tk.BOTH, expand=True)
+
+    def diagnostics_session_info(self) -> list[str]:
+        """Résumé affiché dans l'onglet Diagnostic : cache des mises à jour et opérations du journal."""
+        checks = self.updater.checks.stats()
+        ends = [entry for entry in self.journal.recent if entry.get('kind') == 'op_end']
+        failed = sum(1 for entry in ends if not entry.get('ok'))
+        return [
+            _("Recherches de mises à jour : {entries} en mémoire, {hits} servies depuis la mémoire, {misses} en ligne").format(**checks),
+            _("Opérations : {count} terminées, dont {failed} en échec").format(count=len(ends), failed=failed),
+        ]
 
     def create_tab_about(self, parent: tk.Frame) -> None:
+        def open_url(url: str) -> None:
+            # webbrowser (et subprocess, shutil) n'est chargé qu'au premier clic sur un lien
+            import webbrowser
+            webbrowser.open(url)
         sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
         try:
             from __init__ import __version__, __author__, __license__
@@ -1183,14 +680,19 @@ class MainWindow(tk.Frame):
         github_url = "https://github.com/FrankSAURET/Maj"
         lbl_github = tk.Label(parent, text=github_url, font=("Arial", 11, "underline"), fg=self.couleur_lien, bg=self.couleur_fond, cursor="hand2")
         lbl_github.pack(pady=(10, 10))
-        lbl_github.bind("<Button-1>", lambda e: webbrowser.open(github_url))
+        lbl_github.bind("<Button-1>", lambda e: open_url(github_url))
         # Lien pour l'aide aux développeurs
         github_aide_url = "https://franksauret.github.io/Maj/"
         lbl_github_aide = tk.Label(parent, text=_("Documentation développeur"), font=("Arial", 11, "underline"), fg=self.couleur_lien, bg=self.couleur_fond, cursor="hand2")
         lbl_github_aide.pack(pady=(10, 10))
-        lbl_github_aide.bind("<Button-1>", lambda e: webbrowser.open(github_aide_url))
+        lbl_github_aide.bind("<Button-1>", lambda e: open_url(github_aide_url))
     
     def log(self, message: str, erreur: bool = False, gras_part: str | None = None) -> None:
+        """Message de l'interface : écrit dans le journal persistant et affiché."""
+        self.journal.write(message, ERROR if erreur else INFO, kind='gui')
+        self.display_log(message, erreur, gras_part)
+
+    def display_log(self, message: str, erreur: bool = False, gras_part: str | None = None) -> None:
         self.text_log.config(state=tk.NORMAL)
         if gras_part and gras_part in message:
             before, middle, after = message.partition(gras_part)
@@ -1207,20 +709,33 @@ class MainWindow(tk.Frame):
                 self.text_log.insert(tk.END, message + "\n", "erreur")
             else:
                 self.text_log.insert(tk.END, message + "\n")
+        self.trim_log()
         self.text_log.see(tk.END)
         self.text_log.config(state=tk.DISABLED)
 
-    def refresh_subject_combobox(self) -> None:
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'config.json')
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            params = config_data.get('Params', [{}])[0]
-            subjects = params.get('subjects', [])
-            subjects = sorted(subjects)
-        except Exception:
-            subjects = []
-        self.subject_combobox['values'] = ["Tous"] + subjects
-        self.subject_combobox.current(0)
+    def trim_log(self) -> None:
+        """Retire les plus anciennes lignes au-delà de MAX_LOG_LINES (le fichier journal garde tout)."""
+        lines = int(self.text_log.index('end-1c').split('.')[0])
+        if lines > MAX_LOG_LINES + LOG_TRIM_CHUNK:
+            self.text_log.delete('1.0', f'{lines - MAX_LOG_LINES + 1}.0')
+
+    def refresh_subject_combobox(self, keep_selection: bool = False) -> None:
+        if not hasattr(self, 'subject_combobox'):
+            # Onglet d'ajout pas encore construit (ou reconstruit après un changement de langue) :
+            # il lira les sujets à jour à sa création
+            return
+        if self.catalog is not None:
+            # Sujets du catalogue en mémoire
+            subjects = self.catalog.subjects()
+        else:
+            # Sujets enregistrés lors du dernier scan (config en mémoire)
+            subjects = sorted(self.config.subjects)
+        values = ["Tous"] + subjects
+        current = self.subject_var.get()
+        self.subject_combobox['values'] = values
+        if keep_selection and current in values:
+            self.subject_combobox.current(values.index(current))
+        else:
+            self.subject_combobox.current(0)
 
 
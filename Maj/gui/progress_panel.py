@@ -0,0 +1,79 @@
+"""Barre d'avancement des opérations longues (téléchargement, comparaison, copie)."""
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Any
+
+from core.events import Event
+from core.progress import format_duration, phase_label
+
+# Graduation de la barre en mode déterminé
+SCALE = 1000
+
+
+def _short_duration(seconds: float) -> str:
+    return format_duration(seconds) if seconds >= 1 else f"{seconds * 1000:.0f} ms"
+
+
+class ProgressPanel(tk.Frame):
+    """Phase en cours (barre, débit, temps restant) et durée des phases terminées.
+
+    Le cadre est vide (et donc sans hauteur) tant qu'aucune opération n'a commencé ;
+    le bilan de la dernière opération reste affiché jusqu'à `reset()`.
+    """
+
+    def __init__(self, parent: tk.Widget, bg: str, fg: str, *args: Any, **kwargs: Any) -> None:
+        super().__init__(parent, *args, bg=bg, **kwargs)
+        self.label = tk.Label(self, bg=bg, fg=fg, font=("Arial", 9), anchor="w")
+        self.bar = ttk.Progressbar(self, orient="horizontal", mode="determinate", maximum=SCALE)
+        self.phases_label = tk.Label(self, bg=bg, fg=fg, font=("Arial", 9, "italic"), anchor="w")
+        self._phases: dict[str, float] = {}
+        self._shown = False
+        self._indeterminate = False
+
+    def show_event(self, event: Event) -> None:
+        """Affiche un événement PROGRESS du cœur."""
+        data = event.data
+        if not self._shown:
+            self.label.pack(fill=tk.X)
+            self.bar.pack(fill=tk.X)
+            self.phases_label.pack(fill=tk.X)
+            self._shown = True
+        total = data.get('total')
+        if data.get('finished'):
+            self._set_indeterminate(False)
+            self.bar['value'] = SCALE
+            self._phases[data.get('phase', '')] = data.get('elapsed', 0.0)
+            self.phases_label.config(text=" · ".join(f"{phase_label(p)} {_short_duration(t)}" for p, t in self._phases.items()))
+        elif total:
+            self._set_indeterminate(False)
+            self.bar['value'] = min(SCALE, SCALE * data.get('done', 0) / total)
+        else:
+            # Taille inconnue (pas de Content-Length) : barre animée
+            self._set_indeterminate(True)
+        name = data.get('name')
+        self.label.config(text=f"{name} – {event.message}" if name else event.message)
+
+    def _set_indeterminate(self, indeterminate: bool) -> None:
+        if indeterminate == self._indeterminate:
+            return
+        self._indeterminate = indeterminate
+        if indeterminate:
+            self.bar.config(mode="indeterminate")
+            self.bar.start(15)
+        else:
+            self.bar.stop()
+            self.bar.config(mode="determinate")
+
+    def reset(self) -> None:
+        """Efface le bilan précédent (au début d'une nouvelle opération)."""
+        self._set_indeterminate(False)
+        self._phases.clear()
+        self.bar['value'] = 0
+        self.label.config(text="")
+        self.phases_label.config(text="")
+        if self._shown:
+            for widget in (self.label, self.bar, self.phases_label):
+                widget.pack_forget()
+            self._shown = False
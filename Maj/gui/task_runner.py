@@ -0,0 +1,155 @@
+"""Exécution des opérations longues (réseau, disque) hors du thread Tk.
+
+Les tâches tournent dans un thread de travail unique : elles sont donc exécutées dans
+l'ordre de soumission et ne se chevauchent jamais (le cœur n'est pas prévu pour des
+accès concurrents au dossier d'extensions). Les résultats, erreurs et événements émis
+pendant une tâche passent par une file thread-safe que la boucle Tk vide avec `after()`.
+"""
+from __future__ import annotations
+
+import queue
+import threading
+import tkinter as tk
+from typing import Any, Callable
+
+
+class TaskRunner:
+    """Exécuteur de tâches de fond pour une fenêtre Tk.
+
+    - `submit()` lance une fonction dans le thread de travail ; `on_done(result)` ou
+      `on_error(exc)` sont ensuite appelés dans le thread Tk ;
+    - `post()` planifie un appel dans le thread Tk depuis n'importe quel thread ;
+    - `on_busy(busy)` est appelé quand le nombre de tâches en cours passe de 0 à 1 ou de 1 à 0 ;
+    - `on_callback_error(exc)` reçoit les exceptions levées par les appels faits dans le thread
+      Tk (`on_done`, `post`) : sous Inkscape, il n'y a pas de console pour les afficher.
+    """
+
+    def __init__(self, widget: tk.Misc, on_busy: Callable[[bool], None] | None = None, poll_ms: int = 30,
+                 on_callback_error: Callable[[BaseException], None] | None = None) -> None:
+        self.widget = widget
+        self.on_busy = on_busy
+        self.on_callback_error = on_callback_error
+        self.poll_ms = poll_ms
+        # Thread de travail démarré à la première tâche. Un simple thread plutôt que
+        # concurrent.futures, qui importe logging au démarrage. Il est daemon pour ne jamais
+        # bloquer la sortie ; Maj.py attend la fin de la tâche en cours avec shutdown(wait=True).
+        self._jobs: queue.Queue[Callable[[], None] | None] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._queue: queue.Queue[tuple[Callable[..., Any], tuple[Any, ...]]] = queue.Queue()
+        self._pending = 0
+        self._keys: set[str] = set()
+        self._polling = False
+        widget.bind('<Destroy>', self._on_destroy, add='+')
+
+    @property
+    def busy(self) -> bool:
+        return self._pending > 0
+
+    def is_pending(self, key: str) -> bool:
+        return key in self._keys
+
+    def submit(self, func: Callable[..., Any], *args: Any, on_done: Callable[[Any], None] | None = None, on_error: Callable[[BaseException], None] | None = None, key: str | None = None) -> bool:
+        """Lance `func(*args)` en arrière-plan (à appeler depuis le thread Tk).
+
+        Avec `key`, la tâche n'est pas relancée si une tâche de même clé est déjà en attente ;
+        retourne alors False.
+        """
+        if key is not None:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+        self._pending += 1
+        if self._pending == 1 and self.on_busy:
+            self.on_busy(True)
+
+        def run() -> None:
+            try:
+                result = func(*args)
+            except BaseException as e:
+                self.post(self._finish, key, on_error, e, True)
+            else:
+                self.post(self._finish, key, on_done, result, False)
+
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._work, name='maj-task', daemon=True)
+            self._worker.start()
+        self._jobs.put(run)
+        self._ensure_polling()
+        return True
+
+    def _work(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            job()
+
+    def post(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Planifie `callback(*args)` dans le thread Tk (thread-safe).
+
+        Les appels postés hors d'une tâche depuis un autre thread ne sont traités qu'au
+        prochain cycle de scrutation (déclenché par `submit`).
+        """
+        self._queue.put((callback, args))
+        if threading.current_thread() is threading.main_thread():
+            self._ensure_polling()
+
+    def _finish(self, key: str | None, callback: Callable[[Any], None] | None, value: Any, failed: bool) -> None:
+        if key is not None:
+            self._keys.discard(key)
+        self._pending -= 1
+        try:
+            if callback:
+                callback(value)
+            elif failed:
+                raise value
+        finally:
+            if self._pending == 0 and self.on_busy:
+                self.on_busy(False)
+
+    def _ensure_polling(self) -> None:
+        if not self._polling:
+            self._polling = True
+            self.widget.after(self.poll_ms, self._drain)
+
+    def _drain(self) -> None:
+        try:
+            while True:
+                callback, args = self._queue.get_nowait()
+                try:
+                    callback(*args)
+                except Exception as e:
+                    # Une erreur d'affichage ne doit pas interrompre la file
+                    self._callback_failed(e)
+        except queue.Empty:
+            pass
+        if self._pending or not self._queue.empty():
+            self.widget.after(self.poll_ms, self._drain)
+        else:
+            self._polling = False
+
+    def _callback_failed(self, error: Exception) -> None:
+        if self.on_callback_error is not None:
+            try:
+                self.on_callback_error(error)
+                return
+            except Exception:
+                pass
+        import traceback
+        traceback.print_exception(error)
+
+    def _on_destroy(self, event: tk.Event[Any]) -> None:
+        if event.widget is self.widget:
+            self.shutdown()
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Abandonne les tâches en attente ; avec `wait`, attend la fin de la tâche en cours
+        (une copie de fichiers interrompue laisserait une extension incomplète)."""
+        try:
+            while True:
+                self._jobs.get_nowait()
+        except queue.Empty:
+            pass
+        self._jobs.put(None)
+        if wait and self._worker is not None and self._worker is not threading.current_thread():
+            self._worker.join()
@@ -0,0 +1,117 @@
+"""Ressources graphiques partagées : couleurs, polices, images, styles ttk et molette.
+
+Tout est chargé une seule fois par processus puis réutilisé par les widgets, qui
+peuvent ainsi être reconstruits ou rafraîchis sans relire config.json ni recréer
+leurs polices et leurs images.
+"""
+from __future__ import annotations
+
+import os
+import tkinter as tk
+from tkinter import font, ttk
+from typing import Any, Callable
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), '..', 'assets')
+
+# Couleur affichée quand une clé manque dans config.json (bien visible volontairement)
+MISSING_COLOR = "#FF00FF"
+
+
+class Theme:
+    """Registre des ressources d'une application Tk (un seul par processus, voir `get_theme`)."""
+
+    def __init__(self, colors: dict[str, str], format_text: dict[str, Any]) -> None:
+        self.colors = colors
+        self.format_text = format_text
+        self._fonts: dict[tuple[Any, ...], font.Font] = {}
+        self._images: dict[str, tk.PhotoImage | None] = {}
+        self._styles: set[str] = set()
+        # Widgets qui défilent à la molette : un seul bind_all pour toute l'application
+        self._wheel_targets: list[tuple[tk.Misc, Callable[[tk.Event[Any]], None]]] = []
+        self._wheel_bound = False
+
+    def color(self, key: str) -> str:
+        return str(self.colors.get(key, MISSING_COLOR))
+
+    def font_spec(self, key: str, fallback: tuple[Any, ...]) -> tuple[Any, ...]:
+        val = self.format_text.get(key)
+        return tuple(val) if val else fallback
+
+    def font(self, key: str, fallback: tuple[Any, ...]) -> font.Font:
+        """Police `format_text[key]` (ou `fallback`), créée à la première demande."""
+        spec = self.font_spec(key, fallback)
+        if spec not in self._fonts:
+            self._fonts[spec] = font.Font(font=spec)
+        return self._fonts[spec]
+
+    def image(self, filename: str) -> tk.PhotoImage | None:
+        """Image du dossier assets (None si absente), chargée à la première demande."""
+        if filename not in self._images:
+            path = os.path.join(ASSETS_DIR, filename)
+            self._images[filename] = tk.PhotoImage(file=path) if os.path.exists(path) else None
+        return self._images[filename]
+
+    def scrollbar_style(self) -> str:
+        """Nom du style des barres de défilement verticales, configuré une seule fois."""
+        name = 'Custom.Vertical.TScrollbar'
+        if name not in self._styles:
+            style = ttk.Style()
+            style.theme_use('clam')
+            style.configure(name,
+                background=self.color('scrollbar_slider'),
+                troughcolor=self.color('scrollbar_trough'),
+                bordercolor=self.color('scrollbar_trough'),
+                arrowcolor=self.color('scrollbar_arrow'),
+                lightcolor=self.color('scrollbar_trough'),
+                darkcolor=self.color('scrollbar_trough'),
+                relief='flat')
+            style.map(name,
+                background=[('active', self.color('scrollbar_slider_hover'))]
+            )
+            self._styles.add(name)
+        return name
+
+    def register_wheel(self, widget: tk.Misc, handler: Callable[[tk.Event[Any]], None]) -> None:
+        """Fait défiler `widget` à la molette.
+
+        L'événement va au widget enregistré situé sous le pointeur, sinon au dernier
+        enregistré encore affiché (comportement de l'ancien bind_all par widget).
+        """
+        self._wheel_targets = [(w, h) for w, h in self._wheel_targets if w is not widget and w.winfo_exists()]
+        self._wheel_targets.append((widget, handler))
+        if not self._wheel_bound:
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                widget.bind_all(sequence, self._on_wheel, add="+")
+            self._wheel_bound = True
+
+    def _on_wheel(self, event: tk.Event[Any]) -> None:
+        self._wheel_targets = [(w, h) for w, h in self._wheel_targets if w.winfo_exists()]
+        if not self._wheel_targets:
+            return
+        target = event.widget if isinstance(event.widget, tk.Misc) else None
+        while target is not None:
+            for w, handler in self._wheel_targets:
+                if w is target:
+                    handler(event)
+                    return
+            target = target.master
+        self._wheel_targets[-1][1](event)
+
+
+_theme: Theme | None = None
+
+
+def load_theme(colors: dict[str, str], format_text: dict[str, Any]) -> Theme:
+    """Initialise le registre avec les couleurs et polices de la configuration déjà chargée."""
+    global _theme
+    _theme = Theme(colors, format_text)
+    return _theme
+
+
+def get_theme() -> Theme:
+    """Registre du processus ; à défaut de `load_theme`, lu une fois dans config.json."""
+    if _theme is None:
+        from core.config import Config
+        config = Config.load()
+        return load_theme(config.colors, config.format_text)
+    return _theme
@@ -1,34 +1,96 @@
 """Module de traduction centralisé pour Maj."""
 import gettext
+import json
 import os
-import xml.etree.ElementTree as ET
-from typing import Callable
+from typing import Any, Callable
 
 _translator: Callable[[str], str] = gettext.gettext
 lang_code: str = 'fr'
+DEFAULT_LANG = 'fr'
+_localedir: str | None = None
+# Catalogues gettext déjà chargés, par langue : changer de langue ne relit aucun fichier
+_catalogs: dict[str, gettext.NullTranslations] = {}
 
+# Noms affichés dans le sélecteur de langue (code affiché à défaut)
+LANGUAGE_NAMES = {
+    'fr': 'Français',
+    'en': 'English',
+    'de': 'Deutsch',
+    'es': 'Español',
+    'it': 'Italiano',
+}
 
-def _read_inkscape_language() -> str | None:
-    """Lit la langue définie dans preferences.xml d'Inkscape."""
-    # Chemins possibles selon OS
-    paths = [
+
+# Langue lue dans preferences.xml, mémorisée d'un lancement à l'autre (clé : chemin, date et taille)
+LANGUAGE_CACHE_FILE = os.path.join(os.path.dirname(__file__), 'data', 'inkscape_language.json')
+
+
+def _inkscape_preferences_paths() -> list[str]:
+    """Chemins possibles de preferences.xml selon l'OS."""
+    return [
         os.path.expanduser("~/.config/inkscape/preferences.xml"),  # Linux
         os.path.join(os.environ.get("APPDATA", ""), "Inkscape", "preferences.xml"),  # Windows
         os.path.expanduser("~/Library/Application Support/org.inkscape.Inkscape/config/inkscape/preferences.xml"),  # macOS
     ]
 
-    for path in paths:
-        if os.path.exists(path):
+
+def _parse_ui_language(path: str) -> str | None:
+    """Attribut `language` du groupe `ui`, lu au fil du fichier : la lecture s'arrête dès ce groupe."""
+    # ElementTree n'est chargé que si le fichier de préférences a changé depuis le dernier lancement
+    from xml.etree.ElementTree import iterparse
+    depth = 0
+    for event, elem in iterparse(path, events=('start', 'end')):
+        if event == 'end':
+            depth -= 1
+            if depth > 0:
+                # Éléments déjà parcourus : libérés au fur et à mesure
+                elem.clear()
+            continue
+        depth += 1
+        if elem.tag == 'group' and elem.get('id') == 'ui':
+            lang = elem.get('language')
+            return lang.split('_')[0] if lang else None
+    return None
+
+
+def _load_language_cache() -> dict[str, dict[str, Any]]:
+    try:
+        with open(LANGUAGE_CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _read_inkscape_language() -> str | None:
+    """Lit la langue définie dans preferences.xml d'Inkscape.
+
+    Le résultat est mémorisé par fichier avec sa date de modification et sa taille :
+    tant que les préférences ne changent pas, un lancement ne coûte qu'un `stat`.
+    """
+    cache = _load_language_cache()
+    for path in _inkscape_preferences_paths():
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        stamp = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+        entry = cache.get(path)
+        if isinstance(entry, dict) and all(entry.get(k) == v for k, v in stamp.items()):
+            lang: str | None = entry.get('language')
+        else:
             try:
-                tree = ET.parse(path)
-                root = tree.getroot()
-                ui_group = root.find(".//group[@id='ui']")
-                if ui_group is not None:
-                    lang = ui_group.get("language")
-                    if lang:
-                        return lang.split('_')[0]
+                lang = _parse_ui_language(path)
             except Exception:
+                lang = None
+            cache[path] = {**stamp, 'language': lang}
+            try:
+                from core.paths import write_json_atomic
+                write_json_atomic(LANGUAGE_CACHE_FILE, cache)
+            except OSError:
                 pass
+        if lang:
+            return lang
 
     return None
 
@@ -48,20 +110,52 @@ def setup(localedir: str) -> None:
     2. Langue du système
     3. Français par défaut
     """
-    global _translator, lang_code
+    global _localedir
 
     lang = _read_inkscape_language()
     if not lang:
         lang = _read_system_language()
     if not lang:
-        lang = "fr"
+        lang = DEFAULT_LANG
 
-    lang_code = lang
+    _localedir = localedir
+    set_language(lang)
+
+
+def set_language(lang: str) -> None:
+    """Change la langue en cours de route : les appels suivants à `_` utilisent le nouveau catalogue.
 
-    trans = gettext.translation('Maj', localedir=localedir, languages=[lang_code], fallback=True)
+    Les textes déjà affichés ne changent pas ; c'est à l'appelant de les reconstruire.
+    """
+    global _translator, lang_code
+    trans = _catalogs.get(lang)
+    if trans is None:
+        trans = gettext.translation('Maj', localedir=_localedir, languages=[lang], fallback=True)
+        _catalogs[lang] = trans
+    lang_code = lang
     _translator = trans.gettext
 
 
+def available_languages() -> list[str]:
+    """Langues de l'interface : le français (langue des sources) et chaque dossier locale/<lang> traduit."""
+    languages = {DEFAULT_LANG}
+    if _localedir and os.path.isdir(_localedir):
+        for entry in os.listdir(_localedir):
+            if os.path.isfile(os.path.join(_localedir, entry, 'LC_MESSAGES', 'Maj.mo')):
+                languages.add(entry)
+    return sorted(languages)
+
+
+def language_name(lang: str) -> str:
+    return LANGUAGE_NAMES.get(lang, lang)
+
+
 def _(message: str) -> str:
     """Traduit un message en utilisant le traducteur configuré."""
     return _translator(message)
+
+
+def N_(message: str) -> str:
+    """Marque un message à traduire sans le traduire (tables définies au chargement du module) ;
+    la traduction se fait à l'affichage avec `_`."""
+    return message
@@ -0,0 +1,100 @@
+"""Plan d'installation depuis une archive locale : noms de membres refusés, différence avec le dossier cible."""
+import os
+import tempfile
+import unittest
+import zipfile
+
+from core import integrity, planner
+from core.config import Config
+from core.installer import Installer
+
+
+class PlannerTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.extensions_dir = os.path.join(self.tmp.name, 'extensions')
+        self.state_dir = os.path.join(self.tmp.name, 'state')
+        os.makedirs(self.extensions_dir)
+        os.makedirs(self.state_dir)
+        self.installer = Installer(Config(), extensions_dir=self.extensions_dir, state_dir=self.state_dir)
+
+    def _archive(self, members: dict[str, str]) -> str:
+        path = os.path.join(self.tmp.name, 'Outil-main.zip')
+        with zipfile.ZipFile(path, 'w') as zip_ref:
+            for name, content in members.items():
+                zip_ref.writestr(name, content)
+        return path
+
+
+class UnsafeMembersTest(PlannerTestCase):
+    EXT = {'name': 'Outil', 'repos': 'https://github.com/exemple/Outil', 'download': ['Outil/']}
+
+    def _assert_refused(self, member: str) -> None:
+        archive = self._archive({
+            'Outil-main/Outil/a.py': "print('ok')\n",
+            f'Outil-main/Outil/{member}': "pirate\n",
+        })
+        with self.assertRaises(integrity.IntegrityError):
+            self.installer.install_from_archive(self.EXT, archive, 'main', self.extensions_dir)
+        self.assertEqual(os.listdir(self.extensions_dir), [])
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, 'x')))
+        self.assertFalse(os.path.exists(self.installer.hashes_path))
+
+    def test_parent_component(self) -> None:
+        self._assert_refused('../x')
+
+    def test_absolute_path(self) -> None:
+        self._assert_refused('/abs')
+
+    def test_drive_prefix(self) -> None:
+        self._assert_refused('C:x')
+
+    def test_backslash_parent_components(self) -> None:
+        self._assert_refused('sub\\..\\..\\x')
+
+
+class FolderPlanTest(PlannerTestCase):
+
+    def _write(self, rel: str, content: str) -> None:
+        path = os.path.join(self.extensions_dir, 'Outil', rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def _read(self, rel: str) -> str:
+        with open(os.path.join(self.extensions_dir, 'Outil', rel), encoding='utf-8') as f:
+            return f.read()
+
+    def test_add_replace_delete_keep(self) -> None:
+        self._write('garde.py', "inchangé\n")
+        self._write('remplace.py', "ancien\n")
+        self._write('sous/obsolete.py', "supprimé\n")
+        archive = self._archive({
+            'Outil-main/Outil/garde.py': "inchangé\n",
+            'Outil-main/Outil/remplace.py': "nouveau contenu\n",
+            'Outil-main/Outil/ajout.py': "ajouté\n",
+        })
+        hashes = integrity.InstalledHashes(self.installer.hashes_path)
+        with zipfile.ZipFile(archive) as zf:
+            plan = planner.build_plan(zf, 'Outil-main', ['Outil/'], self.extensions_dir, hashes)
+            actions = {op.rel: op.action for op in plan.ops()}
+            self.assertEqual(actions, {
+                'ajout.py': planner.ADD,
+                'garde.py': planner.KEEP,
+                'remplace.py': planner.REPLACE,
+                'sous/obsolete.py': planner.DELETE,
+            })
+            planner.apply_plan(zf, plan, hashes)
+        self.assertEqual(self._read('ajout.py'), "ajouté\n")
+        self.assertEqual(self._read('remplace.py'), "nouveau contenu\n")
+        self.assertEqual(self._read('garde.py'), "inchangé\n")
+        self.assertFalse(os.path.exists(os.path.join(self.extensions_dir, 'Outil', 'sous')))
+        root = os.path.normpath(os.path.join(self.extensions_dir, 'Outil'))
+        self.assertEqual(sorted(hashes.data[root]), ['ajout.py', 'garde.py', 'remplace.py'])
+        self.assertEqual(hashes.verify(full=True), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
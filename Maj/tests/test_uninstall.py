@@ -0,0 +1,70 @@
+"""Installation puis suppression d'une extension depuis une archive locale : plus aucune empreinte."""
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+
+from core import integrity
+from core.config import Config
+from core.installer import Installer
+
+
+class UninstallForgetsHashesTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.extensions_dir = os.path.join(self.tmp.name, 'extensions')
+        self.state_dir = os.path.join(self.tmp.name, 'state')
+        os.makedirs(self.extensions_dir)
+        os.makedirs(self.state_dir)
+        self.installer = Installer(Config(), extensions_dir=self.extensions_dir, state_dir=self.state_dir)
+
+    def _archive(self, files: dict[str, str]) -> str:
+        path = os.path.join(self.tmp.name, 'Outil-main.zip')
+        with zipfile.ZipFile(path, 'w') as zip_ref:
+            for name, content in files.items():
+                zip_ref.writestr(f"Outil-main/{name}", content)
+        return path
+
+    def _install_then_uninstall(self, ext: dict, files: dict[str, str], installed_dir: str) -> None:
+        self.installer.install_from_archive(ext, self._archive(files), 'main', self.extensions_dir)
+        self.assertEqual(self.installer.verify(), {})
+        with open(self.installer.installed_path, 'w', encoding='utf-8') as f:
+            json.dump({ext['name']: ext}, f)
+        self.assertTrue(self.installer.uninstall(dict(ext, Installed_dir=installed_dir)))
+
+    def test_single_files(self) -> None:
+        ext = {'name': 'Outil', 'repos': 'https://github.com/exemple/Outil', 'download': ['outil.py', 'outil.inx']}
+        self._install_then_uninstall(ext, {'outil.py': "print('ok')\n", 'outil.inx': "<inkscape-extension/>\n"},
+                                     self.extensions_dir)
+        self.assertFalse(os.path.exists(os.path.join(self.extensions_dir, 'outil.py')))
+        self.assertEqual(integrity.InstalledHashes(self.installer.hashes_path).data, {})
+        self.assertEqual(self.installer.verify(), {})
+
+    def test_single_file_keeps_other_extensions(self) -> None:
+        hashes = integrity.InstalledHashes(self.installer.hashes_path)
+        other = os.path.join(self.extensions_dir, 'autre.py')
+        with open(other, 'w', encoding='utf-8') as f:
+            f.write("pass\n")
+        st = os.stat(other)
+        entry = {'sha256': integrity.sha256_file(other), 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+        hashes.record(self.extensions_dir, {'autre.py': entry}, replace=False)
+        hashes.save()
+        ext = {'name': 'Outil', 'repos': 'https://github.com/exemple/Outil', 'download': 'outil.py'}
+        self._install_then_uninstall(ext, {'outil.py': "print('ok')\n"}, self.extensions_dir)
+        data = integrity.InstalledHashes(self.installer.hashes_path).data
+        self.assertEqual(list(data[os.path.normpath(self.extensions_dir)]), ['autre.py'])
+        self.assertEqual(self.installer.verify(), {})
+
+    def test_folder(self) -> None:
+        ext = {'name': 'Outil', 'repos': 'https://github.com/exemple/Outil', 'download': ['Outil/']}
+        self._install_then_uninstall(ext, {'Outil/outil.py': "print('ok')\n", 'Outil/Info.json': "{}\n"},
+                                     os.path.join(self.extensions_dir, 'Outil'))
+        self.assertFalse(os.path.exists(os.path.join(self.extensions_dir, 'Outil')))
+        self.assertEqual(integrity.InstalledHashes(self.installer.hashes_path).data, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
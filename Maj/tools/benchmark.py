@@ -0,0 +1,384 @@
+"""Banc d'essai des opérations coûteuses, contre une forge locale simulée.
+
+    python tools/benchmark.py [--repos 5] [--extensions 20] [--installed 30] [--archive-kb 256]
+                              [--latency-ms 0] [--error-rate 0] [--runs 3] [--provider github]
+                              [--output resultats.json] [--compare precedent.json]
+
+Un serveur HTTP local imite les adresses « fichier brut » et « archive » d'un fournisseur
+de data/repos.json (GitHub par défaut) et sert des dépôts synthétiques : `--repos`
+catalogues de `--extensions` extensions chacun, une archive de `--archive-kb` Ko par
+extension, avec une latence (`--latency-ms`) et un taux d'erreurs HTTP 503 (`--error-rate`)
+réglables. Phases mesurées, chacune `--runs` fois dans un dossier de travail neuf :
+- scan         : Installer.scan_installed sur `--installed` extensions installées (version 1.0) ;
+- catalog      : RepoManager.list_extensions (catalogues et leurs traductions) ;
+- check        : Updater.check_updates, mémoire de session vide ;
+- install      : Installer.install d'une extension du catalogue non installée ;
+- batch_update : Updater.update de toutes les extensions en retard (version 2.0 en ligne).
+
+Les résultats (durées, requêtes, erreurs et octets servis par phase) sont écrits en JSON
+pour comparer des versions entre elles (`--compare`). Rien n'est écrit dans data/.
+"""
+import argparse
+import http.server
+import io
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+MAJ_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, MAJ_DIR)
+
+OWNER = 'bench'
+BRANCH = 'main'
+PHASES = ('scan', 'catalog', 'check', 'install', 'batch_update')
+
+
+class FakeForge:
+    """Serveur HTTP local servant des dépôts synthétiques aux adresses d'un fournisseur de repos.json.
+
+    Les adresses du fournisseur sont réécrites vers le serveur (`https://hôte/...` devient
+    `http://127.0.0.1:<port>/hôte/...`) : le cœur les construit exactement comme en ligne.
+    """
+
+    def __init__(self, template: dict[str, Any], repos: int, extensions: int, archive_kb: int, latency_ms: float = 0, error_rate: float = 0, seed: int = 1) -> None:
+        self.template = template
+        self.repo_count = repos
+        self.ext_count = extensions
+        self.archive_kb = archive_kb
+        self.latency = latency_ms / 1000
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._payload = random.Random(seed).randbytes(archive_kb * 1024)
+        self._lock = threading.Lock()
+        self._routes: dict[str, Callable[[], bytes]] = {}
+        self._archives: dict[str, bytes] = {}
+        self.stats = {'requests': 0, 'errors': 0, 'not_found': 0, 'bytes': 0}
+        self.provider: dict[str, Any] = {}
+        self.catalog_urls: list[str] = []
+        self.extensions: list[dict[str, Any]] = []   # entrées des catalogues, dans l'ordre
+        self._server: http.server.ThreadingHTTPServer | None = None
+
+    # --- serveur ---------------------------------------------------------------
+
+    def start(self, languages: list[str]) -> None:
+        forge = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                forge.serve(self)
+
+        self._server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        port = self._server.server_address[1]
+        local = f"http://127.0.0.1:{port}/"
+        self.provider = {
+            key: re.sub(r'^https?://', local, value) if isinstance(value, str) and '://' in value else value
+            for key, value in self.template.items()
+        }
+        self.provider['id'] = f"bench-{self.template.get('id')}"
+        self.provider['alternative_main_branch'] = [BRANCH]
+        self._build(languages)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def serve(self, handler: http.server.BaseHTTPRequestHandler) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        path = urlsplit(handler.path).path
+        with self._lock:
+            self.stats['requests'] += 1
+            failed = self.error_rate > 0 and self._rng.random() < self.error_rate
+            if failed:
+                self.stats['errors'] += 1
+        route = self._routes.get(path)
+        if failed or route is None:
+            if not failed:
+                with self._lock:
+                    self.stats['not_found'] += 1
+            handler.send_response(503 if failed else 404)
+            handler.send_header('Content-Length', '0')
+            handler.end_headers()
+            return
+        body = route()
+        with self._lock:
+            self.stats['bytes'] += len(body)
+        handler.send_response(200)
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self.stats)
+
+    # --- dépôts synthétiques -------------------------------------------------------
+
+    def _path(self, template_key: str, **values: str) -> str:
+        return urlsplit(self.provider[template_key].format(**values)).path
+
+    def _add_file(self, repo: str, path: str, data: Any) -> None:
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self._routes[self._path('download_file_url', owner=OWNER, repo=repo, branch=BRANCH, path=path)] = lambda: body
+
+    def info(self, slug: str, version: str) -> dict[str, Any]:
+        """Info.json d'une extension synthétique."""
+        return {
+            'name': f"Bench {slug}",
+            'type': 'InkScape extension',
+            'version': version,
+            'author': 'bench',
+            'short_description': f"Extension synthétique {slug}",
+            'repos': self.provider['main_url'].format(owner=OWNER, repo=slug),
+            'download': [f"{slug}/"],
+            'default_install_dir': '',
+        }
+
+    def _build(self, languages: list[str]) -> None:
+        for i in range(self.repo_count):
+            catalog_repo = f"catalog{i}"
+            entries: list[dict[str, Any]] = []
+            for j in range(self.ext_count):
+                slug = f"ext{i}-{j}"
+                info = self.info(slug, '2.0')
+                entry = {**info, 'subject': [f"Sujet {j % 7}"]}
+                entries.append(entry)
+                self._add_file(slug, f"{slug}/Info.json", info)
+                archive_path = self._path('download_folder_url', owner=OWNER, repo=slug, branch=BRANCH)
+                self._routes[archive_path] = lambda slug=slug: self.archive(slug)
+            self._add_file(catalog_repo, 'list_of_inkscape_extensions.json', {'extensions': entries})
+            for lang in languages:
+                translated = [{**entry, 'name': f"{entry['name']} ({lang})"} for entry in entries]
+                self._add_file(catalog_repo, f"locale/{lang}/LC_MESSAGES/list_of_inkscape_extensions.json", {'extensions': translated})
+            self.catalog_urls.append(self.provider['main_url'].format(owner=OWNER, repo=catalog_repo))
+            self.extensions.extend(entries)
+
+    def archive(self, slug: str) -> bytes:
+        """Archive <dépôt>-<branche>.zip de l'extension (construite à la première demande)."""
+        with self._lock:
+            cached = self._archives.get(slug)
+        if cached is not None:
+            return cached
+        buffer = io.BytesIO()
+        root = f"{slug}-{BRANCH}/{slug}"
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(f"{root}/Info.json", json.dumps(self.info(slug, '2.0')))
+            zf.writestr(f"{root}/{slug}.py", "print('bench')\n")
+            zf.writestr(f"{root}/payload.bin", self._payload)
+        data = buffer.getvalue()
+        with self._lock:
+            self._archives[slug] = data
+        return data
+
+
+# --- phases -------------------------------------------------------------------------
+
+
+class Workspace:
+    """Dossier de travail d'une répétition : data/, dossier d'extensions et composants du cœur neufs."""
+
+    def __init__(self, root: str, forge: FakeForge, installed: int) -> None:
+        from core import paths
+        from core.config import Config
+        from core.installer import Installer
+        from core.repo_manager import RepoManager
+        from core.translations import CACHE_FILE, TranslationStore
+        from core.updater import Updater
+
+        shutil.rmtree(root, ignore_errors=True)
+        self.data_dir = os.path.join(root, 'data')
+        self.extensions_dir = os.path.join(root, 'extensions')
+        os.makedirs(self.data_dir)
+        os.makedirs(self.extensions_dir)
+        # Les composants qui ne reçoivent pas de dossier lisent et écrivent dans ce data/
+        paths.DATA_DIR = self.data_dir
+        for ext in forge.extensions[:installed]:
+            slug = os.path.basename(ext['repos'].rstrip('/'))
+            ext_dir = os.path.join(self.extensions_dir, slug)
+            os.makedirs(ext_dir)
+            with open(os.path.join(ext_dir, 'Info.json'), 'w', encoding='utf-8') as f:
+                json.dump(forge.info(slug, '1.0'), f)
+            with open(os.path.join(ext_dir, f"{slug}.py"), 'w', encoding='utf-8') as f:
+                f.write("print('old')\n")
+
+        self.config = Config(repos=list(forge.catalog_urls))
+        self.config.repos_providers = [forge.provider]
+        translations = TranslationStore(paths.data_path(CACHE_FILE, self.data_dir))
+        self.repo_manager = RepoManager(self.config)
+        self.repo_manager.catalog_path = paths.data_path('installable_extensions.json', self.data_dir)
+        self.repo_manager.translations = translations
+        self.installer = Installer(self.config, extensions_dir=self.extensions_dir, state_dir=self.data_dir)
+        self.installer.translations = translations
+        self.updater = Updater(self.config, installer=self.installer)
+        self.installed: list[dict[str, Any]] = []
+        self.catalog: dict[str, list[dict[str, Any]]] = {}
+        self.outdated: list[dict[str, Any]] = []
+
+
+def _phase_scan(ws: Workspace) -> None:
+    ws.installed = ws.installer.scan_installed()
+
+
+def _phase_catalog(ws: Workspace) -> None:
+    ws.catalog = ws.repo_manager.list_extensions()
+
+
+def _phase_check(ws: Workspace) -> None:
+    ws.outdated = ws.updater.check_updates(ws.installed)
+
+
+def _phase_install(ws: Workspace) -> None:
+    installed_repos = {ext.get('repos') for ext in ws.installed}
+    candidates = [ext for exts in ws.catalog.values() for ext in exts if ext.get('repos') not in installed_repos]
+    if candidates:
+        ws.installer.install(candidates[0])
+
+
+def _phase_batch_update(ws: Workspace) -> None:
+    outdated_repos = {ext.get('repos') for ext in ws.outdated}
+    for ext in ws.installed:
+        if ext.get('repos') in outdated_repos:
+            ws.updater.update(ext)
+
+
+PHASE_FUNCS: dict[str, Callable[[Workspace], None]] = {
+    'scan': _phase_scan,
+    'catalog': _phase_catalog,
+    'check': _phase_check,
+    'install': _phase_install,
+    'batch_update': _phase_batch_update,
+}
+
+
+def run(forge: FakeForge, work_root: str, installed: int, runs: int) -> dict[str, Any]:
+    samples: dict[str, list[dict[str, float]]] = {name: [] for name in PHASES}
+    for run_index in range(runs):
+        ws = Workspace(os.path.join(work_root, f"run{run_index}"), forge, installed)
+        for name in PHASES:
+            before = forge.snapshot()
+            start = time.perf_counter()
+            PHASE_FUNCS[name](ws)
+            elapsed = (time.perf_counter() - start) * 1000
+            after = forge.snapshot()
+            samples[name].append({'ms': elapsed, **{key: after[key] - before[key] for key in after}})
+    phases: dict[str, Any] = {}
+    for name, runs_data in samples.items():
+        timings = [sample['ms'] for sample in runs_data]
+        phases[name] = {
+            'runs_ms': [round(t, 1) for t in timings],
+            'median_ms': round(statistics.median(timings), 1),
+            'min_ms': round(min(timings), 1),
+            'max_ms': round(max(timings), 1),
+            # Par répétition (moyenne)
+            **{key: round(statistics.mean(sample[key] for sample in runs_data), 1) for key in ('requests', 'errors', 'not_found', 'bytes')},
+        }
+    return phases
+
+
+def _maj_version() -> str:
+    try:
+        with open(os.path.join(MAJ_DIR, 'Info.json'), 'r', encoding='utf-8') as f:
+            return str(json.load(f).get('version', '?'))
+    except (OSError, ValueError):
+        return '?'
+
+
+def _print_results(result: dict[str, Any], previous: dict[str, Any] | None) -> None:
+    print(f"Maj {result['version']} – {result['params']['repos']} dépôts × {result['params']['extensions']} extensions, "
+          f"{result['params']['installed']} installées, archives {result['params']['archive_kb']} Ko")
+    for name, phase in result['phases'].items():
+        line = (f"  {name:<13} médiane {phase['median_ms']:8.1f} ms  (min {phase['min_ms']:.1f}, max {phase['max_ms']:.1f})"
+                f"  {phase['requests']:.0f} requêtes, {phase['errors']:.0f} erreurs")
+        old = (previous or {}).get('phases', {}).get(name)
+        if old and old.get('median_ms'):
+            change = (phase['median_ms'] - old['median_ms']) / old['median_ms'] * 100
+            line += f"  [{old['median_ms']:.1f} ms → {change:+.1f} %]"
+        print(line)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repos', type=int, default=5, help="nombre de dépôts catalogues")
+    parser.add_argument('--extensions', type=int, default=20, help="extensions par catalogue")
+    parser.add_argument('--installed', type=int, default=30, help="extensions déjà installées (version 1.0)")
+    parser.add_argument('--archive-kb', type=int, default=256, help="taille du contenu de chaque archive")
+    parser.add_argument('--latency-ms', type=float, default=0, help="latence ajoutée à chaque requête")
+    parser.add_argument('--error-rate', type=float, default=0, help="part des requêtes en erreur 503 (0 à 1)")
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--provider', default='github', help="fournisseur de repos.json imité")
+    parser.add_argument('--lang', default='fr', help="langue de l'interface pendant la mesure")
+    parser.add_argument('--output', help="fichier JSON des résultats (sinon : affichage)")
+    parser.add_argument('--compare', help="résultats JSON d'une exécution précédente")
+    parser.add_argument('--json', action='store_true', help="résultats JSON sur stdout")
+    args = parser.parse_args()
+
+    import i18n
+    i18n.setup(os.path.join(MAJ_DIR, 'locale'))
+    i18n.set_language(args.lang)
+    from core import config as config_module
+    from core.config import Config
+
+    template = next((p for p in Config().repos_providers if p.get('id') == args.provider), None)
+    if template is None:
+        print(f"Fournisseur inconnu : {args.provider}", file=sys.stderr)
+        return 2
+    total = args.repos * args.extensions
+    installed = min(args.installed, total)
+    forge = FakeForge(template, args.repos, args.extensions, args.archive_kb, args.latency_ms, args.error_rate, args.seed)
+    forge.start([lang for lang in i18n.available_languages() if lang != i18n.DEFAULT_LANG])
+    work_root = tempfile.mkdtemp(prefix='maj-bench-')
+    # config.json n'est jamais écrit dans data/ (écritures différées de la configuration)
+    config_module.CONFIG_FILE = os.path.join(work_root, 'config.json')
+    try:
+        phases = run(forge, work_root, installed, args.runs)
+    finally:
+        forge.stop()
+        shutil.rmtree(work_root, ignore_errors=True)
+
+    result: dict[str, Any] = {
+        'tool': 'benchmark',
+        'version': _maj_version(),
+        'python': platform.python_version(),
+        'platform': sys.platform,
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'params': {
+            'repos': args.repos, 'extensions': args.extensions, 'installed': installed,
+            'archive_kb': args.archive_kb, 'latency_ms': args.latency_ms, 'error_rate': args.error_rate,
+            'runs': args.runs, 'seed': args.seed, 'provider': args.provider, 'lang': args.lang,
+        },
+        'phases': phases,
+    }
+    previous = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        _print_results(result, previous)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,353 @@
+"""Génère un profil Inkscape synthétique de grande taille, reproductible, pour les mesures.
+
+    python tools/generate_profile.py DOSSIER [--extensions 2000] [--languages en,de,es] [--translated 0.6]
+                                     [--authors 40] [--files 6] [--decoys 0.3] [--malformed 0.02]
+                                     [--foreign 0.03] [--outdated 0.2] [--catalog-extra 500] [--catalogs 8]
+                                     [--seed 1] [--force] [--measure] [--runs 3] [--json]
+
+Contenu de DOSSIER (même graine et mêmes options : même arborescence) :
+- extensions/<auteur>/<extension>/ : Info.json, .inx, .py et `--files` fichiers de code en
+  sous-dossiers ; pour une part `--translated` des extensions, des variantes
+  locale/<langue>/LC_MESSAGES/Info.json dans les langues `--languages` ;
+- leurres parcourus par le scan sans rien y trouver : dossiers __pycache__ et .git (objets,
+  refs) pour une part `--decoys` des extensions, extensions Inkscape sans Info.json ;
+- Info.json invalides (`--malformed` : tronqués, vides, mauvais encodage, tableau JSON) et
+  Info.json d'un autre type (`--foreign`), que le scan doit écarter ;
+- data/installable_extensions.json : catalogue de `--catalogs` dépôts contenant les
+  extensions installées (une part `--outdated` en version plus récente) et
+  `--catalog-extra` extensions non installées ;
+- profile.json : options de génération et résultats attendus (nombre d'extensions que le
+  scan doit trouver, fichiers invalides…), pour vérifier le scan en plus de le chronométrer.
+
+Avec `--measure`, le profil est ensuite mesuré sans écran : durée de
+Installer.scan_installed (`--runs` fois), mémoire maximale allouée pendant un scan
+(tracemalloc), lecture et indexation du catalogue. Les listes de l'interface se
+mesurent avec `python tools/measure_resize.py --profile DOSSIER`.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import time
+from typing import Any
+
+MAJ_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, MAJ_DIR)
+
+PROFILE_FILE = 'profile.json'
+OWNER = 'synthetic'
+WORDS = ("découpe laser gravure boîte engrenage calque chemin texte export couleur motif grille "
+         "étiquette plan assemblage courbe symbole tampon pochoir broderie patron").split()
+SUBJECTS = ("Découpe laser", "Gravure", "Création d'objets", "Formes", "Texte", "Export", "Couleurs", "Outils")
+# Variantes d'Info.json invalides, dans cet ordre de rotation
+MALFORMED = ('truncated', 'empty', 'latin1', 'array')
+
+
+def _slug(i: int) -> str:
+    return f"ext_{i:05d}"
+
+
+def _repo_url(slug: str) -> str:
+    return f"https://github.com/{OWNER}/{slug}"
+
+
+def _write(path: str, content: str | bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    mode = 'wb' if isinstance(content, bytes) else 'w'
+    with open(path, mode, **({} if isinstance(content, bytes) else {'encoding': 'utf-8'})) as f:
+        f.write(content)
+
+
+def _json(path: str, data: Any) -> None:
+    _write(path, json.dumps(data, indent=2, ensure_ascii=False))
+
+
+class ProfileGenerator:
+    """Construit l'arborescence et le catalogue à partir d'une graine (`random.Random(seed)`)."""
+
+    def __init__(self, dest: str, args: argparse.Namespace) -> None:
+        self.dest = dest
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.languages = [lang for lang in args.languages.split(',') if lang]
+        self.extensions_dir = os.path.join(dest, 'extensions')
+        self.data_dir = os.path.join(dest, 'data')
+        self.counts = {
+            'extensions': 0, 'variants': 0, 'malformed': 0, 'foreign': 0,
+            'without_info': 0, 'decoy_dirs': 0, 'files': 0, 'bytes': 0,
+        }
+
+    def _text(self, words: int) -> str:
+        return " ".join(self.rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+    def info(self, i: int) -> dict[str, Any]:
+        """Info.json de l'extension numéro `i` (nom, description et auteur déterministes)."""
+        slug = _slug(i)
+        rng = random.Random(f"{self.args.seed}-{i}")
+        return {
+            'type': 'InkScape extension',
+            'name': f"{rng.choice(WORDS).capitalize()} {rng.choice(WORDS)} {i:05d}",
+            'short_description': " ".join(rng.choice(WORDS) for _ in range(6 + i % 30)).capitalize() + ".",
+            'author': f"Auteur {i % self.args.authors:02d}",
+            'version': f"2025.{1 + i % 9}",
+            'download': [f"{slug}/"],
+            'repos': _repo_url(slug),
+        }
+
+    def _author_dir(self, i: int) -> str:
+        return f"Auteur_{i % self.args.authors:02d}"
+
+    # --- extensions installées -------------------------------------------------
+
+    def _extension(self, i: int) -> None:
+        slug = _slug(i)
+        root = os.path.join(self.extensions_dir, self._author_dir(i), slug)
+        info = self.info(i)
+        rng = self.rng
+        roll = rng.random()
+        if roll < self.args.malformed:
+            kind = MALFORMED[self.counts['malformed'] % len(MALFORMED)]
+            body = json.dumps(info, ensure_ascii=False)
+            content: str | bytes = {
+                'truncated': body[:len(body) // 2],
+                'empty': '',
+                'latin1': body.replace('"type"', '"nom_é"').encode('latin-1', errors='replace') + b'\xe9',
+                'array': json.dumps([info]),
+            }[kind]
+            _write(os.path.join(root, 'Info.json'), content)
+            self.counts['malformed'] += 1
+        elif roll < self.args.malformed + self.args.foreign:
+            _json(os.path.join(root, 'Info.json'), {**info, 'type': 'Python package'})
+            self.counts['foreign'] += 1
+        else:
+            _json(os.path.join(root, 'Info.json'), info)
+            self.counts['extensions'] += 1
+            if rng.random() < self.args.translated:
+                for lang in self.languages:
+                    variant = {**info, 'name': f"{info['name']} [{lang}]", 'short_description': f"[{lang}] {info['short_description']}"}
+                    _json(os.path.join(root, 'locale', lang, 'LC_MESSAGES', 'Info.json'), variant)
+                    _write(os.path.join(root, 'locale', lang, 'LC_MESSAGES', f"{slug}.mo"), b'\xde\x12\x04\x95' + bytes(28))
+                    self.counts['variants'] += 1
+        self._code_files(root, slug, i)
+        if rng.random() < self.args.decoys:
+            self._decoys(root, slug)
+
+    def _code_files(self, root: str, slug: str, i: int) -> None:
+        _write(os.path.join(root, f"{slug}.inx"),
+               f'<?xml version="1.0" encoding="UTF-8"?>\n<inkscape-extension xmlns="http://www.inkscape.org/namespace/inkscape/extension">\n'
+               f'  <name>{slug}</name>\n  <id>org.synthetic.{slug}</id>\n  <script><command location="inx" interpreter="python">{slug}.py</command></script>\n'
+               f'</inkscape-extension>\n')
+        _write(os.path.join(root, f"{slug}.py"), f"# {self._text(12)}\nimport inkex\n\n\nclass Effect(inkex.EffectExtension):\n    pass\n")
+        for k in range(self.args.files):
+            folder = os.path.join(root, 'lib', f"module{k % 3}")
+            _write(os.path.join(folder, f"part{k}.py"), f"# {self._text(20 + (i + k) % 60)}\nVALUE = {k}\n")
+        self.counts['files'] += 2 + self.args.files
+
+    def _decoys(self, root: str, slug: str) -> None:
+        """Dossiers sans Info.json que le scan parcourt quand même."""
+        for k in range(max(1, self.args.files // 2)):
+            _write(os.path.join(root, '__pycache__', f"part{k}.cpython-311.pyc"), bytes(64 + k))
+        git = os.path.join(root, '.git')
+        _write(os.path.join(git, 'HEAD'), "ref: refs/heads/main\n")
+        _write(os.path.join(git, 'refs', 'heads', 'main'), f"{self.rng.getrandbits(160):040x}\n")
+        for k in range(8):
+            digest = f"{self.rng.getrandbits(160):040x}"
+            _write(os.path.join(git, 'objects', digest[:2], digest[2:]), bytes(32))
+        self.counts['decoy_dirs'] += 2
+
+    def _stock_extensions(self) -> None:
+        """Extensions livrées sans Info.json (comme celles d'Inkscape) : ignorées par le scan."""
+        count = max(1, self.args.extensions // 20)
+        for k in range(count):
+            folder = os.path.join(self.extensions_dir, f"stock_{k:03d}")
+            _write(os.path.join(folder, f"stock_{k:03d}.inx"), "<inkscape-extension/>\n")
+            _write(os.path.join(folder, f"stock_{k:03d}.py"), "pass\n")
+        self.counts['without_info'] += count
+
+    # --- catalogue ---------------------------------------------------------------
+
+    def _catalog(self) -> dict[str, list[dict[str, Any]]]:
+        """installable_extensions.json : extensions installées (versions en ligne) et non installées."""
+        catalogs = [f"https://github.com/{OWNER}/Catalogue_{k:02d}" for k in range(self.args.catalogs)]
+        by_repo: dict[str, list[dict[str, Any]]] = {repo: [] for repo in catalogs}
+        rng = random.Random(f"{self.args.seed}-catalog")
+        for i in range(self.args.extensions + self.args.catalog_extra):
+            info = self.info(i)
+            if i < self.args.extensions and rng.random() < self.args.outdated:
+                info['version'] = f"2026.{1 + i % 9}"
+            entry = {
+                'name': info['name'],
+                'short_description': info['short_description'],
+                'subject': rng.sample(SUBJECTS, 1 + i % 3),
+                'author': info['author'],
+                'version': info['version'],
+                'default_install_dir': self._author_dir(i),
+                'compatibility': ["Inkscape >= 1.2.0"],
+                'repos': info['repos'],
+                'download': info['download'],
+                'start_here': f"Extensions > Synthétique > {info['name']}",
+            }
+            by_repo[catalogs[i % len(catalogs)]].append(entry)
+        for entries in by_repo.values():
+            entries.sort(key=lambda e: str(e['name']).lower())
+        return by_repo
+
+    # --- ensemble ----------------------------------------------------------------
+
+    def generate(self) -> dict[str, Any]:
+        started = time.perf_counter()
+        os.makedirs(self.extensions_dir)
+        os.makedirs(self.data_dir)
+        for i in range(self.args.extensions):
+            self._extension(i)
+        self._stock_extensions()
+        catalog = self._catalog()
+        _json(os.path.join(self.data_dir, 'installable_extensions.json'), catalog)
+        for root, _dirs, files in os.walk(self.dest):
+            self.counts['bytes'] += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+        manifest = {
+            'tool': 'generate_profile',
+            'params': {key: value for key, value in vars(self.args).items() if key not in ('dest', 'force', 'measure', 'runs', 'json')},
+            'expected': {
+                # Extensions que scan_installed doit trouver (une entrée par dépôt)
+                'installed': self.counts['extensions'],
+                'catalog_repos': len(catalog),
+                'catalog_extensions': sum(len(entries) for entries in catalog.values()),
+            },
+            'counts': dict(self.counts),
+            'generation_s': round(time.perf_counter() - started, 2),
+        }
+        _json(os.path.join(self.dest, PROFILE_FILE), manifest)
+        return manifest
+
+
+# --- mesures ---------------------------------------------------------------------
+
+
+def load_profile(dest: str) -> dict[str, Any]:
+    with open(os.path.join(dest, PROFILE_FILE), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def profile_installer(dest: str) -> Any:
+    """Installer du cœur pointé sur le profil : aucun fichier n'est écrit dans le data/ de Maj."""
+    from core import paths
+    from core.config import Config
+    from core.installer import Installer
+    from core.translations import CACHE_FILE, TranslationStore
+    data_dir = os.path.join(dest, 'data')
+    paths.DATA_DIR = data_dir
+    installer = Installer(Config(), extensions_dir=os.path.join(dest, 'extensions'), state_dir=data_dir)
+    installer.translations = TranslationStore(paths.data_path(CACHE_FILE, data_dir))
+    return installer
+
+
+def measure(dest: str, runs: int) -> dict[str, Any]:
+    import tracemalloc
+    from core.catalog import Catalog
+    expected = load_profile(dest)['expected']
+    errors: list[str] = []
+
+    def on_event(event: Any) -> None:
+        if event.erreur:
+            errors.append(event.message)
+
+    timings: list[float] = []
+    found = 0
+    for _run in range(runs):
+        installer = profile_installer(dest)
+        installer.on_event = on_event
+        errors.clear()
+        t0 = time.perf_counter()
+        found = len(installer.scan_installed())
+        timings.append((time.perf_counter() - t0) * 1000)
+
+    tracemalloc.start()
+    profile_installer(dest).scan_installed()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    t0 = time.perf_counter()
+    with open(os.path.join(dest, 'data', 'installable_extensions.json'), 'r', encoding='utf-8') as f:
+        catalog = Catalog(json.load(f))
+    catalog_ms = (time.perf_counter() - t0) * 1000
+    return {
+        'scan': {
+            'median_ms': round(statistics.median(timings), 1),
+            'min_ms': round(min(timings), 1),
+            'max_ms': round(max(timings), 1),
+            'peak_kb': round(peak / 1024),
+            'found': found,
+            'expected': expected['installed'],
+            'errors_logged': len(errors),
+        },
+        'catalog': {
+            'load_ms': round(catalog_ms, 1),
+            'extensions': sum(len(entries) for entries in catalog.by_repo.values()),
+            'subjects': len(catalog.subjects()),
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('dest', help="dossier du profil (créé)")
+    parser.add_argument('--extensions', type=int, default=2000, help="dossiers d'extensions (valides ou non)")
+    parser.add_argument('--languages', default='en,de,es', help="langues des variantes traduites, séparées par des virgules")
+    parser.add_argument('--translated', type=float, default=0.6, help="part des extensions avec variantes traduites")
+    parser.add_argument('--authors', type=int, default=40, help="dossiers d'auteurs (niveau intermédiaire)")
+    parser.add_argument('--files', type=int, default=6, help="fichiers de code supplémentaires par extension")
+    parser.add_argument('--decoys', type=float, default=0.3, help="part des extensions avec __pycache__ et .git")
+    parser.add_argument('--malformed', type=float, default=0.02, help="part des Info.json invalides")
+    parser.add_argument('--foreign', type=float, default=0.03, help="part des Info.json d'un autre type")
+    parser.add_argument('--outdated', type=float, default=0.2, help="part des extensions plus récentes au catalogue")
+    parser.add_argument('--catalog-extra', type=int, default=500, help="extensions du catalogue non installées")
+    parser.add_argument('--catalogs', type=int, default=8, help="dépôts du catalogue")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--force', action='store_true', help="remplace un profil généré précédemment dans DOSSIER")
+    parser.add_argument('--measure', action='store_true', help="mesure le scan et le catalogue une fois le profil généré")
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    dest = os.path.abspath(args.dest)
+    if os.path.exists(dest) and os.listdir(dest):
+        # Seul un dossier produit par cet outil est remplacé
+        if not (args.force and os.path.isfile(os.path.join(dest, PROFILE_FILE))):
+            print(f"{dest} n'est pas vide (--force remplace un profil existant)", file=sys.stderr)
+            return 2
+        shutil.rmtree(dest)
+
+    manifest = ProfileGenerator(dest, args).generate()
+    result: dict[str, Any] = {'profile': dest, **manifest}
+    if args.measure:
+        import i18n
+        i18n.setup(os.path.join(MAJ_DIR, 'locale'))
+        result['measure'] = measure(dest, args.runs)
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return 0
+    counts = manifest['counts']
+    print(f"Profil {dest} ({manifest['generation_s']:.1f} s)")
+    print(f"  {counts['extensions']} extensions valides, {counts['variants']} variantes traduites, "
+          f"{counts['malformed']} Info.json invalides, {counts['foreign']} d'un autre type, "
+          f"{counts['without_info']} sans Info.json")
+    print(f"  {counts['files']} fichiers de code, {counts['decoy_dirs']} dossiers leurres, {counts['bytes'] / 1048576:.1f} Mo")
+    print(f"  catalogue : {manifest['expected']['catalog_extensions']} extensions dans {manifest['expected']['catalog_repos']} dépôts")
+    if args.measure:
+        scan = result['measure']['scan']
+        catalog = result['measure']['catalog']
+        print(f"  scan      médiane {scan['median_ms']:.1f} ms (min {scan['min_ms']:.1f}, max {scan['max_ms']:.1f}), "
+              f"pic mémoire {scan['peak_kb']} Ko, {scan['found']}/{scan['expected']} extensions, {scan['errors_logged']} erreurs signalées")
+        print(f"  catalogue lecture et index {catalog['load_ms']:.1f} ms ({catalog['extensions']} extensions, {catalog['subjects']} sujets)")
+        if scan['found'] != scan['expected']:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
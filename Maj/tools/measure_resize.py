@@ -0,0 +1,192 @@
+"""Mesure le coût des redimensionnements de la liste des extensions installées.
+
+    python tools/measure_resize.py [--count 300] [--steps 40] [--mode frame|virtual|both]
+                                   [--profile DOSSIER] [--json]
+
+Une liste synthétique de `--count` extensions est affichée dans une fenêtre, puis la
+largeur de la fenêtre est modifiée par programme (nécessite un écran). Avec `--profile`,
+la liste est celle du scan d'un profil créé par tools/generate_profile.py (mises à jour
+d'après son catalogue), et la construction de la liste du catalogue est aussi mesurée.
+Mesures :
+- steps : `--steps` redimensionnements successifs, chacun suivi d'un `update()` ;
+          temps par étape (médiane, p95, max) ;
+- burst : `--steps` redimensionnements enchaînés sans rendre la main (comme un
+          glisser de la souris), puis un seul `update()` ;
+- events / layouts : événements <Configure> reçus par le Canvas et mises en page
+          réellement appliquées (elles sont regroupées par passage de la boucle Tk).
+
+Le mode `frame` correspond aux listes courtes (un widget par ligne), `virtual` aux
+listes longues dessinées sur le Canvas (voir VIRTUAL_THRESHOLD).
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any
+
+MAJ_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, MAJ_DIR)
+
+WIDTHS = (520, 1180, 760, 940, 640, 1060)
+
+
+def synthetic_extensions(count: int) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """`count` extensions installées (descriptions de longueurs variées), une sur cinq à mettre à jour."""
+    words = "extension inkscape chemin calque texte export gravure découpe laser couleur".split()
+    installed: list[dict[str, Any]] = []
+    outdated: list[dict[str, Any]] = []
+    for i in range(count):
+        description = " ".join(words[(i + k) % len(words)] for k in range(8 + (i * 7) % 40))
+        ext = {
+            'name': f"Extension {i:04d}",
+            'author': f"Auteur {i % 17}",
+            'short_description': description.capitalize() + ".",
+            'version': f"1.{i % 10}.0",
+            'repos': f"https://example.invalid/depot{i % 5}",
+        }
+        installed.append(ext)
+        if i % 5 == 0:
+            outdated.append({'name': ext['name'], 'repos': ext['repos'], 'online_version': f"2.{i % 10}.0"})
+    return installed, outdated
+
+
+def profile_extensions(dest: str) -> tuple[list[dict[str, Any]], list[dict[str, Any]], dict[str, list[dict[str, Any]]]]:
+    """Extensions installées (scan du profil), celles à mettre à jour et catalogue du profil."""
+    from generate_profile import profile_installer
+    from core.updater import parse_version
+    installed = profile_installer(dest).scan_installed()
+    with open(os.path.join(dest, 'data', 'installable_extensions.json'), 'r', encoding='utf-8') as f:
+        catalog: dict[str, list[dict[str, Any]]] = json.load(f)
+    online = {ext.get('repos'): ext.get('version') for entries in catalog.values() for ext in entries}
+    outdated = [
+        {'name': ext['name'], 'repos': ext.get('repos'), 'download': ext.get('download'), 'online_version': online[ext.get('repos')], 'local_version': ext.get('version')}
+        for ext in installed
+        if online.get(ext.get('repos')) and parse_version(str(ext.get('version'))) < parse_version(str(online[ext.get('repos')]))
+    ]
+    return installed, outdated, catalog
+
+
+def measure_catalog(catalog: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
+    """Construction et affichage de la liste du catalogue (onglet « Ajouter une extension »)."""
+    import tkinter as tk
+    from gui.installable_extensions_list_widget import InstallableExtensionsListWidget
+
+    root = tk.Tk()
+    root.geometry(f"{WIDTHS[0]}x700")
+    start = time.perf_counter()
+    widget = InstallableExtensionsListWidget(root, catalog)
+    widget.pack(fill=tk.BOTH, expand=True)
+    widget.set_filter(catalog)
+    root.update()
+    build_ms = (time.perf_counter() - start) * 1000
+    root.destroy()
+    return {'mode': 'catalog', 'count': sum(len(entries) for entries in catalog.values()), 'build_ms': round(build_ms, 1)}
+
+
+def _stats(timings: list[float]) -> dict[str, float]:
+    ordered = sorted(timings)
+    return {
+        'median_ms': round(statistics.median(ordered), 2),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+        'max_ms': round(ordered[-1], 2),
+        'total_ms': round(sum(ordered), 1),
+    }
+
+
+def measure(mode: str, installed: list[dict[str, Any]], outdated: list[dict[str, Any]], steps: int) -> dict[str, Any]:
+    import tkinter as tk
+    from gui.installed_extensions_list_widget import InstalledExtensionsListWidget
+
+    root = tk.Tk()
+    root.geometry(f"{WIDTHS[0]}x700")
+    start = time.perf_counter()
+    widget = InstalledExtensionsListWidget(root, installed, outdated, virtual=(mode == 'virtual'))
+    widget.pack(fill=tk.BOTH, expand=True)
+    root.update()
+    build_ms = (time.perf_counter() - start) * 1000
+
+    counters = {'events': 0, 'layouts': 0}
+
+    def count_event(event: Any) -> None:
+        counters['events'] += 1
+    widget.canvas.bind("<Configure>", count_event, add="+")
+    # Compte les mises en page effectivement appliquées (attribut d'instance : lu par after_idle)
+    apply_name = '_render_visible' if widget.virtual else '_apply_layout'
+    original = getattr(widget, apply_name)
+
+    def counted_apply() -> None:
+        counters['layouts'] += 1
+        original()
+    setattr(widget, apply_name, counted_apply)
+
+    timings: list[float] = []
+    for i in range(steps):
+        width = WIDTHS[(i + 1) % len(WIDTHS)]
+        t0 = time.perf_counter()
+        root.geometry(f"{width}x700")
+        root.update()
+        timings.append((time.perf_counter() - t0) * 1000)
+    step_counters = dict(counters)
+
+    counters.update(events=0, layouts=0)
+    t0 = time.perf_counter()
+    for i in range(steps):
+        root.geometry(f"{WIDTHS[i % len(WIDTHS)] + i}x700")
+    root.update()
+    burst_ms = (time.perf_counter() - t0) * 1000
+    root.destroy()
+    return {
+        'mode': mode,
+        'count': len(installed),
+        'build_ms': round(build_ms, 1),
+        'steps': {**_stats(timings), **step_counters},
+        'burst': {'total_ms': round(burst_ms, 1), **counters},
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=300, help="nombre d'extensions de la liste synthétique")
+    parser.add_argument('--steps', type=int, default=40)
+    parser.add_argument('--mode', choices=('frame', 'virtual', 'both'), default='both')
+    parser.add_argument('--profile', help="profil généré par tools/generate_profile.py (remplace --count)")
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    import i18n
+    i18n.setup(os.path.join(MAJ_DIR, 'locale'))
+    import tkinter as tk
+    modes = ('frame', 'virtual') if args.mode == 'both' else (args.mode,)
+    catalog: dict[str, list[dict[str, Any]]] | None = None
+    if args.profile:
+        installed, outdated, catalog = profile_extensions(os.path.abspath(args.profile))
+    else:
+        installed, outdated = synthetic_extensions(args.count)
+    try:
+        results = [measure(mode, installed, outdated, args.steps) for mode in modes]
+        if catalog is not None:
+            results.append(measure_catalog(catalog))
+    except tk.TclError as e:
+        print(f"Mesure impossible (écran nécessaire) : {e}", file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            if r['mode'] == 'catalog':
+                print(f"{r['mode']:<8} {r['count']} extensions, construction {r['build_ms']:.1f} ms")
+                continue
+            steps = r['steps']
+            burst = r['burst']
+            print(f"{r['mode']:<8} {r['count']} extensions, construction {r['build_ms']:.1f} ms")
+            print(f"  étapes  médiane {steps['median_ms']:.2f} ms  p95 {steps['p95_ms']:.2f} ms  max {steps['max_ms']:.2f} ms"
+                  f"  ({steps['events']} événements, {steps['layouts']} mises en page)")
+            print(f"  rafale  {burst['total_ms']:.1f} ms  ({burst['events']} événements, {burst['layouts']} mises en page)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""Mesure le démarrage à froid du mode ligne de commande et de l'interface.
+
+    python tools/measure_startup.py [--runs 10] [--json] [--top 15] [--check] [--max-first-paint-ms N]
+
+Chaque mesure lance un nouvel interpréteur (démarrage à froid) :
+- cli         : `Maj.py list --cached --json` (aucun import de tkinter ni accès réseau) ;
+- gui         : imports effectués par `Maj.py` avant l'ouverture de la fenêtre
+                (tkinter + gui.main_window), sans affichage ni scan ;
+- first_paint : `Maj.py` lancé avec MAJ_STARTUP_PROBE=1, qui affiche le temps jusqu'au
+                premier affichage de la fenêtre puis quitte (nécessite un écran) ;
+- importtime  : modules les plus coûteux à l'import de l'interface (`python -X importtime`).
+
+Avec `--check`, le code de retour vaut 1 si un module lourd (LAZY_MODULES) est importé
+avant l'ouverture de la fenêtre, ou si le premier affichage dépasse `--max-first-paint-ms`.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any
+
+MAJ_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+GUI_IMPORTS = (
+    "import sys, os; sys.path.insert(0, {maj!r}); "
+    "import i18n; i18n.setup(os.path.join({maj!r}, 'locale')); "
+    "import tkinter; from gui.main_window import MainWindow; from core.config import Config; Config.load()"
+)
+
+
+# Modules qui ne doivent être chargés qu'à leur première utilisation, pas au démarrage
+LAZY_MODULES = (
+    'ssl', 'urllib.request', 'zipfile', 'shutil', 'xml.etree.ElementTree',
+    'webbrowser', 'hashlib', 'logging', 'concurrent.futures', 'multiprocessing',
+)
+
+
+def _time_command(cmd: list[str], runs: int) -> list[float]:
+    timings: list[float] = []
+    for _i in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=MAJ_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _stats(timings: list[float]) -> dict[str, float]:
+    return {
+        'median_ms': round(statistics.median(timings), 1),
+        'min_ms': round(min(timings), 1),
+        'max_ms': round(max(timings), 1),
+    }
+
+
+def _import_times(top: int) -> dict[str, Any]:
+    """Temps d'import par module (cumulé, en ms) lors des imports de l'interface."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', GUI_IMPORTS.format(maj=MAJ_DIR)],
+                          cwd=MAJ_DIR, capture_output=True, text=True, check=False)
+    modules: dict[str, float] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(cumulative_us) / 1000
+    ranked = sorted(modules.items(), key=lambda item: item[1], reverse=True)
+    return {
+        'top': [{'module': name, 'cumulative_ms': round(ms, 1)} for name, ms in ranked[:top]],
+        'lazy_violations': [name for name in LAZY_MODULES if name in modules],
+    }
+
+
+def _first_paint(runs: int) -> dict[str, Any]:
+    """Temps jusqu'au premier affichage, mesuré par Maj.py lui-même (MAJ_STARTUP_PROBE)."""
+    env = dict(os.environ, MAJ_STARTUP_PROBE='1')
+    samples: list[dict[str, float]] = []
+    for _i in range(runs):
+        proc = subprocess.run([sys.executable, os.path.join(MAJ_DIR, 'Maj.py')], cwd=MAJ_DIR, env=env,
+                              capture_output=True, text=True, timeout=60, check=False)
+        lines = [line for line in proc.stdout.splitlines() if line.startswith('{')]
+        if proc.returncode != 0 or not lines:
+            error = (proc.stderr.strip().splitlines() or ['?'])[-1]
+            return {'error': error}
+        samples.append(json.loads(lines[-1]))
+    return {
+        'imports': _stats([s['imports_ms'] for s in samples]),
+        'first_paint': _stats([s['first_paint_ms'] for s in samples]),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--json', action='store_true')
+    parser.add_argument('--top', type=int, default=15, help="nombre de modules listés par coût d'import")
+    parser.add_argument('--check', action='store_true', help="code de retour 1 en cas de régression")
+    parser.add_argument('--max-first-paint-ms', type=float, default=None)
+    args = parser.parse_args()
+
+    baseline = _time_command([sys.executable, '-c', 'pass'], args.runs)
+    cli = _time_command([sys.executable, os.path.join(MAJ_DIR, 'Maj.py'), 'list', '--cached', '--json'], args.runs)
+    gui = _time_command([sys.executable, '-c', GUI_IMPORTS.format(maj=MAJ_DIR)], args.runs)
+    result: dict[str, Any] = {
+        'python': _stats(baseline),
+        'cli_list_cached': _stats(cli),
+        'gui_imports': _stats(gui),
+    }
+    paint = _first_paint(args.runs)
+    imports = _import_times(args.top)
+
+    failures: list[str] = []
+    if imports['lazy_violations']:
+        failures.append("modules chargés au démarrage : " + ", ".join(imports['lazy_violations']))
+    if args.max_first_paint_ms is not None and 'first_paint' in paint and paint['first_paint']['median_ms'] > args.max_first_paint_ms:
+        failures.append(f"premier affichage {paint['first_paint']['median_ms']} ms > {args.max_first_paint_ms} ms")
+
+    if args.json:
+        print(json.dumps({**result, 'first_paint': paint, 'importtime': imports, 'failures': failures}, indent=2))
+    else:
+        for name, stats in result.items():
+            print(f"{name:<16} médiane {stats['median_ms']:7.1f} ms  (min {stats['min_ms']:.1f}, max {stats['max_ms']:.1f})")
+        if 'error' in paint:
+            print(f"{'first_paint':<16} non mesuré : {paint['error']}")
+        else:
+            for name in ('imports', 'first_paint'):
+                stats = paint[name]
+                print(f"{'gui_' + name:<16} médiane {stats['median_ms']:7.1f} ms  (min {stats['min_ms']:.1f}, max {stats['max_ms']:.1f})")
+        print("\nImports les plus coûteux (cumulé) :")
+        for item in imports['top']:
+            print(f"  {item['cumulative_ms']:7.1f} ms  {item['module']}")
+        for failure in failures:
+            print(f"RÉGRESSION : {failure}", file=sys.stderr)
+    return 1 if args.check and failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())